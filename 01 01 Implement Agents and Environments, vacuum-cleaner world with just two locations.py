@@ -97,12 +97,13 @@ class Agent:
                 print(" to", self.location)
                                     
 
-# Running the simulation
-environment = Environment()
-agent = Agent(environment)
-
-print(line, "\n Vacuum cleaner starts")
-agent.run()
+if __name__ == "__main__":
+    # Running the simulation
+    environment = Environment()
+    agent = Agent(environment)
+    
+    print(line, "\n Vacuum cleaner starts")
+    agent.run()
 
 
 """
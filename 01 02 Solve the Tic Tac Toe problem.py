@@ -95,6 +95,8 @@ def check_draw():                              # Check if the game is a draw
 def play_game():                            # main game loop for Tic Tac Toe
     current_player = 'X'  # 'X' will be swapped with 'O' (and vice versa) later
     game_over = False
+    
+    board[:] = [' ' for _ in range(9)]     # new game, every cell empty again
 
     while not game_over:
         print_board()
@@ -122,7 +124,8 @@ def play_game():                            # main game loop for Tic Tac Toe
             # swap 'X' with 'O' (and vice versa)
 
 
-play_game()
+if __name__ == "__main__":
+    play_game()
 
 
 """
@@ -81,22 +81,19 @@ Perform Breadth-First Search (BFS) on a graph
         Return, list of nodes in the order they were visited by BFS
 """
 
-from collections import deque
+import search_core                          # search_core.py, same folder
 
 def bfs(graph, start):        # iterative  
-
+    """
+    BFS of search_core, Figure 3.11, queue (deque) of vertices to visit
+        GraphProblem with no goal, every vertex reachable from start is 
+        expanded, a vertex is added to the queue only once, when first seen
+        trace, list every expanded vertex is appended to, in BFS order
+    """
     visited = []                          # List to keep track of visited nodes
-    queue = deque([start])    # Queue for nodes to visit, initialize with start
-
-    while queue:                  # Till queue is not empty
-        node = queue.popleft()         # Dequeue a node
-        if node not in visited:        # If node has not been visited
-        
-            visited.append(node)          #  Then add node to visited list
-            
-            for neighbor in graph[node]:  # For all neighbors of node
-                if neighbor not in visited: # If neighbor has not been visited
-                    queue.append(neighbor)    # Then enqueue unvisited neighbor
+    
+    search_core.breadth_first_search(search_core.GraphProblem(graph, start), 
+                                     trace=visited)
 
     return visited
 
@@ -127,10 +124,11 @@ graph = {'Sankeshwar': ['Hattargi', 'Hukkeri'],
          'Alnavar': ['Dharwad', 'Khanapur'], 
          'Dharwad': ['Alnavar', 'Kittur']}
 
-# Perform BFS starting from node 'Belagavi'
-start = 'Belagavi'
-bfs_result = bfs(graph, start)
-print(f"BFS traversal starting from '{start}': \n{bfs_result}")
+if __name__ == "__main__":
+    # Perform BFS starting from node 'Belagavi'
+    start = 'Belagavi'
+    bfs_result = bfs(graph, start)
+    print(f"BFS traversal starting from '{start}': \n{bfs_result}")
 
 
 """
@@ -114,210 +114,1324 @@ Step 1:
 """
 """
     For simplicity, blank space represented as 0 on board
+
+    Board states, moves of blank space and parent links are of the shared 
+        search core (search_core.py, in this folder), same as DFS and A*
+    
+    search_core.NPuzzleProblem(initial_board, goal_board) , n-Puzzle problem
+        successors(board) , list of (move_name, new_board), numeric tiles 
+            that can slide into blank space, in the order up, down, left, 
+            right, from moves_table built once per goal board
+        solvable() , inversion parity, checked before any search
+        path(node) , list of (board, move, g_cost, h_cost) from start state
+    
+    search_core.Node(state, parent, action) , one node of the search tree, 
+        parent link to the board state it was reached from, and the move
+    
+    search_core.breadth_first_search(problem) , BFS of Figure 3.11
 """
+import search_core                          # search_core.py, same folder
 
-class PuzzleState:
+"""
+    Packed board, alternative state representation
     
-    def __init__(self, board, parent=None, move=None):
-        self.board = board                # Tuple representing the n x n board
-        self.parent = parent
-        self.move = move
-    """        
-        __init__(self, board, parent=None, move=None)
-        default values are assigned when values not passed in as arguments
+    board tuple, (7, 2, 4, 5, 0, 6, 8, 3, 1) packed into a single int, 
+        4 bits (one hex digit) per tile, tile at index i in bits 4*i to 4*i+3
         
-        Examples:
-            PuzzleState(initial_board)
-            that is
-            PuzzleState(self, board = initial_board)
-                self, is the invoking object
-                board = initial_board
-                parent = None , initial_board has no earlier state
-                move = None , no moves made to get to initial_board state
+            index     8 7 6 5 4 3 2 1 0
+            packed = 0x1 3 8 6 0 5 4 2 7 , that is 0x138605427
         
-        For next state(or move) PuzzleState objects
+    4 bits hold tile numbers 0 to 15, enough for 15-Puzzle (4 x 4 board), 
+        16 tiles × 4 bits = 64 bits
+    A small int is hashed and saved in explored_set at a fraction of the 
+        memory of a 9 (or 16) element tuple
         
-            PuzzleState(tuple(new_board), self, move_name)
-            that is
-            PuzzleState(self", board = tuple(new_board), parent = self', 
-                        move = move_name)
-                
-                self" and self', both objects of PuzzleState
-                
-                self" (child) is the next state (or move) of self' (parent)
-                
-                self", is the invoking object
-                board = tuple(new_board)
-                parent = self', self' set as parent of self"
-                                                       self".parent = self'
-                move = move_name , is one of "up", "down", "right", or "left"
+    Blank space is 0, all 4 bits clear, so sliding numeric tile at 
+        numeric_tile_idx into blank space at blank_space_idx is two xor:
+            tile = (packed >> 4*numeric_tile_idx) & 0xF
+            new packed = packed ^ (tile << 4*numeric_tile_idx) 
+                                ^ (tile << 4*blank_space_idx)
+        no list(board) copy, no tuple(new_board)
+    
+    NPuzzleProblem(initial_board, goal_board, packed=True) , board states 
+        as packed int, index of blank space in bits above the tiles
+"""
+def pack_board(board):
+    packed = 0
+    for idx, tile in enumerate(board):
+        packed |= tile << (4 * idx)             # tile in bits 4*idx to 4*idx+3
+    return packed
+
+def unpack_board(packed, board_size):
+    return tuple((packed >> (4 * idx)) & 0xF for idx in range(board_size))
+
+
+def render_solution_path(solution, number_explored, width=None):
+    """
+    Return text of solution, list of (board, move) from start state to goal 
+        state, number_explored, number of board states explored
+        width, number of columns, None for n of n x n board
+    Lines are collected in a list and joined, one string, no print
+    """
+    size = len(solution[0][0])
+    n = width or math.isqrt(size)                   # columns, of this board
+    
+    lines = ["\n Solution found", 
+             f"\n Number of states explored by BFS = {number_explored}", 
+             f"\n Number of steps in solution: {len(solution)}", 
+             "\n Moves with respect to blank space, 0 ", 
+             "\n Start state, move = None "]
+    
+    for step_number, (board, move) in enumerate(solution):
+                        
+        lines.append("-"*32 + f" \n Step: {step_number} , Move: {move}\n " + 
+                     "-"*4*n)
+        
+        for i in range(0, size, n):
+            lines.append("".join(f"| {board[j]} " for j in range(i, i+n)) + 
+                         "|\n " + "-"*4*n)
+    
+    return "\n".join(lines) + "\n"
+
+def print_solution_path(solution, number_explored, width=None):
+    """
+    Print solution, list of (board, move) from start state to goal state
+        number_explored, number of board states explored to find solution
+    One write to stdout, instead of one print per tile
     """
+    sys.stdout.write(render_solution_path(solution, number_explored, width))
 
-    def get_blank_space_position(self):        
-        return self.board.index(0)                     # Index of blank space
+
+class SolverResult(search_core.SolverResult):
+    """
+    SolverResult of search_core, returned by solvers, path of (board, move) 
+        from start state to goal state, rendered by render_solution_path
+        width, number of columns of board, None for n of n x n board
+    """
+    def __init__(self, path, nodes_expanded, peak_frontier, elapsed_time, 
+                 width=None):
+        super().__init__(path, nodes_expanded, peak_frontier, elapsed_time)
+        self.width = width
+    
+    def render_path(self):
+        return render_solution_path(self.path, self.nodes_expanded, 
+                                    self.width)
+
+
+from collections import deque
+from functools import partial
+import sys
+import time
+from search_stats import SearchStats              # search_stats.py, same folder
+
+def bfs_solve_n_puzzle(initial_board, packed=False, quiet=False, stats=None, 
+                       goal=None, width=None):
+    """
+    packed, if True board states saved as packed int
+    quiet, if True nothing is printed
+    stats, SearchStats, filled with counters, time and memory of search
+    goal, goal board, None for goal_board (3 x 3), initial_board of same size
+    width, number of columns, None for n of n x n goal board
+    Return SolverResult
+    """
+    if goal is None:
+        goal = goal_board
+    width = width or math.isqrt(len(goal))
+    
+    if stats is None:
+        stats = SearchStats("BFS", trace_memory=False)      # not returned
+    
+    if not quiet:
+        print(f"\n Number of states in {len(goal) - 1}-Puzzle problem =", 
+              f"{len(goal)}! = ", math.factorial(len(goal)))
+    
+    solvable, reason = search_core.is_solvable(initial_board, goal, width)
+    if not solvable:                    # no search, reject board right away
+        if not quiet:
+            print("\n No solution,", reason)
+        return SolverResult(None, 0, 0, 0.0, width)
     
-    def slide_numeric_tile_into_blank_space(self, board, index1, index2):
-        """
-        Swap values in list at specified indices
-        Slide/Swap neighbor numeric tile with blank blank space in board 
+    with stats.phase("search"):
+        result = bfs_search_states(initial_board, packed, stats, goal, width)
+    
+    if result.path is not None and not quiet:
+        with stats.phase("print"):
+            print_solution_path(result.path, result.nodes_expanded, width)
+    
+    return result
+
+def bfs_search_states(initial_board, packed, stats, goal, width):
+    """
+    BFS of search_core, for bfs_solve_n_puzzle, no print
+        goal test when a board is generated, as Figure 3.11, boards reached 
+        are not queued again
+    Return SolverResult, nodes_expanded, number of board states explored
+    """
+    problem = search_core.NPuzzleProblem(initial_board, goal, width=width, 
+                                         packed=packed)
+    result = search_core.breadth_first_search(problem, stats=stats)
+    
+    path = None                                          # not reachable
+    if result.node is not None:
+        path = [(board, move) 
+                for board, move, _, _ in problem.path(result.node)]
+    
+    return SolverResult(path, result.nodes_expanded, result.peak_frontier, 
+                        result.elapsed_time, width)
+                
+    """ bfs_search_states def ends """
+
+
+"""
+    BFS search engine, works directly on board tuples, no Node objects
 
-            board passed here is a list, and not a tuple
+Russell Stuart J, and Peter Norvig, Artificial Intelligence: A Modern Approach, 
+Pearson Education
+    Figure 3.11, Breadth-first search on a graph (see Demonstrate the working 
+        of BFS.py)
+        
+        frontier ← a FIFO queue
+            deque, popleft() is O(1), where as list pop(0) is O(n)
+        
+        if child.STATE is not in explored or frontier
+            one dict, reached, holds every board ever added to the frontier,
+            that is frontier + explored, so duplicates are never enqueued
+        
+        if problem.GOAL-TEST(child.STATE) then return SOLUTION(child)
+            goal test when child is generated, one layer earlier than on pop
+
+    reached[board] = move , the move that produced board from its parent board
+        instead of one Node(board, parent, move) object per node, 
+        only the (shared) move string is saved per board, parent board is 
+        recovered by sliding blank space back, in the opposite direction
+"""
+#                  move,   r,  c
+blank_space_moves = (("up", -1, 0), ("down", +1, 0), 
+                     ("left", 0, -1), ("right", 0, +1))
+
+opposite_move = {"up": "down", "down": "up", "left": "right", "right": "left"}
+
+def slide_blank_space(board, move_name, width):
+    """
+    Return new board (tuple) after blank space moves in direction move_name
+        on board with width columns, None if the move leaves the board
+    """
+    for name, dr, dc in blank_space_moves:
+        if name == move_name:
+            break
+        
+    blank_space_idx = board.index(0)
+    blank_space_row, blank_space_column = divmod(blank_space_idx, width)
+    new_row = blank_space_row + dr
+    new_col = blank_space_column + dc
+    
+    if not (0 <= new_row < len(board) // width and 0 <= new_col < width):
+        return None
+    
+    new_board = list(board)                    # new_board, a list not a tuple
+    numeric_tile_idx = new_row * width + new_col
+    new_board[blank_space_idx] = new_board[numeric_tile_idx]
+    new_board[numeric_tile_idx] = 0
+    
+    return tuple(new_board)
+
+def get_neighbor_boards(board, width):
+    """
+    Yield (new_board, move_name) for every numeric tile that can slide into
+        blank space, in the same order as get_possible_moves_into_blank_space
+    board can be rows x width, rows need not be equal to width (3x4 board)
+    """
+    rows = len(board) // width
+    blank_space_idx = board.index(0)
+    blank_space_row, blank_space_column = divmod(blank_space_idx, width)
+    
+    for move_name, dr, dc in blank_space_moves:
+        new_row = blank_space_row + dr
+        new_col = blank_space_column + dc
+        
+        if 0 <= new_row < rows and 0 <= new_col < width:
             
-                        (position of the: )
-            index1, first element to be swapped
-            index2, second element to be swapped
+            new_board = list(board)
+            numeric_tile_idx = new_row * width + new_col
+            new_board[blank_space_idx] = new_board[numeric_tile_idx]
+            new_board[numeric_tile_idx] = 0
             
-            a, b = b, a
-        """
-        board[index1], board[index2] = board[index2], board[index1]
-        
-        
-    def get_possible_moves_into_blank_space(self):
-        """
-        Finds neighbors of blank space (at most four neighbors)
-        Return list of new states (new PuzzleState objects) where 
-            new state is numeric tile moving from neighbor into blank space loc
-        """    
-        new_states = []
-        blank_space_idx = self.get_blank_space_position()  # blank space index
-        blank_space_row, blank_space_column = divmod(blank_space_idx, n) 
-                  # row and column of blank space
-        """
-        Neighbors of, with respect to blank space location could be:
-            up: row -1 , down: row +1 , no change in (same) column: 0
-            no change in (same) row: 0, left: column -1 , right: column +1
-        """
-        #                  r, c              r, c
-        moves = {  "up": (-1, 0),  "down": (+1, 0), 
-                 "left": (0, -1), "right": (0, +1)}        
-
-        for move_name, (dr, dc) in moves.items(): 
-                                                # for all neighbors (or moves)
-            new_row = blank_space_row + dr      # add dr, change in row
-            new_col = blank_space_column + dc   # add dc, change in column
+            yield tuple(new_board), move_name
+
+def path_from_reached(board, reached, width):
+    """
+    Walk back from board to start state (move None) using reached map
+    Return list of (board, move) from start state to board
+    """
+    solution = []
+    move = reached[board]
+    
+    while move is not None:
+        solution.append((board, move))
+        board = slide_blank_space(board, opposite_move[move], width) # parent
+        move = reached[board]
+        
+    solution.append((board, None))                   # start state, move None
+    
+    return solution[::-1]        # reverse list , now from start to goal state
+
+def bfs_search(initial_board, goal_board, width=None):
+    """
+    Breadth-first search from initial_board to goal_board
+        width, number of columns, default n of n x n board
+    Return (solution, number of states explored)
+        solution, list of (board, move) from start state to goal state, or 
+        None if goal_board can not be reached from initial_board
+    """
+    if width is None:
+        width = int(math.sqrt(len(initial_board)))
+    
+    reached = {initial_board: None}      # board: move , frontier + explored
+    
+    if initial_board == goal_board:
+        return path_from_reached(goal_board, reached, width), 0
+    
+    frontier = deque([initial_board])                     # FIFO queue
+    number_explored = 0
+    
+    while frontier:                                 # while queue is not empty
+        
+        board = frontier.popleft()           # dequeue , remove from the front
+        number_explored += 1
+        
+        for neighbor_board, move_name in get_neighbor_boards(board, width):
             
-            """
-            if both new row and column index are in n × n board, 
-                then
-                    create a copy of board, new board, so that
-                    neighbor and blank space can be swapped in new board, and
-                    a new PuzzleState object with new board can be created 
-                    append new PuzzleState to list of possible new_states
-            """
-            if 0 <= new_row < n and 0 <= new_col < n:
-                
-                new_board = list(self.board)   # new_board, a list not a tuple
+            if neighbor_board not in reached:  # not in frontier or explored
                 
-                # Numeric tile index, and after slide where blank space appears
-                numeric_tile_idx = new_row * n + new_col
+                reached[neighbor_board] = move_name
                 
-                self.slide_numeric_tile_into_blank_space(new_board, 
-                                                         blank_space_idx, 
-                                                         numeric_tile_idx)
+                if neighbor_board == goal_board:      # goal test on generation
+                    return (path_from_reached(neighbor_board, reached, width),
+                            number_explored)
                 
-                """    Create new PuzzleState
-                                  PuzzleState(tuple(new_board), 
-                                              self, 
-                                              move_name)
-                       and append to list"""
-                new_states.append(PuzzleState(board=tuple(new_board), 
-                                              parent=self, 
-                                              move=move_name))
+                frontier.append(neighbor_board)
                 
-        return new_states        
+    return None, number_explored                # goal_board is not reachable
+
+def solve_with_search(search, initial_board, quiet=False, goal=None, 
+                      width=None, stats=None):
+    """
+    search, bfs_search or another search with the same arguments and return
+    quiet, if True nothing is printed
+    goal, goal board, None for goal_board (3 x 3), initial_board of same size
+    width, number of columns, None for n of n x n goal board
+    stats, SearchStats, nodes_expanded and time of search added
+    Return SolverResult, peak_frontier None , not tracked by search engines
+    """
+    if goal is None:
+        goal = goal_board
+    width = width or math.isqrt(len(goal))
+    
+    if stats is None:
+        stats = SearchStats("BFS", trace_memory=False)      # not returned
+    
+    solvable, reason = search_core.is_solvable(initial_board, goal, width)
+    if not solvable:                    # no search, reject board right away
+        if not quiet:
+            print("\n No solution,", reason)
+        return SolverResult(None, 0, None, 0.0, width)
+    
+    start_time = time.perf_counter()
+    with stats.phase("search"):
+        solution, number_explored = search(initial_board, goal, width)
+    stats.nodes_expanded += number_explored
+    result = SolverResult(solution, number_explored, None, 
+                          time.perf_counter() - start_time, width)
+    
+    if quiet:
+        pass
+    elif solution is None:
+        print("\n No solution, number of states explored by BFS =", 
+              number_explored)
+    else:
+        print_solution_path(solution, number_explored, width)
+    
+    return result
 
-def print_solution(current_state, explored_set):
+def bfs_search_solve_n_puzzle(initial_board, quiet=False, goal=None, 
+                              width=None, stats=None):
     
-    print("\n Solution found")    
+    return solve_with_search(bfs_search, initial_board, quiet, goal, width, 
+                             stats)
+
+
+"""
+    Perfect hash, rank of board permutation, for 8-Puzzle (and smaller)
     
-    print("\n Number of states explored by BFS =", len(explored_set))
+    9 tiles (0 for blank space) can be placed in 9! = 362880 ways, each 
+        board is one permutation of (0, 1, 2, 3, 4, 5, 6, 7, 8)
+    Every permutation gets a unique rank, 0 to 9! - 1 , no collisions
+    
+    Lehmer code, factorial number system
+        for tile at index i, count tiles after index i that are smaller, 
+            smaller_after(i), is a digit 0 to (size - 1 - i), 
+            with place value (size - 1 - i)!
+        
+        rank = sum over i of smaller_after(i) × (size - 1 - i)!
+        
+        board (0, 1, 2, 3, 4, 5, 6, 7, 8) , all digits 0 , rank 0
+        board (8, 7, 6, 5, 4, 3, 2, 1, 0) , rank 8×8! + 7×7! + ... = 9! - 1
+        
+    unrank, reverse, digit = rank // (size - 1 - i)! , picks digit-th 
+        smallest of the tiles not yet placed
     
+    Incremental rank, rank_board is O(size²) , one rank per neighbor made 
+        BFS about 5 times slower than bfs_search , so rank of a neighbor 
+        is found from rank and digits of its board (digits from unrank)
+        a slide swaps blank space (0) and a tile at indices lo < hi, only 
+            digits of lo to hi change, x at lo and y at hi before slide
+            digit(lo) = old digit(hi) + (x < y) + tiles between below y
+            digit(hi) = old digit(lo) - (y < x) - tiles between below x
+            digit(k) , lo < k < hi , + 1 if x < tile , - 1 if y < tile
+        one step for left, right , width steps for up, down , O(width)
+        no neighbor board is made, goal test compares ranks
+    Still about 2 times slower than bfs_search (unrank and digits of every 
+        board), the price of 9!/8 + 9! bytes instead of a dict of tuples
+        
+    With rank as index:
+        explored_bits , bitmap, one bit per board, 9!/8 = 45360 bytes
+            (frontier + explored, board reached if its bit is set)
+        parent_moves , bytearray, one byte per board, 9! = 362880 bytes
+            move code 1 to 4 that produced the board, 0 for start state
+        layers, array of 4 byte unsigned int ranks , not board tuples
+"""
+from array import array
+
+factorials = [math.factorial(i) for i in range(17)]          # 0! to 16!
+
+move_names = (None, "up", "down", "left", "right")   # move code 0 to 4
+move_codes = {name: code for code, name in enumerate(move_names)}
+
+def rank_board(board):
+    size = len(board)
+    rank = 0
+    for i in range(size - 1):
+        smaller_after = 0
+        for j in range(i + 1, size):
+            if board[j] < board[i]:
+                smaller_after += 1
+        rank += smaller_after * factorials[size - 1 - i]
+    return rank
+
+def unrank_board(rank, size):
+    return tuple(unrank_board_digits(rank, size)[0])
+
+def unrank_board_digits(rank, size):
+    """ Return (board, digits) of rank , board and digits as lists """
+    tiles = list(range(size))                    # tiles not yet placed
+    board = []
+    digits = []
+    for i in range(size):
+        digit, rank = divmod(rank, factorials[size - 1 - i])
+        digits.append(digit)
+        board.append(tiles.pop(digit))          # digit-th smallest tile left
+    return board, digits
+
+def neighbor_rank(rank, board, digits, blank_space_idx, numeric_tile_idx):
+    """
+    Return rank of board after tile at numeric_tile_idx slides into blank 
+        space , from rank and digits of board , incremental rank
+    """
+    size = len(board)
+    lo, hi = sorted((blank_space_idx, numeric_tile_idx))
+    x, y = board[lo], board[hi]                  # one of them is blank space
+    
+    lo_digit = digits[hi] + (x < y)                  # y moves to lo
+    hi_digit = digits[lo] - (y < x)                  # x moves to hi
+    
+    for k in range(lo + 1, hi):                      # tiles between
+        tile = board[k]
+        if tile < y:
+            lo_digit += 1
+        if tile < x:
+            hi_digit -= 1
+        rank += ((x < tile) - (y < tile)) * factorials[size - 1 - k]
+    
+    return (rank + (lo_digit - digits[lo]) * factorials[size - 1 - lo] 
+                 + (hi_digit - digits[hi]) * factorials[size - 1 - hi])
+
+def path_from_parent_moves(board, parent_moves, width):
+    """
+    Walk back from board to start state (move code 0) using parent_moves
+    Return list of (board, move) from start state to board
+    """
     solution = []
+    move = move_names[parent_moves[rank_board(board)]]
+    
+    while move is not None:
+        solution.append((board, move))
+        board = slide_blank_space(board, opposite_move[move], width) # parent
+        move = move_names[parent_moves[rank_board(board)]]
+        
+    solution.append((board, None))                   # start state, move None
+    
+    return solution[::-1]        # reverse list , now from start to goal state
+
+def bfs_search_ranked(initial_board, goal_board, width=None):
+    """
+    Breadth-first search, same as bfs_search, with board rank as perfect 
+        hash, explored_bits bitmap and parent_moves bytearray, neighbor 
+        ranks by neighbor_rank
+    Return (solution, number of states explored), solution None if 
+        goal_board can not be reached from initial_board
     """
-    Empty list to save (state, move) for all moves(states) in the sequence 
-        they are encountered from goal state back to start state, 
-        bottom up traversal
+    size = len(initial_board)
+    if width is None:
+        width = int(math.sqrt(size))
+    
+    explored_bits = bytearray((factorials[size] + 7) // 8)  # all bits clear
+    parent_moves = bytearray(factorials[size])             # all move codes 0
+    
+    start_rank = rank_board(initial_board)
+    explored_bits[start_rank >> 3] |= 1 << (start_rank & 7)     # set bit
+    
+    if initial_board == goal_board:
+        return [(initial_board, None)], 0
+    
+    goal_rank = rank_board(goal_board)
+    moves_table = search_core.build_moves_table(width, size // width)
+    
+    current_layer = array("I", [start_rank])       # FIFO, one layer at a time
+    number_explored = 0
+    
+    while current_layer:                            # while queue is not empty
+        
+        next_layer = array("I")
+        
+        for rank in current_layer:
+            
+            board, digits = unrank_board_digits(rank, size)
+            blank_space_idx = board.index(0)
+            number_explored += 1
+            
+            for move_name, numeric_tile_idx in moves_table[blank_space_idx]:
+                
+                next_rank = neighbor_rank(rank, board, digits, 
+                                          blank_space_idx, numeric_tile_idx)
+                byte_idx, bit = next_rank >> 3, 1 << (next_rank & 7)
+                
+                if not explored_bits[byte_idx] & bit:  # not frontier/explored
+                    
+                    explored_bits[byte_idx] |= bit
+                    parent_moves[next_rank] = move_codes[move_name]
+                    
+                    if next_rank == goal_rank:        # goal test on generation
+                        return (path_from_parent_moves(goal_board, 
+                                                       parent_moves, width), 
+                                number_explored)
+                    
+                    next_layer.append(next_rank)
+                    
+        current_layer = next_layer
+                
+    return None, number_explored                # goal_board is not reachable
+
+def bfs_ranked_solve_n_puzzle(initial_board, quiet=False, goal=None, 
+                              width=None, stats=None):
     
-    while current_state is not None, 
-        that is traversal from child to root nood is not complete
-        till initial_board parent = None is not reached
+    size = len(initial_board)
+    if not quiet:
+        print(f"\n Explored bitmap = {(factorials[size] + 7) // 8}",
+              f"bytes, parent moves = {factorials[size]} bytes")
+    
+    return solve_with_search(bfs_search_ranked, initial_board, quiet, goal, 
+                             width, stats)
+
+"""
+    Bidirectional BFS
+
+Russell Stuart J, and Peter Norvig, Artificial Intelligence: A Modern Approach, 
+Pearson Education
+    3.4.6 Bidirectional search
+        run two simultaneous searches, one forward from the initial state and 
+        the other backward from the goal, hoping that the two searches meet 
+        in the middle
+        b^(d/2) + b^(d/2) is much less than b^d
+        
+    Every move is reversible (slide blank space back, opposite move), so 
+        backward search from goal_board uses the same get_neighbor_boards
+    
+    One whole layer (all boards at one depth) is expanded at a time, from the 
+        side with the smaller frontier, goal test is, neighbor board is in 
+        reached of the other side
+    All meeting boards of a layer are compared, shortest forward + backward 
+        path is kept, a board met first need not be on a shortest path
+    
+    Solution is spliced at meeting board,
+        forward path, from path_from_reached(meeting board, forward reached)
+        backward path, path_from_reached(meeting board, backward reached) 
+            goes from goal_board to meeting board, reversed, and every move 
+            replaced by its opposite move
+"""
+def splice_paths(meeting_board, forward_reached, backward_reached, width):
     """
-    while current_state: 
-        solution.append((current_state.board, current_state.move))
-        current_state = current_state.parent 
-        """
-        reassign current_state to parent of current state
-            from state(or move) at t + 1 to state(or move) at t
-        moving back/up the solution tree one step
-        """
+    Return list of (board, move) from start state, through meeting_board, 
+        to goal state
     """
-    Path(result) of traversal saved as list from goal to initial        
-    list[::-1] , ::-1 , gives list in reverse order
-    """ 
-    solution = solution[::-1]        # reverse list , now from start to goal state
+    solution = path_from_reached(meeting_board, forward_reached, width)
+    backward_path = path_from_reached(meeting_board, backward_reached, width)
+    
+    # backward_path[i] , (board, move from backward_path[i - 1] to board)
+    for i in range(len(backward_path) - 1, 0, -1):
+        board = backward_path[i - 1][0]                    # one step to goal
+        solution.append((board, opposite_move[backward_path[i][1]]))
+    
+    return solution
 
-    print("\n Number of steps in solution:", len(solution))
-    print("\n Moves with respect to blank space, 0 ")
-    print("\n Start state, move = None ")
+def bidirectional_bfs_search(initial_board, goal_board, width=None):
+    """
+    Bidirectional breadth-first search from initial_board and goal_board
+        width, number of columns, default n of n x n board
+    Return (solution, number of states explored), as bfs_search
+    """
+    if width is None:
+        width = int(math.sqrt(len(initial_board)))
     
-    for step_number, (board, move) in enumerate(solution):
-                        
-        print("-"*32, f"\n Step: {step_number} , Move: {move}\n", "-"*4*n)
+    forward_reached = {initial_board: None}           # board: move
+    backward_reached = {goal_board: None}             # board: move
+    
+    if initial_board == goal_board:
+        return path_from_reached(goal_board, forward_reached, width), 0
+    
+    forward_frontier = [initial_board]               # one layer , one depth
+    backward_frontier = [goal_board]
+    number_explored = 0
+    
+    while forward_frontier and backward_frontier:
+        
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, reached = forward_frontier, forward_reached
+            other_reached = backward_reached
+        else:
+            frontier, reached = backward_frontier, backward_reached
+            other_reached = forward_reached
+        
+        next_frontier = []
+        meeting_boards = []
         
-        for i in range(0, board_size, n):
-            for j in range(i, i+n):
-                print("|", board[j], end=" ")
+        for board in frontier:                         # expand whole layer
+            number_explored += 1
+            
+            for neighbor_board, move_name in get_neighbor_boards(board, width):
                 
-            print("|\n", "-"*4*n)
+                if neighbor_board not in reached:
+                    
+                    reached[neighbor_board] = move_name
+                    next_frontier.append(neighbor_board)
+                    
+                    if neighbor_board in other_reached:    # searches meet
+                        meeting_boards.append(neighbor_board)
+        
+        if meeting_boards:
+            return (min((splice_paths(board, forward_reached, 
+                                      backward_reached, width)
+                         for board in meeting_boards), key=len), 
+                    number_explored)
+        
+        if frontier is forward_frontier:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+    
+    return None, number_explored                # goal_board is not reachable
+
+def bidirectional_bfs_solve_n_puzzle(initial_board, quiet=False, goal=None, 
+                                     width=None, stats=None):
+    
+    return solve_with_search(bidirectional_bfs_search, initial_board, quiet, 
+                             goal, width, stats)
+
+
+"""
+    Layered BFS, frontier search, no parent pointers
+    
+    BFS saves every generated board (Node with parent, or reached 
+        map), memory grows with the whole search tree, 9!/2 boards for 8-Puzzle
+    Layered BFS saves only boards of previous, current and next depth, 
+        memory bounded by the widest layer(s)
+    
+    Layer, set of packed boards, 4 bits per tile as pack_board, and blank 
+        space index in bits above the tiles, no search for 0
+    
+    next layer = neighbors of current layer - previous layer
+        every move moves blank space to a square of the other colour (as on a 
+        chess board), so board at depth d has neighbors only at depth d - 1 
+        and d + 1 , neighbors in current layer are not possible
+    
+    Without parent pointers, path is rebuilt by divide and conquer
+        search forward from start, till goal board is in layer, distance d
+        middle board, in layer d//2 from start and in layer d - d//2 from goal
+            it is on a shortest path
+        path(start, goal) = path(start, middle) + path(middle, goal)
+        each half is solved the same way, till distance 0 or 1
+    Total time is about log2(d) times that of one search, memory stays at 
+        that of one search
+"""
+def pack_layer_board(board):
+    """ Packed board, blank space index in bits 4 × len(board) and up """
+    return pack_board(board) | (board.index(0) << (4 * len(board)))
+
+def unpack_layer_board(packed, size):
+    return unpack_board(packed, size)              # blank space bits ignored
+
+def layer_neighbor_indices(size, width):
+    """
+    Return list, for every blank space index, of numeric tile indices 
+        that can slide into blank space, in order up, down, left, right
+    """
+    rows = size // width
+    neighbor_indices = []
+    for blank_space_idx in range(size):
+        blank_space_row, blank_space_column = divmod(blank_space_idx, width)
+        neighbor_indices.append([
+            (blank_space_row + dr) * width + blank_space_column + dc 
+            for _, dr, dc in blank_space_moves 
+            if 0 <= blank_space_row + dr < rows and 
+               0 <= blank_space_column + dc < width])
+    return neighbor_indices
+
+def layer_search(start, size, neighbor_indices, goal=None, depth=None):
+    """
+    Layered BFS from packed board start
+        goal, stop when goal (packed) is in current layer
+        depth, stop at this depth
+    Return (depth, layer, number_explored, widest layer size), 
+        depth None if goal not reached
+    """
+    blank_shift = 4 * size
+    tile_mask = (1 << blank_shift) - 1
+    
+    previous_layer = set()
+    layer = {start}
+    layer_depth = 0
+    number_explored = 0
+    widest_layer = 1
+    
+    while layer:
+        
+        if goal in layer or layer_depth == depth:
+            return layer_depth, layer, number_explored, widest_layer
+        
+        next_layer = set()
+        
+        for packed in layer:
+            number_explored += 1
+            
+            blank_space_idx = packed >> blank_shift
+            board = packed & tile_mask
             
+            for numeric_tile_idx in neighbor_indices[blank_space_idx]:
+                
+                tile = (board >> (4 * numeric_tile_idx)) & 0xF
+                new_board = (board ^ (tile << (4 * numeric_tile_idx)) 
+                                   ^ (tile << (4 * blank_space_idx)))
+                
+                next_layer.add(new_board | (numeric_tile_idx << blank_shift))
+        
+        next_layer -= previous_layer
+        
+        previous_layer, layer = layer, next_layer
+        layer_depth += 1
+        widest_layer = max(widest_layer, len(layer))
+    
+    return None, layer, number_explored, widest_layer   # goal not reachable
+
+def layered_path(start, goal, distance, size, neighbor_indices):
+    """
+    Return list of packed boards from start to goal, distance moves apart, 
+        by divide and conquer on middle board
+    """
+    if distance == 0:
+        return [start]
+    if distance == 1:
+        return [start, goal]
+    
+    half = distance // 2
+    _, forward_layer, _, _ = layer_search(start, size, neighbor_indices, 
+                                          depth=half)
+    _, backward_layer, _, _ = layer_search(goal, size, neighbor_indices, 
+                                           depth=distance - half)
+    
+    middle = min(forward_layer & backward_layer)  # any one, min is repeatable
+    
+    return (layered_path(start, middle, half, size, neighbor_indices) + 
+            layered_path(middle, goal, distance - half, size, 
+                         neighbor_indices)[1:])
+
+def layered_bfs_search(initial_board, goal_board, width=None, stats=None):
+    """
+    Layered breadth-first search from initial_board to goal_board
+        width, number of columns, default n of n x n board
+        stats, SearchStats, counter widest_layer set, if given
+    Return (solution, number of states explored), as bfs_search
+        number explored counts only first search, not the path rebuild
+    """
+    if width is None:
+        width = int(math.sqrt(len(initial_board)))
+    
+    size = len(initial_board)
+    neighbor_indices = layer_neighbor_indices(size, width)
+    
+    start = pack_layer_board(initial_board)
+    goal = pack_layer_board(goal_board)
+    
+    distance, _, number_explored, widest_layer = layer_search(
+        start, size, neighbor_indices, goal=goal)
+    
+    if stats is not None:
+        stats.counters["widest_layer"] = widest_layer   # boards, for print
+    
+    if distance is None:
+        return None, number_explored            # goal_board is not reachable
+    
+    boards = [unpack_layer_board(packed, size) for packed in 
+              layered_path(start, goal, distance, size, neighbor_indices)]
+    
+    return solution_from_boards(boards, width), number_explored
+
+def solution_from_boards(boards, width):
+    """
+    Return list of (board, move) for list of boards, start state to goal
+        move , direction of blank space from one board to the next
+    """
+    move_of_step = {-width: "up", +width: "down", -1: "left", +1: "right"}
+    
+    solution = [(boards[0], None)]
+    for board, next_board in zip(boards, boards[1:]):
+        step = next_board.index(0) - board.index(0)
+        solution.append((next_board, move_of_step[step]))
+    
+    return solution
 
-def bfs_solve_n_puzzle(initial_board):
+def layered_bfs_solve_n_puzzle(initial_board, quiet=False, goal=None, 
+                               width=None, stats=None):
     
-    print(f"\n Number of states in {board_size - 1}-Puzzle problem =", 
-          f"{board_size}! = ", math.factorial(board_size))
+    if stats is None:
+        stats = SearchStats("Layered BFS", trace_memory=False)  # not returned
     
-    initial_state = PuzzleState(initial_board)     # Create PuzzleState object
+    result = solve_with_search(partial(layered_bfs_search, stats=stats), 
+                               initial_board, quiet, goal, width, stats)
     
-    open_list = []                                                 # for queue
-    open_list.append(initial_state)    # enqueue initial_state , append in end
+    if not quiet:
+        print("\n Widest layer =", stats.counters.get("widest_layer", 0), 
+              "boards")
     
-    explored_set = set() # Empty set, save explored board states(visited nodes)
+    return result
+
+
+"""
+    External memory BFS, disk based, delayed duplicate detection
+
+Korf Richard E, Best-First Frontier Search with Delayed Duplicate Detection, 
+AAAI 2004, and Korf Richard E, Linear-Time Disk-Based Implicit Graph Search, 
+Journal of the ACM 2008
     
-    while open_list:                                # while queue is not empty
+    Layered BFS with layers in files, not in memory, states more than RAM
     
-        current_state = open_list.pop(0)     # dequeue , remove from the front
+    Layer file, sorted, duplicate free, packed boards (pack_board, 4 bits per 
+        tile, 8 bytes per board, up to 16 tiles), one file per depth
     
-        # If goal state reached, raise SolutionFound to come out of recursion
-        if current_state.board == goal_board:
+    Expand layer d, read from memory-mapped file, neighbors collected in 
+        memory, chunk_size at a time, each chunk sorted, duplicates dropped, 
+        and written as one run file
+        (duplicates are not looked up while generating, only later when 
+        runs are merged, delayed duplicate detection)
+    Merge runs, heapq.merge streams all run files in sorted order, 
+        a board equal to the one before it is a duplicate, a board in layer 
+        d - 1 (same streaming merge, both sorted) was already reached, 
+        rest written to file of layer d + 1
+    Memory used is chunk_size boards, and one page of each file
+    
+    Path, from goal board in layer d, back to start, a neighbor of board that 
+        is in layer d - 1 is found by binary search in the sorted file
+        
+    All layer files are kept in directory, and stay there after search, 
+        temporary directory (deleted at end) if directory is None
+"""
+from bisect import bisect_left
+from contextlib import contextmanager, ExitStack, nullcontext
+import heapq
+import mmap
+import os
+import tempfile
+
+@contextmanager
+def mapped_layer(path):
+    """
+    Memory-map layer file at path, yield it as sequence of 8 byte unsigned 
+        int (packed boards), empty tuple for an empty file
+    """
+    if os.path.getsize(path) == 0:                  # mmap of empty file fails
+        yield ()
+        return
+    
+    with open(path, "rb") as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        layer = memoryview(mapped).cast("Q")
+        try:
+            yield layer
+        finally:
+            layer.release()                       # before mmap is closed
+
+def packed_blank_space_index(board, size):
+    for idx in range(size):
+        if (board >> (4 * idx)) & 0xF == 0:
+            return idx
+
+def packed_neighbor_boards(board, size, neighbor_indices):
+    """ Yield packed neighbor boards of packed board, no blank space bits """
+    blank_space_idx = packed_blank_space_index(board, size)
+    
+    for numeric_tile_idx in neighbor_indices[blank_space_idx]:
+        tile = (board >> (4 * numeric_tile_idx)) & 0xF
+        yield (board ^ (tile << (4 * numeric_tile_idx)) 
+                     ^ (tile << (4 * blank_space_idx)))
+
+def write_run(boards, path):
+    """ Sort boards, drop duplicates, write as 8 byte unsigned int to path """
+    with open(path, "wb") as file:
+        array("Q", sorted(set(boards))).tofile(file)
+
+def merge_runs(run_paths, previous_path, next_path, goal, chunk_size):
+    """
+    Merge sorted run files into next_path, without duplicates and without 
+        boards of previous layer (previous_path)
+    Return (number of boards written, goal found)
+    """
+    with ExitStack() as stack:
+        
+        runs = [stack.enter_context(mapped_layer(run_path)) 
+                for run_path in run_paths]
+        previous_layer = stack.enter_context(mapped_layer(previous_path))
+        file = stack.enter_context(open(next_path, "wb"))
+        
+        buffer = array("Q")
+        number_written = 0
+        goal_found = False
+        last_board = None
+        previous_idx = 0
+        
+        for board in heapq.merge(*runs):
             
-            print_solution(current_state, explored_set)  # call print solution
-            return                                       # break out from loop
-
-        """
-            If control comes here, then Goal state has not been reached
-            add current_state.board to explored_set , visited node
-            indicating this board state(setting) has been explored(visited)
-        """
-        explored_set.add(current_state.board)  
-
-        """
-        for all possible numeric neighbor tile slide into blank space
-        that is
-        for all possible new PuzzleState with respect to blank space
-        """
-        for neighbor in current_state.get_possible_moves_into_blank_space():
-            """
-            Only if new neighbor board(state) is not in explored_set (visited)
-                Add new neighbor to queue open_list
-            """
-            if neighbor.board not in explored_set:
-
-                open_list.append(neighbor)
+            if board == last_board:                           # duplicate
+                continue
+            last_board = board
+            
+            while (previous_idx < len(previous_layer) and 
+                   previous_layer[previous_idx] < board):
+                previous_idx += 1
+            
+            if (previous_idx < len(previous_layer) and 
+                    previous_layer[previous_idx] == board):  # reached before
+                continue
+            
+            if board == goal:
+                goal_found = True
+            
+            buffer.append(board)
+            if len(buffer) >= chunk_size:
+                buffer.tofile(file)
+                number_written += len(buffer)
+                buffer = array("Q")
+        
+        buffer.tofile(file)
+        number_written += len(buffer)
+    
+    return number_written, goal_found
+
+def disk_bfs(initial_board, width, directory, goal_board=None, 
+             chunk_size=1000000):
+    """
+    Disk based layered BFS from initial_board, layer files in directory
+        goal_board, stop at layer that has goal_board, None to enumerate 
+            every reachable board
+    Return (depth of goal_board or None, layer paths, layer sizes, 
+            number explored)
+    """
+    size = len(initial_board)
+    neighbor_indices = layer_neighbor_indices(size, width)
+    goal = None if goal_board is None else pack_board(goal_board)
+    
+    layer_paths = [os.path.join(directory, "layer_0.bin")]
+    write_run([pack_board(initial_board)], layer_paths[0])
+    layer_sizes = [1]
+    number_explored = 0
+    
+    empty_path = os.path.join(directory, "empty.bin")  # layer before layer 0
+    open(empty_path, "wb").close()
+    
+    if pack_board(initial_board) == goal:
+        return 0, layer_paths, layer_sizes, number_explored
+    
+    while True:
+        
+        depth = len(layer_paths) - 1
+        run_paths = []
+        buffer = []
+        
+        with mapped_layer(layer_paths[depth]) as layer:
+            for board in layer:
+                number_explored += 1
                 
-    """ bfs_solve_n_puzzle def ends """
+                buffer.extend(packed_neighbor_boards(board, size, 
+                                                     neighbor_indices))
+                if len(buffer) >= chunk_size:
+                    run_paths.append(os.path.join(
+                        directory, f"run_{depth + 1}_{len(run_paths)}.bin"))
+                    write_run(buffer, run_paths[-1])
+                    buffer = []
+        
+        if buffer:
+            run_paths.append(os.path.join(
+                directory, f"run_{depth + 1}_{len(run_paths)}.bin"))
+            write_run(buffer, run_paths[-1])
+        
+        next_path = os.path.join(directory, f"layer_{depth + 1}.bin")
+        previous_path = layer_paths[depth - 1] if depth > 0 else empty_path
+        
+        number_written, goal_found = merge_runs(run_paths, previous_path, 
+                                                next_path, goal, chunk_size)
+        for run_path in run_paths:
+            os.remove(run_path)
+        
+        if number_written == 0:                  # every board reached
+            os.remove(next_path)
+            return None, layer_paths, layer_sizes, number_explored
+        
+        layer_paths.append(next_path)
+        layer_sizes.append(number_written)
+        
+        if goal_found:
+            return depth + 1, layer_paths, layer_sizes, number_explored
+
+def disk_path(goal_board, layer_paths, width):
+    """
+    Return list of boards from start state to goal_board, layer by layer 
+        back from goal_board, binary search in each memory-mapped layer file
+    """
+    size = len(goal_board)
+    neighbor_indices = layer_neighbor_indices(size, width)
+    
+    board = pack_board(goal_board)
+    path = [board]
+    
+    for layer_path in reversed(layer_paths[:-1]):
+        with mapped_layer(layer_path) as layer:
+            for neighbor in packed_neighbor_boards(board, size, 
+                                                   neighbor_indices):
+                idx = bisect_left(layer, neighbor)
+                if idx < len(layer) and layer[idx] == neighbor:
+                    board = neighbor
+                    break
+        path.append(board)
+    
+    return [unpack_board(board, size) for board in reversed(path)]
+
+def disk_bfs_search(initial_board, goal_board, width=None, directory=None, 
+                    chunk_size=1000000, stats=None):
+    """
+    Disk based breadth-first search from initial_board to goal_board
+        width, number of columns, default n of n x n board
+        directory, for layer files, made if missing, files are kept, 
+            None for a temporary directory, deleted with its files at end
+        chunk_size, boards in memory before sorted run is written
+        stats, SearchStats, counters layers, largest_layer and disk_bytes 
+            set, if given
+    Return (solution, number of states explored), as bfs_search
+    """
+    if width is None:
+        width = int(math.sqrt(len(initial_board)))
+    
+    if directory is None:
+        layer_directory_context = tempfile.TemporaryDirectory()
+    else:
+        os.makedirs(directory, exist_ok=True)
+        layer_directory_context = nullcontext(directory)  # not deleted
+    
+    with layer_directory_context as layer_directory:
+        
+        depth, layer_paths, layer_sizes, number_explored = disk_bfs(
+            initial_board, width, layer_directory, goal_board, chunk_size)
+        
+        if stats is not None:                            # for print
+            stats.counters["layers"] = len(layer_sizes)
+            stats.counters["largest_layer"] = max(layer_sizes, default=0)
+            stats.counters["disk_bytes"] = 8 * sum(layer_sizes)
+        
+        if depth is None:
+            return None, number_explored        # goal_board is not reachable
+        
+        boards = disk_path(goal_board, layer_paths, width)
+    
+    return solution_from_boards(boards, width), number_explored
+
+def disk_bfs_solve_n_puzzle(initial_board, quiet=False, goal=None, 
+                            width=None, stats=None):
+    
+    if stats is None:
+        stats = SearchStats("Disk BFS", trace_memory=False)     # not returned
+    
+    result = solve_with_search(partial(disk_bfs_search, stats=stats), 
+                               initial_board, quiet, goal, width, stats)
+    
+    if not quiet:
+        print("\n Layers =", stats.counters.get("layers", 0), 
+              ", largest layer =", stats.counters.get("largest_layer", 0), 
+              "boards ,", stats.counters.get("disk_bytes", 0), 
+              "bytes on disk")
+    
+    return result
+
+
+
+"""
+    Vectorized BFS, NumPy, a whole layer expanded at once
+    
+    A Python loop expands about 10^5 boards per second, NumPy makes the 
+        same slide for all boards of a layer in a few C loops
+    
+    Layer, 1-D NumPy array of packed boards (pack_board, uint64, 4 bits 
+        per tile, up to 16 tiles), sorted, no duplicates
+    Expand layer
+        blank space index of every board, the nibble equal to 0 , one 
+            vectorized compare per board index
+        for every blank space index b, boards with blank space at b , 
+            for every numeric tile index t next to b , slide tile at t 
+            into b in all of them at once, two xor, as packed board slide
+                tile = (boards >> 4t) & 0xF
+                new boards = boards ^ (tile << 4t) ^ (tile << 4b)
+        np.unique , sorts next layer and drops duplicates
+        boards of previous layer dropped, np.searchsorted on sorted 
+            previous layer, binary search of all boards at once
+        (each slide moves blank space one row or column, parity of blank 
+            space index changes (rows + columns), neighbors of layer d are 
+            only in layer d - 1 or d + 1 , layer d itself is not checked)
+    
+    Enumerate, goal None, only previous and current layers kept, layer 
+        sizes returned, 8-Puzzle (181440 boards) in about 0.1 s , 
+        2 × 5 board (1814400 boards) in about 2 s , 3 × 4 board 
+        (12!/2 = 239500800 boards) needs a few GB and many minutes
+    Solve, goal given, all layers kept till goal, path from goal back to 
+        start, neighbor of board in layer d - 1 found by searchsorted
+"""
+try:
+    import numpy as np
+except ImportError:                   # NumPy only needed by numpy_bfs
+    np = None
 
+def numpy_expand_layer(layer, size, neighbor_indices):
+    """
+    Return sorted, duplicate free array of all neighbors of layer boards
+    """
+    shift = [np.uint64(4 * idx) for idx in range(size)]   # bits of index
+    tile_mask = np.uint64(0xF)
+    
+    blank_space = np.empty(len(layer), dtype=np.uint8)
+    for idx in range(size):
+        blank_space[((layer >> shift[idx]) & tile_mask) == 0] = idx
+    
+    next_boards = []
+    for blank_space_idx in range(size):
+        boards = layer[blank_space == blank_space_idx]
+        if not len(boards):
+            continue
+        for numeric_tile_idx in neighbor_indices[blank_space_idx]:
+            tile = (boards >> shift[numeric_tile_idx]) & tile_mask
+            next_boards.append(boards ^ (tile << shift[numeric_tile_idx]) 
+                                      ^ (tile << shift[blank_space_idx]))
+    
+    return np.unique(np.concatenate(next_boards))
+
+def numpy_drop_reached(boards, layer):
+    """ Return boards (sorted) not in layer (sorted) """
+    if not len(layer):
+        return boards
+    idx = np.searchsorted(layer, boards)
+    idx[idx == len(layer)] = 0                   # past the end, not equal
+    return boards[layer[idx] != boards]
+
+def numpy_bfs(initial_board, width, goal_board=None):
+    """
+    Vectorized layered BFS from initial_board
+        goal_board, stop at layer that has goal_board, None to enumerate 
+            every reachable board
+    Return (depth of goal_board or None, layers, layer sizes, 
+            number explored)
+        layers, all layers when goal_board is given, else last two
+    """
+    if np is None:
+        raise ImportError("numpy_bfs needs NumPy , pip install numpy")
+    
+    size = len(initial_board)
+    neighbor_indices = layer_neighbor_indices(size, width)
+    goal = None if goal_board is None else np.uint64(pack_board(goal_board))
+    
+    layers = [np.array([pack_board(initial_board)], dtype=np.uint64)]
+    previous_layer = np.empty(0, dtype=np.uint64)
+    layer_sizes = [1]
+    number_explored = 0
+    
+    while len(layers[-1]):
+        
+        layer = layers[-1]
+        
+        if goal is not None:
+            idx = np.searchsorted(layer, goal)
+            if idx < len(layer) and layer[idx] == goal:
+                return len(layers) - 1, layers, layer_sizes, number_explored
+        
+        number_explored += len(layer)
+        
+        next_layer = numpy_drop_reached(
+            numpy_expand_layer(layer, size, neighbor_indices), previous_layer)
+        
+        previous_layer = layer
+        layers.append(next_layer)
+        layer_sizes.append(len(next_layer))
+        
+        if goal is None:
+            layers = layers[-2:]                  # enumerate, two layers kept
+    
+    layer_sizes.pop()                                 # last layer is empty
+    return None, layers, layer_sizes, number_explored
 
-bfs_solve_n_puzzle(initial_board)
+def numpy_path(goal_board, layers, width):
+    """
+    Return list of boards from start state to goal_board, layer by layer 
+        back from goal_board, as disk_path
+    """
+    size = len(goal_board)
+    neighbor_indices = layer_neighbor_indices(size, width)
+    
+    board = pack_board(goal_board)
+    path = [board]
+    
+    for layer in reversed(layers[:-1]):
+        for neighbor in packed_neighbor_boards(board, size, neighbor_indices):
+            idx = np.searchsorted(layer, np.uint64(neighbor))
+            if idx < len(layer) and layer[idx] == neighbor:
+                board = neighbor
+                break
+        path.append(board)
+    
+    return [unpack_board(board, size) for board in reversed(path)]
+
+def numpy_bfs_search(initial_board, goal_board, width=None, stats=None):
+    """
+    NumPy layered breadth-first search from initial_board to goal_board
+        width, number of columns, default n of n x n board
+        stats, SearchStats, counters layers and largest_layer set, if given
+    Return (solution, number of states explored), as bfs_search
+    """
+    if width is None:
+        width = int(math.sqrt(len(initial_board)))
+    
+    depth, layers, layer_sizes, number_explored = numpy_bfs(
+        initial_board, width, goal_board)
+    
+    if stats is not None:                                # for print
+        stats.counters["layers"] = len(layer_sizes)
+        stats.counters["largest_layer"] = max(layer_sizes, default=0)
+    
+    if depth is None:
+        return None, number_explored            # goal_board is not reachable
+    
+    boards = numpy_path(goal_board, layers, width)
+    
+    return solution_from_boards(boards, width), number_explored
+
+def numpy_bfs_solve_n_puzzle(initial_board, quiet=False, goal=None, 
+                             width=None, stats=None):
+    
+    if stats is None:
+        stats = SearchStats("NumPy BFS", trace_memory=False)    # not returned
+    
+    result = solve_with_search(partial(numpy_bfs_search, stats=stats), 
+                               initial_board, quiet, goal, width, stats)
+    
+    if not quiet:
+        print("\n Layers =", stats.counters.get("layers", 0), 
+              ", largest layer =", stats.counters.get("largest_layer", 0), 
+              "boards")
+    
+    return result
+
+def numpy_enumerate(initial_board, width=None):
+    """
+    Every board reachable from initial_board, by NumPy layered BFS
+    Return (layer sizes, number of boards, time in seconds)
+    """
+    if width is None:
+        width = int(math.sqrt(len(initial_board)))
+    
+    start_time = time.perf_counter()
+    _, _, layer_sizes, number_explored = numpy_bfs(initial_board, width)
+    
+    return layer_sizes, number_explored, time.perf_counter() - start_time
+
+
+
+if __name__ == "__main__":
+    bfs_solve_n_puzzle(initial_board)
+
+    """
+        Packed board, same search with board states saved as packed int
+    bfs_solve_n_puzzle(initial_board, packed=True)
+    """
+
+    """
+        Search statistics, nodes generated, expanded, duplicates, frontier, 
+            time and peak memory, as JSON (search_stats.py)
+    stats = SearchStats("BFS")
+    bfs_solve_n_puzzle(initial_board, quiet=True, stats=stats)
+    print(stats.to_json())
+    """
+
+    print("\n", "="*32, "\n BFS search engine, deque frontier, reached map")
+    bfs_search_solve_n_puzzle(initial_board)
+
+    """
+        Perfect hash, explored bitmap and parent moves indexed by board rank
+    bfs_ranked_solve_n_puzzle(initial_board)
+    """
+
+    """
+        Bidirectional BFS, forward from initial_board, backward from goal_board
+    bidirectional_bfs_solve_n_puzzle(initial_board)
+    """
+
+    """
+        Layered BFS, only previous, current and next layers saved
+    layered_bfs_solve_n_puzzle(initial_board)
+    """
+
+    """
+        External memory BFS, layers in sorted files on disk
+    disk_bfs_solve_n_puzzle(initial_board)
+    """
+
+    """
+        NumPy BFS, whole layer expanded with vectorized slides (needs NumPy)
+    numpy_bfs_solve_n_puzzle(initial_board)
+
+        Every board of 8-Puzzle, and of 2 × 5 board (5 columns)
+    print(numpy_enumerate((7, 2, 4, 5, 0, 6, 8, 3, 1))[1:])
+    print(numpy_enumerate((1, 2, 3, 4, 0, 5, 6, 7, 8, 9), width=5)[1:])
+    """
+
+    """
+        Shared search core (search_core.py, in this folder), NPuzzleProblem 
+            with packed int states, same BFS for graphs, puzzles, wumpus world
+    import search_core
+    problem = search_core.NPuzzleProblem(initial_board, goal_board, packed=True)
+    result = search_core.breadth_first_search(problem)
+    print(result, "\n", result.solution)
+    """
 
 
 """
@@ -327,7 +1441,7 @@ Output:
 
  Solution found
 
- Number of states explored by BFS = 11
+ Number of states explored by BFS = 10
 
  Number of steps in solution: 7
 
@@ -392,7 +1506,7 @@ Output:
 
  Solution found
 
- Number of states explored by BFS = 171711
+ Number of states explored by BFS = 158791
 
  Number of steps in solution: 27
 
@@ -642,4 +1756,17 @@ Output:
  ------------
 | 6 | 7 | 8 |
  ------------
-"""
\ No newline at end of file
+"""
+"""
+Output: BFS search engine, bfs_search_solve_n_puzzle(initial_board)
+        (steps, same as above, not repeated)
+
+ ================================ 
+ BFS search engine, deque frontier, reached map
+
+ Solution found
+
+ Number of states explored by BFS = 158791
+
+ Number of steps in solution: 27
+"""
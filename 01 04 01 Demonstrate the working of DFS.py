@@ -29,25 +29,29 @@ Perform Depth-First Search (DFS) on a graph
     dfs(node)
         uses graph, a dictionary representing the graph, where keys are nodes
                 and values are lists of their adjacent nodes
-        node, node of graph to continue DFS on
+        node, node of graph to start DFS from
 
-Print nodes in the order they were visited by DFS
+        Return, list of nodes in the order they were visited by DFS
 """
 """
- list to keep track of visited nodes, visited, declared and initialized later
  graph, dictionay of adjacency lists, declared and initialized later
 """
-def dfs(node):              # recursive 
+import search_core                          # search_core.py, same folder
+
+def dfs(node):              # iterative, explicit stack
+    """
+    DFS of search_core, explicit stack of (vertex, iterator over adjacent 
+        vertices), no recursion, vertices in the same order as recursive dfs
+        GraphProblem with no goal, every vertex reachable from node is 
+        expanded
+        trace, list every expanded vertex is appended to, in DFS order
+    """
+    visited = []           # List to keep track of visited nodes, every call
     
-    if node not in visited:         # If node is not visited
-        
-        visited.append(node)           # then add node to visited list
-        
-        for neighbor in graph[node]:   # and perform DFS on all neighbors
-            
-            if neighbor not in visited:
-                
-                dfs(neighbor)
+    search_core.depth_first_search(search_core.GraphProblem(graph, node), 
+                                   trace=visited)
+    
+    return visited
 
 """
 For network of: same example as used in "Demonstrate the working of BFS.py"
@@ -76,11 +80,11 @@ graph = {'Sankeshwar': ['Hattargi', 'Hukkeri'],
          'Alnavar': ['Dharwad', 'Khanapur'], 
          'Dharwad': ['Alnavar', 'Kittur']}
 
-# Perform DFS starting from node 'Belagavi'
-start = 'Belagavi'
-visited = list()            # List to keep track of visited nodes
-dfs(start)
-print(f"DFS traversal starting from '{start}': \n{visited}")
+if __name__ == "__main__":
+    # Perform DFS starting from node 'Belagavi'
+    start = 'Belagavi'
+    visited = dfs(start)
+    print(f"DFS traversal starting from '{start}': \n{visited}")
 
 
 """
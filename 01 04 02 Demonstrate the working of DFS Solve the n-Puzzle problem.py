@@ -50,9 +50,9 @@ n = int(math.sqrt(board_size))                             # only n , of n x n
 
     Depth-first search
     dfs(current_board)
-        Input, current_board of PuzzleState
-        Output, board states of PuzzleState starting with initial_board in 
-            the order explored by DFS to reach goal_board
+        Input, current_board of search_core.Node
+        Output, board states of search_core.Node, starting with initial_board,
+            in the order explored by DFS to reach goal_board
 
         // till current_board == goal_board , stopping condition        
         // visit recursively all the unexplored(unvisited) board states with
@@ -106,117 +106,26 @@ Step 1:
 """
 """
     For simplicity, blank space represented as 0 on board
-"""
 
-class PuzzleState:
+    Board states, moves of blank space and parent links are of the shared 
+        search core (search_core.py, in this folder), same as BFS and A*
     
-    def __init__(self, board, parent=None, move=None):
-        self.board = board                # Tuple representing the n x n board
-        self.parent = parent
-        self.move = move
-    """        
-        __init__(self, board, parent=None, move=None)
-        default values are assigned when values not passed in as arguments
-        
-        Examples:
-            PuzzleState(initial_board)
-            that is
-            PuzzleState(self, board = initial_board)
-                self, is the invoking object
-                board = initial_board
-                parent = None , initial_board has no earlier state
-                move = None , no moves made to get to initial_board state
-        
-        For next state(or move) PuzzleState objects
-        
-            PuzzleState(tuple(new_board), self, move_name)
-            that is
-            PuzzleState(self", board = tuple(new_board), parent = self', 
-                        move = move_name)
-                
-                self" and self', both objects of PuzzleState
-                
-                self" (child) is the next state (or move) of self' (parent)
-                
-                self", is the invoking object
-                board = tuple(new_board)
-                parent = self', self' set as parent of self"
-                                                       self".parent = self'
-                move = move_name , is one of "up", "down", "right", or "left"
-    """
-
-    def get_blank_space_position(self):        
-        return self.board.index(0)                     # Index of blank space
+    search_core.NPuzzleProblem(initial_board, goal_board) , n-Puzzle problem
+        successors(board) , (move_name, new_board) for numeric tiles that 
+            can slide into blank space, in the order up, down, left, right, 
+            from moves_table built once per goal board
+        solvable() , inversion parity, checked before any search
+        path(node) , list of (board, move, g_cost, h_cost) from start state
     
-    def slide_numeric_tile_into_blank_space(self, board, index1, index2):
-        """
-        Swap values in list at specified indices
-        Slide/Swap neighbor numeric tile with blank blank space in board 
-
-            board passed here is a list, and not a tuple
-            
-                        (position of the: )
-            index1, first element to be swapped
-            index2, second element to be swapped
-            
-            a, b = b, a
-        """
-        board[index1], board[index2] = board[index2], board[index1]
-        
-        
-    def get_possible_moves_into_blank_space(self):
-        """
-        Finds neighbors of blank space (at most four neighbors)
-        Return list of new states (new PuzzleState objects) where 
-            new state is numeric tile moving from neighbor into blank space loc
-        """    
-        new_states = []
-        blank_space_idx = self.get_blank_space_position()  # blank space index
-        blank_space_row, blank_space_column = divmod(blank_space_idx, n) 
-                  # row and column of blank space
-        """
-        Neighbors of, with respect to blank space location could be:
-            up: row -1 , down: row +1 , no change in (same) column: 0
-            no change in (same) row: 0, left: column -1 , right: column +1
-        """
-        #                  r, c              r, c
-        moves = {  "up": (-1, 0),  "down": (+1, 0), 
-                 "left": (0, -1), "right": (0, +1)}        
-
-        for move_name, (dr, dc) in moves.items(): 
-                                                # for all neighbors (or moves)
-            new_row = blank_space_row + dr      # add dr, change in row
-            new_col = blank_space_column + dc   # add dc, change in column
-            
-            """
-            if both new row and column index are in n × n board, 
-                then
-                    create a copy of board, new board, so that
-                    neighbor and blank space can be swapped in new board, and
-                    a new PuzzleState object with new board can be created 
-                    append new PuzzleState to list of possible new_states
-            """
-            if 0 <= new_row < n and 0 <= new_col < n:
-                
-                new_board = list(self.board)   # new_board, a list not a tuple
-                
-                # Numeric tile index, and after slide where blank space appears
-                numeric_tile_idx = new_row * n + new_col
-                
-                self.slide_numeric_tile_into_blank_space(new_board, 
-                                                         blank_space_idx, 
-                                                         numeric_tile_idx)
-                
-                """    Create new PuzzleState
-                                  PuzzleState(tuple(new_board), 
-                                              self, 
-                                              move_name)
-                       and append to list"""
-                new_states.append(PuzzleState(board=tuple(new_board), 
-                                              parent=self, 
-                                              move=move_name))
-                
-        return new_states        
+    search_core.Node(state, parent, action, path_cost) , one node of the 
+        search tree, parent link to the board state it was reached from
+    
+    NPuzzleProblem(initial_board, goal_board, packed=True) , board states 
+        as packed int, 4 bits (one hex digit) per tile, and index of blank 
+        space in bits above the tiles, a small int is hashed and saved in 
+        explored_set at a fraction of the memory of a 9 (or 16) element tuple
+"""
+import search_core                          # search_core.py, same folder
 
 explored_set = set() # Empty set, to save explored board states , visited nodes
 
@@ -224,119 +133,270 @@ class SolutionFound(Exception):
     pass                                    # Exception used to exit recursion 
 
 dfs_calls = 0                           # Counter for number of dfs calls made
+peak_stack = 0                     # largest len(stack) of dfs_iterative
+dfs_generated = 0                  # neighbors generated, by dfs calls
+dfs_duplicates = 0                 # neighbors already in explored_set
 
-def dfs(current_state):
-    
-    global dfs_calls                         # Make changes to global variable
+def dfs(problem, node):
+    """
+    problem, NPuzzleProblem , node, search_core.Node of current board state
+    """
+    global dfs_calls, dfs_generated, dfs_duplicates  # change global variables
     dfs_calls = dfs_calls + 1                 # Increment number of calls by 1
     
     # If goal state reached, raise SolutionFound to come out of recursion
-    if current_state.board == goal_board:
+    if problem.goal_test(node.state):
         
-        raise SolutionFound(current_state) # Print solution in exception handle
+        raise SolutionFound(node)          # Print solution in exception handle
 
     """
         If control comes here, then Goal state has not been reached
-        add current_state.board to explored_set , visited node
+        add node.state to explored_set , visited node
         indicating this board state(setting) has been explored(visited)
     """
-    explored_set.add(current_state.board)  
+    explored_set.add(node.state)  
 
     """
     for all possible numeric neighbor tile slide into blank space
     that is
-    for all possible new PuzzleState with respect to blank space
+    for all possible new board with respect to blank space
     """
-    for neighbor in current_state.get_possible_moves_into_blank_space():
+    for move_name, new_board in problem.successors(node.state):
+        dfs_generated = dfs_generated + 1
         """
         Only if new neighbor board(state) is not in explored_set (visited)                
-            call dfs on neighbor
+            call dfs on neighbor (Node, made only now)
         """
-        if neighbor.board not in explored_set:            
+        if new_board not in explored_set:            
             
-            dfs(neighbor)         # dfs , recursive , call dfs on neighbor
+            dfs(problem, search_core.Node(new_board, node, move_name, 
+                                          node.path_cost + 1))
+                                # dfs , recursive , call dfs on neighbor
+        else:
+            dfs_duplicates = dfs_duplicates + 1
 
 
-import sys
-
-def solve_n_puzzle(initial_board):
+"""
+    Iterative DFS, explicit stack instead of recursion
     
-    sys.setrecursionlimit(80000)
+    Recursive dfs needs one Python frame (and C stack) per state on the path,
+        sys.setrecursionlimit(80000) allows deep recursion, but a deep enough
+        recursion can still overflow the C stack and crash the interpreter
     
-    print("\n Maximum recursion depth increased, To:", sys.getrecursionlimit())
+    Each recursive call, dfs(problem, node), is waiting in its for loop over
+        neighbors, so a frame on the explicit stack is 
+            (node, iterator over its neighbors)
+        the iterator remembers the next neighbor to try, as the for loop does
+        neighbors, from problem.successors(node.state) , boards, a Node 
+            is made only for the neighbor pushed
+        
+    stack = [(initial node, iter(neighbors of initial_board))]
+    while stack is not empty
+        node, neighbors = top of stack
+        next neighbor not in explored_set, from neighbors
+        if there is no such neighbor , all neighbors are done
+            pop stack                           (return from dfs call)
+        else
+            if neighbor is goal_board, solution reached
+            mark neighbor as explored
+            push (neighbor, iter(neighbors of neighbor))   (dfs(neighbor))
+            
+    Same order of exploration as recursive dfs, same explored states and
+        same solution
+        
+    depth_limit, if given, neighbors of states at depth_limit are not pushed, 
+        depth-limited search, states deeper than depth_limit are not explored
+        explored_depth, saves depth at which each board was explored, a board
+        reached again on a shorter path is explored again, else a board first
+        seen deep (near the limit) would hide a goal that is below it
     
-    print(f"\n Number of states in {board_size - 1}-Puzzle problem =", 
-          f"{board_size}! = ", math.factorial(board_size))
+    search_core.depth_first_search(problem, depth_limit) , this iterative DFS
+"""
+def render_solution(solution, number_explored, width=None):
+    """
+    Return text of solution, list of (board, move) from start state to goal 
+        state, number_explored, number of board states explored
+        width, number of columns, None for n of n x n board
+    Lines are collected in a list and joined, one string, no print
+    """
+    size = len(solution[0][0])
+    n = width or math.isqrt(size)                   # columns, of this board
     
-    initial_state = PuzzleState(initial_board)     # Create PuzzleState object    
+    lines = ["\n Solution found", 
+             f"\n Number of states explored by DFS = {number_explored}", 
+             f"\n Number of steps in solution: {len(solution)}", 
+             "\n Moves with respect to blank space, 0 ", 
+             "\n Start state, move = None "]
     
-    try:
-        dfs(initial_state)
+    # Indices to print at most 30 step for start to goal state
+    steps = [idx for idx in range(0, len(solution), 
+                                  max(1, len(solution)//30))]
     
-    except RecursionError as e:
-        print("\n Solution could not be found\n", e)
-        print("\n Number of dfs calls: ", dfs_calls)
-        
-    except SolutionFound as e:
-        
-        print("\n Solution found")
-        
-        current_state = e.args[0]
-        
-        print("\n Number of states explored by DFS =", len(explored_set))
-        
-        solution = []
-        """
-        Empty list to save (state, move) for all moves(states) in the sequence 
-            they are encountered from goal state back to start state, 
-            bottom up traversal
-        
-        while current_state is not None, 
-            that is traversal from child to root nood is not complete
-            till initial_board parent = None is not reached
-        """
-        while current_state: 
-            solution.append((current_state.board, current_state.move))
-            current_state = current_state.parent 
-            """
-            reassign current_state to parent of current state
-                from state(or move) at t + 1 to state(or move) at t
-            moving back/up the solution tree one step
-            """
-        """
-        Path(result) of traversal saved as list from goal to initial        
-        list[::-1] , ::-1 , gives list in reverse order
-        """ 
-        solution = solution[::-1]        # reverse list , now from start to goal state
-
-        print("\n Number of steps in solution:", len(solution))
-        print("\n Moves with respect to blank space, 0 ")
-        print("\n Start state, move = None ")
+    if (len(solution) - 1) not in steps:   # If last/goal state not in indices
+        steps.append(len(solution) - 1)              # to print , then include
+    
+    for step_number in steps:
+                        
+        board, move = solution[step_number]
+        lines.append("-"*32 + f" \n Step: {step_number} , Move: {move}\n " + 
+                     "-"*4*n)
         
-        # Indices to print at most 30 step for start to goal state
-        steps = [idx for idx in range(0, len(solution), 
-                                      max(1, len(solution)//30))]
+        for i in range(0, size, n):
+            lines.append("".join(f"| {board[j]} " for j in range(i, i+n)) + 
+                         "|\n " + "-"*4*n)
+    
+    return "\n".join(lines) + "\n"
+
+
+class SolverResult(search_core.SolverResult):
+    """
+    SolverResult of search_core, returned by solve_n_puzzle, path of 
+        (board, move) from start state to goal state, rendered by 
+        render_solution
+        peak_frontier, largest number of frames on stack of iterative DFS, 
+            None for recursive dfs , not tracked
+        width, number of columns of board, None for n of n x n board
+    """
+    def __init__(self, path, nodes_expanded, peak_frontier, elapsed_time, 
+                 width=None):
+        super().__init__(path, nodes_expanded, peak_frontier, elapsed_time)
+        self.width = width
+    
+    def render_path(self):
+        return render_solution(self.path, self.nodes_expanded, self.width)
+
+
+import sys
+import time
+from search_stats import SearchStats              # search_stats.py, same folder
+
+def solve_n_puzzle(initial_board, packed=False, iterative=False, 
+                   depth_limit=None, quiet=False, stats=None, goal=None, 
+                   width=None):
+    """
+    packed, if True board states saved as packed int
+    iterative, if True search_core.depth_first_search, explicit stack, 
+        no recursion limit
+    depth_limit, maximum depth explored by iterative DFS, None for no limit
+    quiet, if True nothing is printed
+    stats, SearchStats, filled with counters, time and memory of search
+    goal, goal board, None for goal_board (3 x 3), initial_board of same size
+    width, number of columns, None for n of n x n goal board
+    Return SolverResult
+    """
+    global dfs_calls, dfs_generated, dfs_duplicates, peak_stack
+    dfs_calls = dfs_generated = dfs_duplicates = 0  # fresh count , every solve
+    explored_set.clear()                            # fresh set , every solve
+    
+    if goal is None:
+        goal = goal_board
+    width = width or math.isqrt(len(goal))
+    
+    if stats is None:
+        stats = SearchStats("DFS", trace_memory=False)      # not returned
+    
+    solvable, reason = search_core.is_solvable(initial_board, goal, width)
+    if not solvable:                    # no search, reject board right away
+        if not quiet:
+            print("\n Solution could not be found,", reason)
+        return SolverResult(None, 0, None, 0.0, width)
+    
+    if not iterative:
+        sys.setrecursionlimit(80000)
         
-        if (len(solution) - 1) not in steps:   # If last/goal state not in indices
-            steps.append(len(solution) - 1)              # to print , then include
+        if not quiet:
+            print("\n Maximum recursion depth increased, To:", 
+                  sys.getrecursionlimit())
+    
+    if not quiet:
+        print(f"\n Number of states in {len(goal) - 1}-Puzzle problem =", 
+              f"{len(goal)}! = ", math.factorial(len(goal)))
+    
+    problem = search_core.NPuzzleProblem(initial_board, goal, width=width, 
+                                         packed=packed)
+    
+    start_time = time.perf_counter()
+    goal_node = None
+    
+    with stats.phase("search"):
         
-        for step_number in steps:
-                            
-            board, move = solution[step_number]
-            print("-"*32, f"\n Step: {step_number} , Move: {move}\n", "-"*4*n)
+        if iterative:
             
-            for i in range(0, board_size, n):
-                for j in range(i, i+n):
-                    print("|", board[j], end=" ")
-                    
-                print("|\n", "-"*4*n)
+            search_result = search_core.depth_first_search(
+                problem, depth_limit, stats=stats)
+            goal_node = search_result.node
+            dfs_calls = number_explored = search_result.nodes_expanded
+            peak_stack = search_result.peak_frontier
+            
+            if goal_node is None and not quiet:
+                print("\n Solution could not be found")
+                print("\n Number of dfs calls: ", dfs_calls)
         
-        """ except SolutionFound as e: ends"""            
+        else:
+            try:
+                dfs(problem, search_core.Node(problem.initial_state))
+            
+            except RecursionError as e:
+                if not quiet:
+                    print("\n Solution could not be found\n", e)
+                    print("\n Number of dfs calls: ", dfs_calls)
+                
+            except SolutionFound as e:
+                
+                goal_node = e.args[0]                       # goal node
+            
+            number_explored = len(explored_set)
+            stats.nodes_generated += dfs_generated
+            stats.nodes_expanded += number_explored
+            stats.duplicates_pruned += dfs_duplicates
+    
+    path = None
+    if goal_node is not None:
+        path = [(board, move) for board, move, _, _ in problem.path(goal_node)]
+    
+    result = SolverResult(path, number_explored, 
+                          peak_stack if iterative else None, 
+                          time.perf_counter() - start_time, width)
+    
+    stats.count("dfs_calls", dfs_calls)
+    
+    if path is not None and not quiet:
+        with stats.phase("print"):
+            sys.stdout.write(result.render())               # print path
+    
+    return result
                 
     """" solve_n_puzzle def ends """    
         
 
-solve_n_puzzle(initial_board)
+if __name__ == "__main__":
+    solve_n_puzzle(initial_board)
+
+    """
+        Packed board, same search with board states saved as packed int
+    solve_n_puzzle(initial_board, packed=True)
+    """
+
+    """
+        Iterative DFS, explicit stack, no recursion limit needed
+    solve_n_puzzle(initial_board, iterative=True)
+    """
+
+    """
+        Search statistics, as JSON (search_stats.py)
+    stats = SearchStats("DFS")
+    solve_n_puzzle(initial_board, iterative=True, quiet=True, stats=stats)
+    print(stats.to_json())
+    """
+
+    """
+        Shared search core (search_core.py, in this folder), NPuzzleProblem, 
+            same DFS for graphs, puzzles, wumpus world
+    import search_core
+    problem = search_core.NPuzzleProblem(initial_board, goal_board, packed=True)
+    result = search_core.depth_first_search(problem)
+    print(result)
+    """
 
 """
 Output:
@@ -98,7 +98,8 @@ import math
 
 line = "---"*14
 
-def alpha_beta(node, depth, alpha, beta, maximizing_player):
+def alpha_beta(node, depth, alpha, beta, maximizing_player, quiet=False, 
+               stats=None):
     """Recursively evaluates the game tree, 
         applying minimax algorithm with alpha-beta pruning logic
 
@@ -107,28 +108,44 @@ def alpha_beta(node, depth, alpha, beta, maximizing_player):
         alpha, best (highest) value that the maximizer can guarantee
         beta, best (lowest) value that the minimizer can guarantee
         maximizing_player, boolean indicating if it's maximizing player's turn
+        quiet, if True nothing is printed, no I/O on every node visit
+        stats, SearchStats (search_stats.py), counts nodes and cutoffs
 
         Return optimal value for the current node    
     """
     if depth == 0 or not node.children:  # Base case: Leaf node or depth limit
-        print(f"\n {node.name}, value = {node.value}")
+        if stats is not None:
+            stats.count("leaves")
+        if not quiet:
+            print(f"\n {node.name}, value = {node.value}")
         
         return node.value
 
+    if stats is not None:
+        stats.nodes_expanded += 1
+    
     if maximizing_player:
         
         max_eval = -math.inf      # Start with assumption of minus infinity
         
-        for child in node.children:            
-            eval_val = alpha_beta(child, depth - 1, alpha, beta, False)            
+        for number, child in enumerate(node.children, 1):
+            if stats is not None:
+                stats.nodes_generated += 1           # child evaluated
+            eval_val = alpha_beta(child, depth - 1, alpha, beta, False, quiet, 
+                                  stats)
             max_eval = max(max_eval, eval_val)
             alpha = max(alpha, eval_val)
             
             if beta <= alpha:     # Alpha-beta pruning
-                print(f"\n Alpha-beta pruning, beta {beta} <= alpha {alpha}")
+                if stats is not None:
+                    count_cutoff(stats, len(node.children) - number)
+                if not quiet:
+                    print(f"\n Alpha-beta pruning, beta {beta} <=", 
+                          f"alpha {alpha}")
                 break
             
-        print(f"\n {node.name}, max player, max_eval = {max_eval}\n", line)
+        if not quiet:
+            print(f"\n {node.name}, max player, max_eval = {max_eval}\n", line)
         
         return max_eval
     
@@ -136,20 +153,49 @@ def alpha_beta(node, depth, alpha, beta, maximizing_player):
         
         min_eval = math.inf        # Start with assumption of plus infinity
                 
-        for child in node.children:
+        for number, child in enumerate(node.children, 1):
             
-            eval_val = alpha_beta(child, depth - 1, alpha, beta, True)
+            if stats is not None:
+                stats.nodes_generated += 1           # child evaluated
+            eval_val = alpha_beta(child, depth - 1, alpha, beta, True, quiet, 
+                                  stats)
             
             min_eval = min(min_eval, eval_val)
             beta = min(beta, eval_val)
             
             if beta <= alpha:  # Alpha-beta pruning
-                print(f"\n Alpha-beta pruning, beta {beta} <= alpha {alpha}")
+                if stats is not None:
+                    count_cutoff(stats, len(node.children) - number)
+                if not quiet:
+                    print(f"\n Alpha-beta pruning, beta {beta} <=", 
+                          f"alpha {alpha}")
                 break
             
-        print(f"\n {node.name}, min player, min_eval = {min_eval}\n", line)
+        if not quiet:
+            print(f"\n {node.name}, min player, min_eval = {min_eval}\n", line)
         
         return min_eval    
+
+def count_cutoff(stats, children_pruned):
+    """ Cutoff, children not evaluated are pruned, not duplicates """
+    stats.count("cutoffs")
+    stats.count("pruned_children", children_pruned)
+
+def alpha_beta_search(root, depth, quiet=False, stats=None):
+    """
+    alpha_beta from root, MAX moves first, alpha = -inf , beta = +inf
+        quiet, if True nothing is printed, as alpha_beta
+        stats, SearchStats, nodes, cutoffs, time and memory of search
+    Return optimal value of root
+    """
+    if stats is None:
+        return alpha_beta(root, depth, -math.inf, math.inf, True, quiet)
+    
+    with stats.phase("search"):
+        value = alpha_beta(root, depth, -math.inf, math.inf, True, quiet, 
+                           stats)
+    
+    return value
     
 
 
@@ -193,30 +239,39 @@ Construct simple game tree for Figure 5.2, bottom up, leaves to root
 
 Using list comprehension, instead of individual Node calls for each Node
 """
-leaves_of_b = [Node(nam, val) for nam, val in 
-               zip(["leaf_b1", "leaf_b2", "leaf_b3"], [3, 12, 8])]
+if __name__ == "__main__":
+    leaves_of_b = [Node(nam, val) for nam, val in 
+                   zip(["leaf_b1", "leaf_b2", "leaf_b3"], [3, 12, 8])]
 
-leaves_of_c = [Node(nam, val) for nam, val in 
-               zip(["leaf_c1", "leaf_c2", "leaf_c3"], [2, 4, 6])]
+    leaves_of_c = [Node(nam, val) for nam, val in 
+                   zip(["leaf_c1", "leaf_c2", "leaf_c3"], [2, 4, 6])]
 
-leaves_of_d = [Node(nam, val) for nam, val in 
-               zip(["leaf_d1", "leaf_d2", "leaf_d3"], [14, 5, 2])] 
+    leaves_of_d = [Node(nam, val) for nam, val in 
+                   zip(["leaf_d1", "leaf_d2", "leaf_d3"], [14, 5, 2])] 
 
-children_b_c_d = [Node(name, children=child) for name, child in 
-                  zip(["child_b", "child_c", "child_d"], 
-                      [leaves_of_b, leaves_of_c, leaves_of_d])]
+    children_b_c_d = [Node(name, children=child) for name, child in 
+                      zip(["child_b", "child_c", "child_d"], 
+                          [leaves_of_b, leaves_of_c, leaves_of_d])]
 
-"""
-root, is directly assigned Node, and not [Node]
-"""
+    """
+    root, is directly assigned Node, and not [Node]
+    """
 
-root_a = Node("root_a", children=children_b_c_d)
+    root_a = Node("root_a", children=children_b_c_d)
 
-# Computes optimal value using the alpha-beta pruning algorithm
-optimal_value = alpha_beta(root_a, depth=3, alpha=-math.inf, beta=math.inf, 
-                           maximizing_player=True)
+    # Computes optimal value using the alpha-beta pruning algorithm
+    optimal_value = alpha_beta(root_a, depth=3, alpha=-math.inf, beta=math.inf, 
+                               maximizing_player=True)
 
-print("\n The optimal value is:", optimal_value)
+    print("\n The optimal value is:", optimal_value)
+
+    """
+        Search statistics, nodes, cutoffs, time and memory, as JSON
+    from search_stats import SearchStats          # search_stats.py, same folder
+    stats = SearchStats("alpha-beta")
+    alpha_beta_search(root_a, depth=3, quiet=True, stats=stats)
+    print(stats.to_json())
+    """
 
 
 """
@@ -305,50 +360,51 @@ Problem 1 (b)
     
                       5  10           1  8      6  12           2  5  7
 """
-leaves_of_e = [Node(nam, val) for nam, val in 
-               zip(["leaf_e1", "leaf_e2"], [4, 13])]
-leaves_of_j = [Node(nam, val) for nam, val in 
-               zip(["leaf_j1", "leaf_j2"], [5, 10])]
-leaves_of_f = [Node("leaf_f1", 11)]
-leaves_of_b = [Node("leaf_b1", 16)]
-
-leaves_of_k = [Node(nam, val) for nam, val in 
-               zip(["leaf_k1", "leaf_k2"], [1, 8])]
-leaves_of_g = [Node("leaf_g1", 9)]
-leaves_of_l = [Node(nam, val) for nam, val in 
-               zip(["leaf_l1", "leaf_l2"], [6, 12])]
-leaves_of_c = [Node("leaf_c1", 12)]
-
-leaves_of_h = [Node(nam, val) for nam, val in 
-               zip(["leaf_h1", "leaf_h2"], [10, 8])]
-leaves_of_m = [Node(nam, val) for nam, val in 
-               zip(["leaf_m1", "leaf_m2", "leaf_m3"], [2, 5, 7])]
-leaves_of_i = [Node(nam, val) for nam, val in 
-               zip(["leaf_i1", "leaf_i2"], [7, 4])]
-
-child_e = [Node("child_e", children=leaves_of_e)]
-child_j = [Node("child_j", children=leaves_of_j)]
-child_f = [Node("child_f", children=child_j + leaves_of_f)]
-child_b = [Node("child_b", children=child_e + child_f + leaves_of_b)]
-
-child_k = [Node("child_k", children=leaves_of_k)]
-child_l = [Node("child_l", children=leaves_of_l)]
-child_g = [Node("child_g", children=child_k + leaves_of_g + child_l)]
-child_c = [Node("child_c", children=child_g + leaves_of_c)]
-
-child_m = [Node("child_m", children=leaves_of_m)]
-child_h = [Node("child_h", children=leaves_of_h + child_m)]
-child_i = [Node("child_i", children=leaves_of_i)]
-child_d = [Node("child_d", children=child_h + child_i)]
-
-root_a = Node("root_a", children=child_b + child_c + child_d)
-
-print(line, "\n Run of another example \n", line)
-
-optimal_value = alpha_beta(root_a, depth=5, alpha=-math.inf, beta=math.inf, 
-                           maximizing_player=True)
-
-print("\n Another example, optimal value is:", optimal_value)
+if __name__ == "__main__":
+    leaves_of_e = [Node(nam, val) for nam, val in 
+                   zip(["leaf_e1", "leaf_e2"], [4, 13])]
+    leaves_of_j = [Node(nam, val) for nam, val in 
+                   zip(["leaf_j1", "leaf_j2"], [5, 10])]
+    leaves_of_f = [Node("leaf_f1", 11)]
+    leaves_of_b = [Node("leaf_b1", 16)]
+
+    leaves_of_k = [Node(nam, val) for nam, val in 
+                   zip(["leaf_k1", "leaf_k2"], [1, 8])]
+    leaves_of_g = [Node("leaf_g1", 9)]
+    leaves_of_l = [Node(nam, val) for nam, val in 
+                   zip(["leaf_l1", "leaf_l2"], [6, 12])]
+    leaves_of_c = [Node("leaf_c1", 12)]
+
+    leaves_of_h = [Node(nam, val) for nam, val in 
+                   zip(["leaf_h1", "leaf_h2"], [10, 8])]
+    leaves_of_m = [Node(nam, val) for nam, val in 
+                   zip(["leaf_m1", "leaf_m2", "leaf_m3"], [2, 5, 7])]
+    leaves_of_i = [Node(nam, val) for nam, val in 
+                   zip(["leaf_i1", "leaf_i2"], [7, 4])]
+
+    child_e = [Node("child_e", children=leaves_of_e)]
+    child_j = [Node("child_j", children=leaves_of_j)]
+    child_f = [Node("child_f", children=child_j + leaves_of_f)]
+    child_b = [Node("child_b", children=child_e + child_f + leaves_of_b)]
+
+    child_k = [Node("child_k", children=leaves_of_k)]
+    child_l = [Node("child_l", children=leaves_of_l)]
+    child_g = [Node("child_g", children=child_k + leaves_of_g + child_l)]
+    child_c = [Node("child_c", children=child_g + leaves_of_c)]
+
+    child_m = [Node("child_m", children=leaves_of_m)]
+    child_h = [Node("child_h", children=leaves_of_h + child_m)]
+    child_i = [Node("child_i", children=leaves_of_i)]
+    child_d = [Node("child_d", children=child_h + child_i)]
+
+    root_a = Node("root_a", children=child_b + child_c + child_d)
+
+    print(line, "\n Run of another example \n", line)
+
+    optimal_value = alpha_beta(root_a, depth=5, alpha=-math.inf, beta=math.inf, 
+                               maximizing_player=True)
+
+    print("\n Another example, optimal value is:", optimal_value)
 
 """
 Expected: Solution to Problem 1 (b) 
@@ -60,9 +60,7 @@ Hill Climbing Algorithm:
 """
 
 import random
-
-# Set for testing and reproducibility, remove when program working as expected
-random.seed(42) 
+from search_stats import SearchStats              # search_stats.py, same folder
 
 def objective_function(x):      # Example objective function to maximize
     return -x**2 + 5            # f(x) = y = -x*x + 5
@@ -94,15 +92,34 @@ def generate_neighbor(current_x, step_size):
     return current_x + random.uniform(-step_size, step_size)
 
 line = "---"*15
-def hill_climbing(objective_function, num_iterations, step_size):
+def hill_climbing(objective_function, num_iterations, step_size, stats=None, 
+                  quiet=False):
+    """
+    stats, SearchStats (search_stats.py), neighbors evaluated, moves made, 
+        time and memory
+    quiet, if True nothing is printed
+    """
+    if stats is None:
+        stats = SearchStats("hill-climbing", trace_memory=False)
+    
+    with stats.phase("search"):
+        return climb(objective_function, num_iterations, step_size, stats, 
+                     quiet)
+
+def climb(objective_function, num_iterations, step_size, stats, quiet=False):
                                                               # Initialization
     current_x = random.uniform(-10, 10)                     # Random initial x
     current_f_of_x = objective_function(current_x)        # Value at initial x
     
-    print(line, f"\n Initial, x = {current_x:.6f} , f(x) = {current_f_of_x:.6f}")
+    if not quiet:
+        print(line, 
+              f"\n Initial, x = {current_x:.6f} , f(x) = {current_f_of_x:.6f}")
     
     for i in range(num_iterations):
         
+        stats.nodes_expanded += 1              # one neighbor of current x
+        stats.nodes_generated += 1
+        
         # get new neighbor, evaluate objective function at new neighbor 
         neighbor_x = generate_neighbor(current_x, step_size) 
         neighbor_f_of_x = objective_function(neighbor_x)
@@ -118,23 +135,40 @@ def hill_climbing(objective_function, num_iterations, step_size):
         """        
         if neighbor_f_of_x > current_f_of_x: #maximization, moves towards peak
             
-            print(line, f"\n Iteration {i} , better x and f(x) found")
-            print(f" x = {neighbor_x:.6f} , f(x) = {neighbor_f_of_x:.6f}")
+            if not quiet:
+                print(line, f"\n Iteration {i} , better x and f(x) found")
+                print(f" x = {neighbor_x:.6f} , f(x) = {neighbor_f_of_x:.6f}")
             
             current_x = neighbor_x
             current_f_of_x = neighbor_f_of_x        
+            
+            stats.count("moves")                     # uphill move made
+        else:
+            stats.count("rejected_neighbors")   # neighbor not better, dropped
 
     return current_x, current_f_of_x
 
-print(line, "\n objective_function = -x**2 + 5")
-
-iterations = 50
-step = 0.2
-best_x, best_f_of_x = hill_climbing(objective_function, iterations, step)
+if __name__ == "__main__":
+    # Set for testing and reproducibility, remove when program works
+    random.seed(42) 
+    
+    print(line, "\n objective_function = -x**2 + 5")
+    
+    iterations = 50
+    step = 0.2
+    best_x, best_f_of_x = hill_climbing(objective_function, iterations, step)
+    
+    print(line, "\n objective_function = -x**2 + 5")
+    print("\n Expected solution, maxima, x = 0.0 , f(x) = 5.0")
+    print(f"\n Best solution found, x = {best_x:.6f} , " + 
+          f"f(x) = {best_f_of_x:.6f}")
 
-print(line, "\n objective_function = -x**2 + 5")
-print("\n Expected solution, maxima, x = 0.0 , f(x) = 5.0")
-print(f"\n Best solution found, x = {best_x:.6f} , f(x) = {best_f_of_x:.6f}")
+"""
+    Search statistics, neighbors evaluated, moves made, time, as JSON
+stats = SearchStats("hill-climbing")
+hill_climbing(objective_function, iterations, step, stats=stats, quiet=True)
+print(stats.to_json())
+"""
 
 
 """
@@ -221,9 +255,6 @@ Output:
 
 import math
 
-# Set for testing and reproducibility, remove when program working as expected
-random.seed(42)
-
 def another_objective_function(x): 
     # f(x) = 0.5*e^-((x-1)^2) + e^-((x-4)^2)
     return 0.5*math.exp(-(x-1)**2) + math.exp(-(x-4)**2)
@@ -260,23 +291,29 @@ def another_objective_function(x):
     plot of another_objective_function using matplotlib.pyplot plt at end 
 """
 
-print(line, "\n Another example \n")
-print("\n another_objective_function = 0.5*e^-((x-1)^2) + e^-((x-4)^2)")
-
-iterations = 100
-step = 2.25 
-"""
-    Depending on initial x and step size, algorithm will find one of
-        global maxima
-        or
-        local maximas
-"""
-best_x, best_f_of_x = hill_climbing(another_objective_function, iterations, 
-                                    step)
-
-print(line, "\n another_objective_function = 0.5*e^-((x-1)^2) + e^-((x-4)^2)")
-print("\n Expected solution, maxima, x = 4.0 , f(x) = 1.0")
-print(f"\n Best solution found, x = {best_x:.6f} , f(x) = {best_f_of_x:.6f}")
+if __name__ == "__main__":
+    # Set for testing and reproducibility, remove when program works
+    random.seed(42)
+    
+    print(line, "\n Another example \n")
+    print("\n another_objective_function = 0.5*e^-((x-1)^2) + e^-((x-4)^2)")
+    
+    iterations = 100
+    step = 2.25 
+    """
+        Depending on initial x and step size, algorithm will find one of
+            global maxima
+            or
+            local maximas
+    """
+    best_x, best_f_of_x = hill_climbing(another_objective_function, 
+                                        iterations, step)
+    
+    print(line, 
+          "\n another_objective_function = 0.5*e^-((x-1)^2) + e^-((x-4)^2)")
+    print("\n Expected solution, maxima, x = 4.0 , f(x) = 1.0")
+    print(f"\n Best solution found, x = {best_x:.6f} , " + 
+          f"f(x) = {best_f_of_x:.6f}")
 
 """
 Output:
@@ -317,12 +354,6 @@ another_objective_function = 0.5*e^-((x-1)^2) + e^-((x-4)^2)
 """
 
 
-print(line, "\n Minimization , finding valley")
-print("\n Yet another example, objective_function = x*x - 5 \n")
-
-# Set for testing and reproducibility, remove when program working as expected
-random.seed(42) 
-
 def yet_another_objective_function(x):
     return x**2 - 5                     # f(x) = y = x*x - 5
 """
@@ -350,40 +381,46 @@ def yet_another_objective_function(x):
 def negative_of_yet_another_objective_function(x):
     return -yet_another_objective_function(x)
 
-iterations = 50
-step = 0.2
-# To find minima, pass negative of objective_function 
-best_x, best_f_of_x = hill_climbing(negative_of_yet_another_objective_function, 
-                                    iterations, step)
+if __name__ == "__main__":
+    print(line, "\n Minimization , finding valley")
+    print("\n Yet another example, objective_function = x*x - 5 \n")
+    
+    # Set for testing and reproducibility, remove when program works
+    random.seed(42) 
+    
+    iterations = 50
+    step = 0.2
+    # To find minima, pass negative of objective_function 
+    best_x, best_f_of_x = hill_climbing(
+        negative_of_yet_another_objective_function, iterations, step)
 
-# Important, find inverse, since negative of objective_function was used
-best_f_of_x = -best_f_of_x
+    # Important, find inverse, since negative of objective_function was used
+    best_f_of_x = -best_f_of_x
 
-# And then find: best_f_of_x is for which value of x
-import sympy as sp
-x = sp.symbols('x')                                     # Define the variable
-function = x**2 - 5                          # yet_another_objective_function
-equation = sp.Eq(function, best_f_of_x)   # Set the function equal to a value
-best_x = sp.solve(equation, x)                           # Solve the equation
+    # And then find: best_f_of_x is for which value of x
+    import sympy as sp
+    x = sp.symbols('x')                                 # Define the variable
+    function = x**2 - 5                      # yet_another_objective_function
+    equation = sp.Eq(function, best_f_of_x)    # Set function equal to value
+    best_x = sp.solve(equation, x)                       # Solve the equation
 
-# Careful of order, first negate best_f_of_x, then find best_x
+    # Careful of order, first negate best_f_of_x, then find best_x
 
-best_x = [round(x, 6) for x in best_x]
+    best_x = [round(x, 6) for x in best_x]
 
-print(line, "\n objective_function = x**2 - 5 , has minima (0, -5)")
-print("\n Use hill_climbing to find maxima of negative of objective_function")
-print("\n Then inverse(negative) of best_f_of_x")
-print("\n And find best_f_of_x is for which value of x")
-print("\n Expected solution, minima, x = 0.0 , f(x) = -5.0")
-print(f"\n Best solution found, x = {best_x} , f(x) = {best_f_of_x:.6f}")
+    print(line, "\n objective_function = x**2 - 5 , has minima (0, -5)")
+    print("\n Use hill_climbing to find maxima of negative of", 
+          "objective_function")
+    print("\n Then inverse(negative) of best_f_of_x")
+    print("\n And find best_f_of_x is for which value of x")
+    print("\n Expected solution, minima, x = 0.0 , f(x) = -5.0")
+    print(f"\n Best solution found, x = {best_x} , f(x) = {best_f_of_x:.6f}")
 
 
 
 # Common code for plotting objective function
-import numpy as np
-import matplotlib.pyplot as plt
-
 def plot_objective_function(x, objective_function, title):
+    import matplotlib.pyplot as plt            # only needed when plotting
     y = objective_function(x)
     plt.plot(x, y)
     plt.title(title, fontsize=20)
@@ -391,23 +428,26 @@ def plot_objective_function(x, objective_function, title):
     plt.ylabel('y')
     plt.show()
 
-# Plot of, f(x) = -x**2 + 5
-x = np.linspace(-3, 3, 50)
-plot_objective_function(x, objective_function, r'$y = -x^2+5$')
+if __name__ == "__main__":
+    import numpy as np
+    
+    # Plot of, f(x) = -x**2 + 5
+    x = np.linspace(-3, 3, 50)
+    plot_objective_function(x, objective_function, r'$y = -x^2+5$')
 
 
-# Plot of, f(x) = 0.5*e^-((x-1)^2) + e^-((x-4)^2)    
-# Redefining, another_objective_function, using np.exp , instead of math.exp
-def another_objective_function(x): 
-    # f(x) = 0.5*e^-((x-1)^2) + e^-((x-4)^2)
-    return 0.5*np.exp(-(x-1)**2) + np.exp(-(x-4)**2)
+    # Plot of, f(x) = 0.5*e^-((x-1)^2) + e^-((x-4)^2)    
+    # Redefining, another_objective_function, using np.exp , instead of math.exp
+    def another_objective_function(x): 
+        # f(x) = 0.5*e^-((x-1)^2) + e^-((x-4)^2)
+        return 0.5*np.exp(-(x-1)**2) + np.exp(-(x-4)**2)
 
-x = np.linspace(-1, 6, 50)
-plot_objective_function(x, another_objective_function, 
-                        r'$y = 0.5*e^{-(x-1)^{2}} + e^{-(x-4)^{2}}$')
+    x = np.linspace(-1, 6, 50)
+    plot_objective_function(x, another_objective_function, 
+                            r'$y = 0.5*e^{-(x-1)^{2}} + e^{-(x-4)^{2}}$')
 
 
-#Plot of, f(x) = x**2 - 5
-x = np.linspace(-3, 3, 50)
-plot_objective_function(x, yet_another_objective_function, r'$y = x^2-5$')
+    #Plot of, f(x) = x**2 - 5
+    x = np.linspace(-3, 3, 50)
+    plot_objective_function(x, yet_another_objective_function, r'$y = x^2-5$')
 
@@ -150,274 +150,1937 @@ Levitin A, Introduction to the Design and Analysis of Algorithms, Pearson
     For simplicity, blank space represented as 0 on board
 """
 
-class PuzzleState:
+"""
+    n x n board, 3×3 for 8-Puzzle, 4×4 for 15-Puzzle, 5×5 for 24-Puzzle
+    
+    Tables, computed once for a goal board, by search_core.puzzle_tables 
+        (search_core.py, in this folder), shared by NPuzzleProblem of A* 
+        and IDA*, heuristic plug-ins, pattern databases, oracle, ARA*, HDA*
+    
+    distance_table[tile][idx] , Manhattan distance of tile placed at idx 
+        from position of tile in goal board, 0 for blank space
+        h = sum of distance_table[board[idx]][idx] , for all idx in board
+            a table sum, no divmod for every tile of every state
+    
+    moves_table[blank_space_idx] , list of (move_name, numeric_tile_idx), 
+        numeric tiles that can slide into blank space at blank_space_idx
+        divmod and 0 <= row, column < n checks are done once per index, 
+            and not once per state
+"""
+import math
+import search_core                          # search_core.py, same folder
+
+def build_puzzle_tables(goal_board, width=None):
+    """
+    Return (distance_table, moves_table) for goal_board, width columns, 
+        None for n of n x n , built once, later calls get the same tables
+    """
+    return search_core.puzzle_tables(goal_board, width)
+
+def manhattan_distance(board, goal=None, width=None):
+    """
+    Heuristic, h , dM of entire board (excluding blank space)
+        goal, None for goal_board , width, None for n of n x n
+    """
+    distance_table, _ = build_puzzle_tables(goal or goal_board, width)
+    return sum(distance_table[tile][idx] for idx, tile in enumerate(board))
+
+"""
+    A* search, search_core.astar_search over search_core.NPuzzleProblem
+    
+    open_list, priority queue, heapq, heap entry is tuple 
+        (f_cost, tie_breaker, node) , f_cost = g_cost + h_cost
+        tuples compare int f_cost first, equal f_cost compare tie_breaker,
+            0, -1, -2, ... unique, so nodes themselves are never compared
+            among equal f_cost, most recently pushed (deeper) state pops first
+    
+    best_g_cost[board] , lowest g_cost with which board was pushed
+        a neighbor already in open_list with lower (or same) g_cost is 
+        dominated, not pushed again, heap does not fill with duplicates
+        a neighbor with lower g_cost is pushed, earlier entry becomes stale
+        (decrease-key, by lazy deletion, stale entry stays in heap)
+    On pop, entry is stale if board already explored, or its g_cost is 
+        more than best_g_cost[board] , skipped
+    
+    Incremental h, h_cost of every state computed once, and cached on its 
+        node, h of neighbor from h of board (NPuzzleProblem.expand)
+        h_cost = h_cost of board 
+                 - distance_table[tile][numeric_tile_idx] 
+                 + distance_table[tile][blank_space_idx]
+            only the moved tile changes its distance from goal
+        heuristic plug-in, its update(...) , or heuristic(board) in full
+    
+    Packed board, NPuzzleProblem(packed=True) , alternative state 
+        representation, board tuple packed into a single int, 4 bits per 
+        tile, and blank space index above tiles, a small int is hashed and 
+        saved in explored set at a fraction of the memory of a tuple
+"""
+"""
+    Packed board of HDA* , board tuple, (7, 2, 4, 5, 0, 6, 8, 3, 1) packed 
+        into a single int, 4 bits (one hex digit) per tile, tile at index i 
+        in bits 4*i to 4*i+3
+        
+            index     8 7 6 5 4 3 2 1 0
+            packed = 0x1 3 8 6 0 5 4 2 7 , that is 0x138605427
+        
+    4 bits hold tile numbers 0 to 15, enough for 15-Puzzle (4 x 4 board), 
+        16 tiles × 4 bits = 64 bits
+        
+    Blank space is 0, all 4 bits clear, so sliding numeric tile at 
+        numeric_tile_idx into blank space at blank_space_idx is two xor:
+            tile = (packed >> 4*numeric_tile_idx) & 0xF
+            new packed = packed ^ (tile << 4*numeric_tile_idx) 
+                                ^ (tile << 4*blank_space_idx)
+        no list(board) copy, no tuple(new_board)
+"""
+def pack_board(board):
+    packed = 0
+    for idx, tile in enumerate(board):
+        packed |= tile << (4 * idx)             # tile in bits 4*idx to 4*idx+3
+    return packed
+
+def unpack_board(packed, board_size):
+    return tuple((packed >> (4 * idx)) & 0xF for idx in range(board_size))
+
+def render_solution(solution, number_explored, width=None):
+    """
+    Return text of solution, list of (board, move, g_cost, h_cost) from 
+        start state to goal state, number_explored, number of states explored
+        width, number of columns, None for n of n x n board
+    Lines are collected in a list and joined, one string, no print
+    """
+    board_size = len(solution[0][0])
+    n = width or math.isqrt(board_size)             # columns, of this board
+    
+    lines = ["\n Solution found", 
+             f"\n Number of states explored by A* = {number_explored}", 
+             f"\n Number of steps in solution: {len(solution)}", 
+             "\n Moves with respect to blank space, 0 ", 
+             "\n Start state, move = None "]
+    
+    for step_number, (board, move, cost, heuristic) in enumerate(solution):
+                        
+        lines.append("-"*42 + f" \n Step: {step_number} , Move: {move} , " + 
+                     f"g_cost: {cost} + h: {heuristic}\n " + "-"*(4*n + 1))
+        
+        for i in range(0, board_size, n):
+            row = " | ".join(f"{tile}" for tile in board[i:i+n])
+            lines.append(" | " + row + " |\n " + "-"*(4*n + 1))
+    
+    return "\n".join(lines) + "\n"
+
+
+class SolverResult(search_core.SolverResult):
+    """
+    SolverResult of search_core, returned by solve_8_puzzle, path of 
+        (board, move, g_cost, h_cost) , rendered by render_solution
+        width, number of columns of board, None for n of n x n board
+    """
+    def __init__(self, path, nodes_expanded, peak_frontier, elapsed_time, 
+                 width=None):
+        super().__init__(path, nodes_expanded, peak_frontier, elapsed_time)
+        self.width = width
+    
+    def render_path(self):
+        return render_solution(self.path, self.nodes_expanded, self.width)
+
+
+from math import factorial
+from functools import partial
+from itertools import count
+import sys
+import time
+from search_stats import SearchStats              # search_stats.py, same folder
+    
+def solve_8_puzzle(initial_board, packed=False, goal=None, 
+                   heuristic=None, oracle=False, quiet=False, weight=1, 
+                   anytime=False, deadline=None, workers=1, stats=None, 
+                   width=None):
+    """
+    packed, if True board states saved as packed int
+    goal, goal board, any n x n , None for 3×3 goal_board , 
+        initial_board must be of same size
+    heuristic, heuristic plug-in, function(board tuple) returning h, 
+        or object with heuristic(board) and update(...) (incremental h), 
+        None for Manhattan distance
+    oracle, if True, no search, solution read from DistanceOracle of goal
+    quiet, if True nothing is printed
+    weight, weighted A* , f = g + weight × h , solution at most weight 
+        times optimal, found with fewer states explored
+    anytime, if True ARA* , first solution with weight, then weight 
+        lowered till 1 (optimal) or till deadline (seconds) passes
+    workers, more than 1 for HDA* , parallel A* with workers processes, 
+        None for HDA* with all CPU cores, HDA* is optimal A* on packed 
+        boards of its own, with weight other than 1 or packed, ValueError
+    stats, SearchStats, filled with counters, time and memory of search, 
+        oracle, ARA* and HDA* fill only nodes expanded and time
+    width, number of columns, None for n of n x n goal board
+    Return SolverResult
+    """
+    if workers != 1 and not (oracle or anytime) and (weight != 1 or packed):
+        raise ValueError("HDA* (workers other than 1) is not weighted, and " 
+                         "packs boards itself, use weight=1, packed=False")
+    
+    if stats is None:
+        stats = SearchStats("A*", trace_memory=False)       # not returned
+    
+    if goal is None:
+        goal = goal_board
+    width = width or math.isqrt(len(goal))
+    
+    if not quiet:
+        print(f"\n Number of states in {len(goal) - 1}-Puzzle problem =", 
+              f"{len(goal)}! =", factorial(len(goal)))
+    
+    solvable, reason = search_core.is_solvable(initial_board, goal, width)
+    if not solvable:                    # no search, reject board right away
+        if not quiet:
+            print("\n Solution could not be found,", reason)
+        return SolverResult(None, 0, 0, 0.0, width)
+    
+    if oracle or anytime or workers != 1:
+        
+        with stats.phase("search"):               # print of path included
+            if oracle:
+                result = solve_by_distance_oracle(initial_board, goal, quiet)
+            elif anytime:
+                result = solve_by_ara_star(initial_board, goal, weight, 
+                                           deadline, quiet, heuristic, width)
+            else:
+                result = solve_by_hda_star(initial_board, goal, workers, 
+                                           heuristic, quiet, width)
+        
+        stats.nodes_expanded += result.nodes_expanded
+        return result
+    
+    problem = search_core.NPuzzleProblem(initial_board, goal, width=width, 
+                                         packed=packed, heuristic=heuristic)
+    
+    heap_counters = ("heap_pushes", "heap_pops", "stale_pops")
+    before = [stats.counters.get(name, 0) for name in heap_counters]
+    
+    with stats.phase("search"):
+        search_result = search_core.astar_search(problem, weight, stats)
+    
+    result = SolverResult(None if search_result.node is None 
+                          else problem.path(search_result.node), 
+                          search_result.nodes_expanded, 
+                          search_result.peak_frontier, 
+                          search_result.elapsed_time, width)
+    
+    if quiet:
+        return result
+    
+    if result.path is None:
+        print("\n Solution could not be found")
+        return result
+    
+    pushes, pops, stale_pops = [stats.counters[name] - count 
+                                for name, count in zip(heap_counters, before)]
+    
+    with stats.phase("print"):
+        sys.stdout.write(result.render())                  # print solution
+        
+        print(f"\n Heap pushes = {pushes} , pops = {pops} ,", 
+              f"stale pops = {stale_pops}")
+    
+    return result
+    
+    """ solve_8_puzzle def ends """
+        
+
+"""
+    IDA*, Iterative-deepening A*
+    
+Russell Stuart J, and Peter Norvig, Artificial Intelligence: A Modern Approach, 
+Pearson Education
+    IDA*, the cutoff used is the f-cost (g + h) rather than the depth
+        at each iteration, the cutoff value is the smallest f-cost of any node
+        that exceeded the cutoff on the previous iteration
+        
+    Depth-first search, within f-cost cutoff (bound), repeated with bigger 
+        bound, till goal is reached
+        no open_list, no explored_set , memory linear in solution depth
+        only boards on the current path are saved
+        search_core.ida_star_search over search_core.NPuzzleProblem
+        
+    Incremental h, heuristic , Manhattan distance
+        one move slides one numeric tile, from numeric_tile_idx into 
+            blank_space_idx, only distance of that tile changes
+        new h = h - distance(tile, numeric_tile_idx) 
+                  + distance(tile, blank_space_idx)
+        distance[tile][idx], precomputed table, Manhattan distance of tile at
+            idx from its position in goal board, from build_puzzle_tables
+            
+    Move back into a board on the current path, as undo of last move, 
+        is never tried
+    
+    Works for n x n boards, 15-Puzzle (4 x 4) too, 
+        for a board that can not reach goal board, never stops, so such a 
+        board is rejected by inversion parity first
+"""
+def solve_puzzle_ida_star(initial_board, goal_board, quiet=False, 
+                          stats=None):
+    """
+    quiet, if True nothing is printed
+    stats, SearchStats, filled with counters of search, if given
+    Return SolverResult, path of (board, move, g_cost, h_cost) , 
+        peak_frontier None , IDA* has no frontier
+    """
+    width = math.isqrt(len(goal_board))
+    solvable, reason = search_core.is_solvable(initial_board, goal_board, 
+                                               width)
+    if not solvable:             # IDA* would raise bound forever, never stop
+        if not quiet:
+            print("\n Solution could not be found,", reason)
+        return SolverResult(None, 0, None, 0.0, width)
+    
+    problem = search_core.NPuzzleProblem(initial_board, goal_board, width)
+    search_result = search_core.ida_star_search(problem, stats=stats)
+    
+    path = None
+    if search_result.node is not None:
+        path = problem.path(search_result.node)
+    
+    result = SolverResult(path, search_result.nodes_expanded, None, 
+                          search_result.elapsed_time, width)
+    
+    if quiet:
+        return result
+    
+    if path is None:
+        print("\n Solution could not be found")
+        return result
+    
+    print("\n Solution found")
+    
+    print("\n Number of states expanded by IDA* =", 
+          search_result.nodes_expanded)
+    
+    solution = result.moves
+    print("\n Number of moves in solution:", len(solution))
+    print("\n Moves with respect to blank space, 0 \n")
+    
+    for i in range(0, len(solution), 10):           # 10 moves in each line
+        print("", ", ".join(solution[i:i + 10]))
+    
+    return result
+    
+
+"""
+    Pattern database, PDB , heuristic
+    
+    Pattern, a subset of tiles, for example (1, 2, 3, 4) on 3×3 board,
+        other tiles are treated as indistinguishable (don't care)
+    Abstract state, positions of pattern tiles and blank space
+    
+    PDB, table of exact number of moves of pattern tiles, to get pattern
+        tiles from their positions to their goal positions
+        
+    Retrograde BFS, backward from goal, over abstract states, using 
+        moves_table, same move generator as NPuzzleProblem
+        a move of a pattern tile costs 1, a move of other tile costs 0,
+            0-1 BFS, deque, cost 0 neighbor to front, cost 1 neighbor to end
+        (moves are reversible, distance from goal = distance to goal)
+        entry for pattern positions, minimum over all blank positions
+    
+    N!/(N-k)! × N abstract states, build_pattern_database , a Python loop, 
+        about 10^5 states per second, patterns of up to 5 tiles of 
+        15-Puzzle (8.7 million states, a few minutes)
+    numpy_build_pattern_database , same table, NumPy, a whole cost level 
+        at once, 6 tiles of 15-Puzzle (92 million states, 6-6-3) too , 
+        about 5 minutes and 1 GB , used by load_or_build_pattern_database 
+        when NumPy is installed
+    
+    Additive PDBs, patterns are disjoint, each counts only moves of its own 
+        tiles, so sum of entries of all patterns is admissible, never more
+        than actual moves, and is (much) more than Manhattan distance
+            8-Puzzle , (1, 2, 3, 4) + (5, 6, 7, 8) , or (1, ... 8) full table
+            15-Puzzle , 6-6-3 , or 5-5-5
+    
+    Index of pattern positions (p0, p1, ... pk-1), 0 to N!/(N-k)! - 1, 
+        N = board size, mixed radix of N, N-1, ..., N-k+1 , 
+        digit i = pi - (number of earlier positions smaller than pi)
+        
+    On-disk format, one file per pattern
+        b"PDB1" , board size (1 byte) , k (1 byte) , pattern tiles (k bytes) ,
+        goal board (N bytes) , table (N!/(N-k)! bytes, one move count each)
+    Loaded with mmap , pages read from disk only when looked up, shared by 
+        all processes reading same file , repeated solves do no BFS
+    Written to temporary file and renamed , header checked against pattern 
+        and goal board asked for , file of other PDB is rebuilt, not used
+"""
+from collections import deque
+import mmap
+import os
+import tempfile
+
+def write_atomically(path, chunks):
+    """
+    Write chunks (bytes) to temporary file next to path , then replace path 
+        with it , reader never sees a half written file
+    """
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    
+    try:
+        with open(temporary_path, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+def pattern_rank(positions, board_size):
+    rank = 0
+    for i, position in enumerate(positions):
+        smaller_before = sum(1 for p in positions[:i] if p < position)
+        rank = rank * (board_size - i) + position - smaller_before
+    return rank
+
+class PatternDatabase:
+    
+    def __init__(self, pattern, goal_board, table):
+        self.pattern = tuple(pattern)                        # pattern tiles
+        self.goal_board = tuple(goal_board)
+        self.board_size = len(goal_board)
+        self.table = table      # bytearray, or memoryview of mmap from disk
+    
+    def lookup(self, position):
+        """
+        position[tile] , index of tile on board
+        Return moves of pattern tiles to their goal positions
+        """
+        return self.table[pattern_rank([position[tile] 
+                                        for tile in self.pattern], 
+                                       self.board_size)]
+
+def build_pattern_database(pattern, goal_board):
+    """
+    Retrograde 0-1 BFS from goal_board over (pattern positions, blank space)
+    Return PatternDatabase, table as bytearray
+    """
+    board_size = len(goal_board)
+    _, moves_table = build_puzzle_tables(goal_board)      # move generator
+    
+    number_of_entries = math.perm(board_size, len(pattern))
+    
+    # distance of abstract state (rank of pattern positions, blank position)
+    distance = bytearray(b"\xff") * (number_of_entries * board_size)
+    
+    positions = tuple(goal_board.index(tile) for tile in pattern)
+    blank_space_idx = goal_board.index(0)
+    distance[pattern_rank(positions, board_size) * board_size + 
+             blank_space_idx] = 0
+    
+    frontier = deque([(positions, blank_space_idx)])
+    
+    while frontier:
+        
+        positions, blank_space_idx = frontier.popleft()
+        cost = distance[pattern_rank(positions, board_size) * board_size + 
+                        blank_space_idx]
+        
+        for _, numeric_tile_idx in moves_table[blank_space_idx]:
+            
+            if numeric_tile_idx in positions:     # pattern tile slides, 1
+                j = positions.index(numeric_tile_idx)
+                new_positions = (positions[:j] + (blank_space_idx,) + 
+                                 positions[j + 1:])
+                step = 1
+            else:                                 # other tile slides, 0
+                new_positions = positions
+                step = 0
+            
+            key = (pattern_rank(new_positions, board_size) * board_size + 
+                   numeric_tile_idx)
+            
+            if cost + step < distance[key]:
+                distance[key] = cost + step
+                
+                if step == 0:
+                    frontier.appendleft((new_positions, numeric_tile_idx))
+                else:
+                    frontier.append((new_positions, numeric_tile_idx))
+    
+    table = bytearray(number_of_entries)   # minimum over blank positions
+    for rank in range(number_of_entries):
+        table[rank] = min(distance[rank * board_size:
+                                   (rank + 1) * board_size])
+    
+    return PatternDatabase(pattern, goal_board, table)
+
+try:
+    import numpy as np
+except ImportError:       # NumPy only needed by numpy_build_pattern_database
+    np = None
+
+def numpy_pattern_rank(positions, board_size):
+    """ pattern_rank of every row of positions (m x k array) """
+    rank = np.zeros(len(positions), dtype=np.int64)
+    for i in range(positions.shape[1]):
+        smaller_before = (positions[:, :i] < positions[:, i:i + 1]).sum(axis=1)
+        rank = rank * (board_size - i) + positions[:, i] - smaller_before
+    return rank
+
+def numpy_build_pattern_database(pattern, goal_board):
+    """
+    Retrograde BFS of build_pattern_database , one cost level at a time
+        level c , states of cost c, closed under cost 0 slides (other 
+            tile slides into blank space) first, then cost 1 slides 
+            (pattern tile slides into blank space) of whole level give 
+            states of cost c + 1 , all slides of all states at once
+        states, positions (m x k array) and blank space index (m array)
+    Return PatternDatabase, table as bytearray, same as 
+        build_pattern_database
+    """
+    if np is None:
+        raise ImportError("numpy_build_pattern_database needs NumPy , " 
+                          "pip install numpy")
+    
+    board_size = len(goal_board)
+    _, moves_table = build_puzzle_tables(goal_board)      # move generator
+    
+    number_of_entries = math.perm(board_size, len(pattern))
+    distance = np.full(number_of_entries * board_size, 0xFF, dtype=np.uint8)
+    
+    # neighbor[blank_space_idx] , numeric tile indices, 4 columns, -1 for none
+    neighbor = np.full((board_size, 4), -1, dtype=np.int16)
+    for blank_space_idx, moves in enumerate(moves_table):
+        for column, (_, numeric_tile_idx) in enumerate(moves):
+            neighbor[blank_space_idx, column] = numeric_tile_idx
+    
+    def reach(positions, blank_space, cost):
+        """ Return states not reached before , distance set to cost """
+        key = (numpy_pattern_rank(positions, board_size) * board_size + 
+               blank_space)
+        key, first = np.unique(key, return_index=True)
+        new = distance[key] == 0xFF
+        distance[key[new]] = cost
+        return positions[first[new]], blank_space[first[new]]
+    
+    def slides(positions, blank_space):
+        """ Yield (numeric tile index, pattern tile at it) , each column """
+        for column in range(4):
+            numeric_tile_idx = neighbor[blank_space, column]
+            ok = numeric_tile_idx >= 0
+            yield (ok, numeric_tile_idx, 
+                   positions == numeric_tile_idx[:, None])
+    
+    positions, blank_space = reach(
+        np.array([[goal_board.index(tile) for tile in pattern]], 
+                 dtype=np.int16), 
+        np.array([goal_board.index(0)], dtype=np.int16), 0)
+    cost = 0
+    
+    while len(blank_space):
+        
+        level = [(positions, blank_space)]
+        while len(blank_space):                           # cost 0 slides
+            next_states = [(positions[ok & ~hit.any(axis=1)], 
+                            numeric_tile_idx[ok & ~hit.any(axis=1)]) 
+                           for ok, numeric_tile_idx, hit 
+                           in slides(positions, blank_space)]
+            positions, blank_space = reach(
+                np.concatenate([state[0] for state in next_states]), 
+                np.concatenate([state[1] for state in next_states]), cost)
+            level.append((positions, blank_space))
+        
+        positions = np.concatenate([state[0] for state in level])
+        blank_space = np.concatenate([state[1] for state in level])
+        del level
+        
+        next_states = []                                  # cost 1 slides
+        for ok, numeric_tile_idx, hit in slides(positions, blank_space):
+            moved = ok & hit.any(axis=1)
+            next_states.append((np.where(hit[moved], 
+                                         blank_space[moved, None], 
+                                         positions[moved]), 
+                                numeric_tile_idx[moved]))
+        cost += 1
+        positions, blank_space = reach(
+            np.concatenate([state[0] for state in next_states]), 
+            np.concatenate([state[1] for state in next_states]), cost)
+    
+    table = distance.reshape(number_of_entries, board_size).min(axis=1)
+    return PatternDatabase(pattern, goal_board, bytearray(table.tobytes()))
+
+def save_pattern_database(pattern_database, path):
+    
+    write_atomically(path, [b"PDB1", 
+                            bytes([pattern_database.board_size, 
+                                   len(pattern_database.pattern)]), 
+                            bytes(pattern_database.pattern), 
+                            bytes(pattern_database.goal_board), 
+                            pattern_database.table])
+
+def load_pattern_database(path, pattern=None, goal_board=None):
+    """
+    Return PatternDatabase with table memory-mapped from file at path
+    ValueError if file is not a PDB, table is short or long, or pattern 
+        or goal board in header is not pattern or goal_board (when given)
+    """
+    mapped = None
+    try:
+        with open(path, "rb") as file:              # empty file, ValueError
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if mapped[:4] != b"PDB1" or len(mapped) < 6:
+            raise ValueError(f"{path} is not a pattern database file")
+        
+        board_size, k = mapped[4], mapped[5]
+        header_pattern = tuple(mapped[6:6 + k])
+        header_goal_board = tuple(mapped[6 + k:6 + k + board_size])
+        
+        if pattern is not None and header_pattern != tuple(pattern):
+            raise ValueError(f"{path} is PDB of pattern {header_pattern} , "
+                             f"not {tuple(pattern)}")
+        
+        if goal_board is not None and header_goal_board != tuple(goal_board):
+            raise ValueError(f"{path} is PDB of goal board "
+                             f"{header_goal_board} , not {tuple(goal_board)}")
+        
+        number_of_entries = math.perm(board_size, k)
+        if len(mapped) - 6 - k - board_size != number_of_entries:
+            raise ValueError(f"{path} table has "
+                             f"{len(mapped) - 6 - k - board_size} entries , "
+                             f"expected {number_of_entries}")
+    except ValueError:
+        if mapped is not None:
+            mapped.close()
+        raise
+    
+    return PatternDatabase(header_pattern, header_goal_board, 
+                           memoryview(mapped)[6 + k + board_size:])
+
+def load_or_build_pattern_database(pattern, goal_board, path=None):
+    """
+    Load PDB from path, if it is PDB of pattern and goal_board, else build 
+        it and save it to path (default in temporary directory, file name 
+        has pattern and goal board)
+        built by numpy_build_pattern_database , or without NumPy by 
+        build_pattern_database
+    """
+    if path is None:
+        path = os.path.join(tempfile.gettempdir(), 
+                            "pdb_puzzle_" + "_".join(map(str, pattern)) + 
+                            "_goal_" + "_".join(map(str, goal_board)) + 
+                            ".bin")
+    
+    try:
+        return load_pattern_database(path, pattern, goal_board)
+    except (FileNotFoundError, ValueError):         # missing, or not usable
+        pass
+    
+    if np is None:
+        pattern_database = build_pattern_database(pattern, goal_board)
+    else:
+        pattern_database = numpy_build_pattern_database(pattern, goal_board)
+    save_pattern_database(pattern_database, path)
+    return pattern_database
+
+class AdditivePatternDatabases:
+    
+    def __init__(self, pattern_databases):
+        self.pattern_databases = pattern_databases      # disjoint patterns
+        self.board_size = pattern_databases[0].board_size
+    """
+        Examples:
+            pdbs = AdditivePatternDatabases([pdb_1234, pdb_5678])
+            solve_8_puzzle(initial_board, heuristic=pdbs.heuristic)
+    """
+    
+    def heuristic(self, board):
+        """
+        Sum of moves of all patterns, board as tuple or list
+        """
+        position = [0] * self.board_size
+        for idx, tile in enumerate(board):
+            position[tile] = idx                       # index of every tile
+        
+        return sum(pattern_database.lookup(position) 
+                   for pattern_database in self.pattern_databases)
+
+
+"""
+    Heuristic plug-ins, with incremental update
+
+    solve_8_puzzle(initial_board, heuristic=plug_in)
+        plug_in, a function(board) returning h, or an object with
+            heuristic(board) , h of board, computed in full
+            update(board, h_cost, new_board, tile, from_idx, to_idx) , 
+                h of new_board, from h_cost of board, after tile slides 
+                from from_idx into blank space at to_idx, only the part of 
+                h that the slide can change is computed again
+    
+    ManhattanHeuristic, same h as built-in Manhattan distance, as plug-in
+    
+    LinearConflictHeuristic
+Hansson Othar, Andrew Mayer, and Moti Yung, Criticizing solutions to relaxed 
+models yields powerful admissible heuristics, Information Sciences 1992
+        two tiles in their goal row (or column), in reverse order, one of 
+            them must leave the row and come back, 2 moves more than 
+            Manhattan distance
+        per row, tiles whose goal is in that row, in order of goal columns, 
+            tiles not in longest increasing order must move out
+            conflict = 2 × (tiles - longest increasing subsequence)
+        h = Manhattan distance + conflicts of all rows and columns
+        slide up or down changes 2 rows, left or right changes 2 columns, 
+            only those are computed again
+    
+    WalkingDistanceHeuristic
+Takahashi Ken'ichiro, walking distance, 2002 (15-Puzzle heuristic)
+        vertical, ignores columns, board as n × n table, 
+            count[row][goal row] , tiles in row whose goal row is goal row
+            a move, blank space row swaps one tile with next row above or 
+            below, any tile, ignores tile columns
+        moves from every table to goal table, once by BFS, saved in dict
+        horizontal, same with columns
+        h = vertical + horizontal , each tile moves in only one of them
+        slide up or down changes only vertical walking distance, and only 
+            two cells of its count table, count tables of each board are 
+            cached, table of new board is table of board with those two 
+            cells changed, one dict lookup, no scan of board
+    
+    MaxHeuristic, max of admissible heuristics is admissible, 
+        h of each part is cached by board for incremental update
+"""
+class ManhattanHeuristic:
+    
+    def __init__(self, goal=goal_board):
+        self.distance_table, _ = build_puzzle_tables(goal)
+    
+    def heuristic(self, board):
+        return sum(self.distance_table[tile][idx] 
+                   for idx, tile in enumerate(board))
+    
+    def update(self, board, h_cost, new_board, tile, from_idx, to_idx):
+        return (h_cost - self.distance_table[tile][from_idx] 
+                       + self.distance_table[tile][to_idx])
+
+class LinearConflictHeuristic(ManhattanHeuristic):
+    
+    def __init__(self, goal=goal_board):
+        super().__init__(goal)
+        self.width = math.isqrt(len(goal))
+        self.goal_row_col = {tile: divmod(idx, self.width) 
+                             for idx, tile in enumerate(goal)}
+        self.line_conflicts = {}        # goal positions in line : conflict
+    
+    def conflict(self, goal_positions):
+        """
+        2 × (number of tiles - longest increasing subsequence), 
+            goal_positions, goal column (or row) of tiles in line, in order
+        """
+        if goal_positions not in self.line_conflicts:
+            longest = [1] * len(goal_positions)
+            for i in range(len(goal_positions)):
+                for j in range(i):
+                    if goal_positions[j] < goal_positions[i]:
+                        longest[i] = max(longest[i], longest[j] + 1)
+            self.line_conflicts[goal_positions] = 2 * (
+                len(goal_positions) - max(longest, default=0))
+        return self.line_conflicts[goal_positions]
+    
+    def row_conflict(self, board, row):
+        goal_columns = []
+        for idx in range(row * self.width, (row + 1) * self.width):
+            if board[idx] and self.goal_row_col[board[idx]][0] == row:
+                goal_columns.append(self.goal_row_col[board[idx]][1])
+        return self.conflict(tuple(goal_columns))
+    
+    def column_conflict(self, board, column):
+        goal_rows = []
+        for idx in range(column, len(board), self.width):
+            if board[idx] and self.goal_row_col[board[idx]][1] == column:
+                goal_rows.append(self.goal_row_col[board[idx]][0])
+        return self.conflict(tuple(goal_rows))
+    
+    def heuristic(self, board):
+        return (super().heuristic(board) + 
+                sum(self.row_conflict(board, line) + 
+                    self.column_conflict(board, line) 
+                    for line in range(self.width)))
+    
+    def update(self, board, h_cost, new_board, tile, from_idx, to_idx):
+        
+        h_cost = super().update(board, h_cost, new_board, tile, from_idx, 
+                                to_idx)
+        from_row, from_column = divmod(from_idx, self.width)
+        to_row, to_column = divmod(to_idx, self.width)
+        
+        if from_row != to_row:                     # up or down, two rows
+            for row in (from_row, to_row):
+                h_cost += (self.row_conflict(new_board, row) - 
+                           self.row_conflict(board, row))
+        else:                                 # left or right, two columns
+            for column in (from_column, to_column):
+                h_cost += (self.column_conflict(new_board, column) - 
+                           self.column_conflict(board, column))
+        return h_cost
+
+def walking_distance_table(goal, line_of_idx):
+    """
+    Return dict, count table (tuple, n × n) : moves to goal count table
+        line_of_idx, row of index (vertical) or column of index (horizontal)
+    """
+    width = math.isqrt(len(goal))
+    goal_counts = [0] * (width * width)
+    for idx, tile in enumerate(goal):
+        if tile:
+            line = line_of_idx(idx)
+            goal_counts[line * width + line] += 1
+    goal_counts = tuple(goal_counts)
+    
+    table = {goal_counts: 0}
+    frontier = deque([goal_counts])
+    
+    while frontier:
+        counts = frontier.popleft()
+        
+        blank_line = [sum(counts[line * width:(line + 1) * width]) 
+                      for line in range(width)].index(width - 1)
+        
+        for line in (blank_line - 1, blank_line + 1):
+            if not 0 <= line < width:
+                continue
+            for goal_line in range(width):    # tile of any goal line moves
+                if counts[line * width + goal_line]:
+                    new_counts = list(counts)
+                    new_counts[line * width + goal_line] -= 1
+                    new_counts[blank_line * width + goal_line] += 1
+                    new_counts = tuple(new_counts)
+                    if new_counts not in table:
+                        table[new_counts] = table[counts] + 1
+                        frontier.append(new_counts)
+    
+    return table
+
+class WalkingDistanceHeuristic:
+    
+    def __init__(self, goal=goal_board, cache_size=1000000):
+        self.width = width = math.isqrt(len(goal))
+        goal_idx = {tile: idx for idx, tile in enumerate(goal)}
+        self.goal_row = {tile: idx // width for tile, idx in goal_idx.items()}
+        self.goal_column = {tile: idx % width 
+                            for tile, idx in goal_idx.items()}
+        
+        # goal lines are numbered by position in goal, same table as goal
+        self.vertical_table = walking_distance_table(
+            goal, lambda idx: idx // width)
+        self.horizontal_table = walking_distance_table(
+            goal, lambda idx: idx % width)
+        
+        self.cache_size = cache_size
+        self.counts = {}     # board : (vertical, horizontal) count tables
+    
+    def vertical_counts(self, board):
+        counts = [0] * (self.width * self.width)
+        for idx, tile in enumerate(board):
+            if tile:
+                counts[idx // self.width * self.width + 
+                       self.goal_row[tile]] += 1
+        return tuple(counts)
+    
+    def horizontal_counts(self, board):
+        counts = [0] * (self.width * self.width)
+        for idx, tile in enumerate(board):
+            if tile:
+                counts[idx % self.width * self.width + 
+                       self.goal_column[tile]] += 1
+        return tuple(counts)
+    
+    def vertical(self, board):
+        return self.vertical_table[self.vertical_counts(board)]
+    
+    def horizontal(self, board):
+        return self.horizontal_table[self.horizontal_counts(board)]
+    
+    def cache(self, board, counts):
+        if len(self.counts) >= self.cache_size:
+            self.counts.clear()
+        self.counts[board] = counts
+    
+    def heuristic(self, board):
+        board = tuple(board)
+        vertical_counts = self.vertical_counts(board)
+        horizontal_counts = self.horizontal_counts(board)
+        self.cache(board, (vertical_counts, horizontal_counts))
+        return (self.vertical_table[vertical_counts] + 
+                self.horizontal_table[horizontal_counts])
+    
+    def moved(self, counts, from_line, to_line, goal_line):
+        """ Count table after one tile of goal_line moves between lines """
+        counts = list(counts)
+        counts[from_line * self.width + goal_line] -= 1
+        counts[to_line * self.width + goal_line] += 1
+        return tuple(counts)
+    
+    def update(self, board, h_cost, new_board, tile, from_idx, to_idx):
+        
+        counts = self.counts.get(board)
+        if counts is None:
+            return self.heuristic(new_board)        # not cached, full h
+        
+        vertical_counts, horizontal_counts = counts
+        from_row, from_column = divmod(from_idx, self.width)
+        to_row, to_column = divmod(to_idx, self.width)
+        
+        if from_row != to_row:            # up or down, only vertical table
+            vertical_counts = self.moved(vertical_counts, from_row, to_row, 
+                                         self.goal_row[tile])
+        else:                          # left or right, only horizontal table
+            horizontal_counts = self.moved(horizontal_counts, from_column, 
+                                           to_column, self.goal_column[tile])
+        
+        self.cache(tuple(new_board), (vertical_counts, horizontal_counts))
+        return (self.vertical_table[vertical_counts] + 
+                self.horizontal_table[horizontal_counts])
+
+class MaxHeuristic:
+    
+    def __init__(self, heuristics, cache_size=1000000):
+        self.heuristics = heuristics
+        self.cache_size = cache_size
+        self.parts = {}                  # board : h of each heuristic, cached
+    
+    def heuristic(self, board):
+        board = tuple(board)
+        if len(self.parts) >= self.cache_size:
+            self.parts.clear()
+        self.parts[board] = [part.heuristic(board) for part in self.heuristics]
+        return max(self.parts[board])
+    
+    def update(self, board, h_cost, new_board, tile, from_idx, to_idx):
+        
+        parts = self.parts.get(board)
+        if parts is None:
+            return self.heuristic(new_board)        # not cached, full h
+        
+        new_board = tuple(new_board)
+        if len(self.parts) >= self.cache_size:
+            self.parts.clear()
+        self.parts[new_board] = [
+            part.update(board, part_h_cost, new_board, tile, from_idx, to_idx) 
+            for part, part_h_cost in zip(self.heuristics, parts)]
+        return max(self.parts[new_board])
+
+
+"""
+    Benchmark of heuristics, same boards, nodes expanded and time of A*
+        boards, from goal board by scramble_moves random slides, 
+        random.Random(seed), same boards every run
+"""
+import random
+
+def benchmark_boards(number_of_boards=20, scramble_moves=200, seed=8, 
+                     goal=goal_board):
+    
+    _, goal_moves_table = build_puzzle_tables(goal)
+    generator = random.Random(seed)
+    boards = []
+    
+    for _ in range(number_of_boards):
+        board = list(goal)
+        for _ in range(scramble_moves):
+            blank_space_idx = board.index(0)
+            _, numeric_tile_idx = generator.choice(
+                goal_moves_table[blank_space_idx])
+            board[blank_space_idx] = board[numeric_tile_idx]
+            board[numeric_tile_idx] = 0
+        boards.append(tuple(board))
+    
+    return boards
+
+def benchmark_heuristics(boards, heuristics, goal=goal_board):
+    """
+    heuristics, dict name : plug-in (None for built-in Manhattan distance)
+    Print, for each heuristic, total nodes expanded, total time, and 
+        total moves (same for all, if all are admissible)
+    """
+    print(f"\n {'heuristic':<20} {'expanded':>10} {'time (s)':>10}", 
+          f"{'moves':>7}")
+    
+    for name, heuristic in heuristics.items():
+        
+        total_expanded, total_time, total_moves = 0, 0.0, 0
+        
+        for board in boards:
+            result = solve_8_puzzle(board, goal=goal, heuristic=heuristic, 
+                                    quiet=True)
+            total_expanded += result.nodes_expanded
+            total_time += result.elapsed_time
+            total_moves += result.length
+        
+        print(f" {name:<20} {total_expanded:>10} {total_time:>10.3f}", 
+              f"{total_moves:>7}")
+
+
+"""
+    Distance oracle, for 8-Puzzle (and smaller), every solvable board
+    
+    One backward BFS from goal board, over all 9!/2 = 181440 boards that 
+        can reach goal board, saves for each board
+            distance, optimal number of moves to goal board
+            best move, a move to a board at distance - 1
+    
+    Indexed by rank of board permutation (Lehmer code), 0 to 9! - 1 , 
+        one byte per board, 9! = 362880 bytes
+            byte = distance × 4 + best move code , distance at most 31
+            best move code , 0 up , 1 down , 2 left , 3 right
+            0xFF , board can not reach goal board
+    
+    Solve is no search , follow best move from initial board, 
+        O(solution length) table reads
+    
+    On-disk format, b"ORC1" , board size (1 byte) , goal board (N bytes) , 
+        table (N! bytes) , memory-mapped when loaded
+    get_distance_oracle, loads (or builds and saves) a table the first time 
+        a goal board is asked for, later calls reuse it
+"""
+move_codes = {"up": 0, "down": 1, "left": 2, "right": 3}
+                                          # opposite move , code ^ 1
+def rank_board(board):
+    size = len(board)
+    rank = 0
+    for i in range(size - 1):
+        smaller_after = 0
+        for j in range(i + 1, size):
+            if board[j] < board[i]:
+                smaller_after += 1
+        rank = rank * (size - i) + smaller_after
+    return rank
+
+class DistanceOracle:
+    
+    def __init__(self, goal_board, table):
+        self.goal_board = tuple(goal_board)
+        self.table = table      # bytearray, or memoryview of mmap from disk
+        _, self.moves_table = build_puzzle_tables(goal_board)
+    
+    def distance(self, board):
+        """ Optimal number of moves to goal board, None if not reachable """
+        entry = self.table[rank_board(board)]
+        return None if entry == 0xFF else entry >> 2
+    
+    def solution(self, board):
+        """
+        Return list of (board, move) from board to goal board, 
+            None if board can not reach goal board
+        """
+        if self.distance(board) is None:
+            return None
+        
+        board = tuple(board)
+        solution = [(board, None)]
+        
+        while board != self.goal_board:
+            
+            best_move = self.table[rank_board(board)] & 3
+            blank_space_idx = board.index(0)
+            
+            for move_name, numeric_tile_idx in self.moves_table[blank_space_idx]:
+                if move_codes[move_name] == best_move:
+                    break
+            
+            new_board = list(board)
+            new_board[blank_space_idx] = new_board[numeric_tile_idx]
+            new_board[numeric_tile_idx] = 0
+            board = tuple(new_board)
+            
+            solution.append((board, move_name))
+            
+        return solution
+
+def build_distance_oracle(goal_board):
+    """
+    Backward BFS from goal_board, Return DistanceOracle, table as bytearray
+    3 × 3 goal board only , table of 4 × 4 would be 16! bytes
+    """
+    check_oracle_goal(goal_board)
+    
+    _, moves_table = build_puzzle_tables(goal_board)
+    
+    table = bytearray(b"\xff") * factorial(len(goal_board))
+    table[rank_board(goal_board)] = 0               # distance 0, goal board
+    
+    frontier = deque([goal_board])
+    
+    while frontier:
+        
+        board = frontier.popleft()
+        distance = table[rank_board(board)] >> 2
+        blank_space_idx = board.index(0)
+        
+        for move_name, numeric_tile_idx in moves_table[blank_space_idx]:
+            
+            new_board = list(board)
+            new_board[blank_space_idx] = new_board[numeric_tile_idx]
+            new_board[numeric_tile_idx] = 0
+            new_board = tuple(new_board)
+            
+            rank = rank_board(new_board)
+            
+            if table[rank] == 0xFF:                        # not yet reached
+                # best move from new_board , back to board , opposite move
+                table[rank] = (((distance + 1) << 2) | 
+                               (move_codes[move_name] ^ 1))
+                frontier.append(new_board)
+    
+    return DistanceOracle(goal_board, table)
+
+def check_oracle_goal(goal_board):
+    
+    if len(goal_board) != 9:
+        raise ValueError(f"distance oracle is for 8-Puzzle (3 × 3) only , "
+                         f"goal board has {len(goal_board)} cells")
+
+def save_distance_oracle(distance_oracle, path):
+    
+    write_atomically(path, [b"ORC1", 
+                            bytes([len(distance_oracle.goal_board)]), 
+                            bytes(distance_oracle.goal_board), 
+                            distance_oracle.table])
+
+def load_distance_oracle(path, goal_board=None):
+    """
+    Return DistanceOracle with table memory-mapped from file at path
+    ValueError if file is not a distance oracle, table is short or long, 
+        or goal board in header is not goal_board (when given)
+    """
+    mapped = None
+    try:
+        with open(path, "rb") as file:              # empty file, ValueError
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if mapped[:4] != b"ORC1" or len(mapped) < 5:
+            raise ValueError(f"{path} is not a distance oracle file")
+        
+        size = mapped[4]
+        header_goal_board = tuple(mapped[5:5 + size])
+        
+        if goal_board is not None and header_goal_board != tuple(goal_board):
+            raise ValueError(f"{path} is distance oracle of goal board "
+                             f"{header_goal_board} , not {tuple(goal_board)}")
+        
+        if len(mapped) - 5 - size != factorial(size):
+            raise ValueError(f"{path} table has {len(mapped) - 5 - size} "
+                             f"entries , expected {factorial(size)}")
+    except ValueError:
+        if mapped is not None:
+            mapped.close()
+        raise
+    
+    return DistanceOracle(header_goal_board, memoryview(mapped)[5 + size:])
+
+distance_oracles = {}                 # goal board : DistanceOracle, loaded
+
+def get_distance_oracle(goal_board, path=None):
+    """
+    Return DistanceOracle for goal_board, loaded on first use, 
+        from path (default in temporary directory), built if file missing 
+        or file is not of goal_board , ValueError if goal board is not 3 × 3
+    """
+    check_oracle_goal(goal_board)
     
-    def __init__(self, board, parent=None, move=None, g_cost=0):
-        self.board = board                  # Tuple representing the 3x3 board
-        self.parent = parent
-        self.move = move
-        self.g_cost = g_cost            # Cost from start node to current node
-    """        
-        __init__(self, board, parent=None, move=None, g_cost=0)        
-        default values are assigned when values not passed in as arguments
+    if goal_board not in distance_oracles:
         
-        Examples:
-            PuzzleState(initial_board)
-            that is
-            PuzzleState(self, board = initial_board)
-                self, is the invoking object
-                board = initial_board
-                parent = None , initial_board has no earlier state
-                move = None , no moves made to get to initial_board state
-                g_cost = 0 , as it is ininital state, 0 cost to reach the node
-        
-        For next state(or move) PuzzleState objects
-        
-            PuzzleState(tuple(new_board), self, move_name, self.g_cost + 1)
-            that is
-            PuzzleState(self", board = tuple(new_board), parent = self', 
-                        move = move_name, g_cost = self'.g_cost + 1)
-                
-                self" and self', both objects of PuzzleState
-                
-                self" (child) is the next state (or move) of self' (parent)
-                
-                self", is the invoking object
-                board = tuple(new_board)
-                parent = self', self' set as parent of self"
-                                                       self".parent = self'
-                move = move_name , is one of "up", "down", "right", or "left"
-                g_cost = self'.g_cost + 1
-                    child self" cost set to one more than parent self' cost
-                    self".g_cost = self'.g_cost + 1
-    """            
-
-    """ Operator overloading
-        __lt__ method used to define the behavior of the less than operator (<)
-        so that objects(values) of class PuzzleState can be compared
-        Is self(object) f_cost value < other(object) f_cost value ? """
-    def __lt__(self, other): 
-        # For priority queue comparison of f_cost, f_cost = g_cost + h_cost
-        self_f_cost = self.g_cost + self.manhattan_distance()
-        other_f_cost = other.g_cost + other.manhattan_distance()
-        
-        return self_f_cost < other_f_cost    
-
-    """ Operator overloading 
-        __eq__ method defines behavior of equality operator ==
-        Is self(object) board setting == other(object) board setting ? """
-    def __eq__(self, other):
-        return self.board == other.board
-
-    """ Operator overloading
-        __hash__ method is used to define a custom hash value for an object        
-        When __eq__ is overloaded, __hash__ also has to be overloaded
-            to maintain integrity of the hash value, both operating on board"""
-    def __hash__(self):
-        return hash(self.board)
-
-    """ Heuristic, h , dM of entire board (excluding blank space), 
-        Returns sum of Manhattan distances of misplaced tiles """
-    def manhattan_distance(self):
-
-        manhattan_distance = 0                
-
-        for i in range(9):                        # For all tiles in 3×3 board 
-             # self.board[i] has numeric value of tile
-            if self.board[i] != 0:                # if it is not a blank space
-                
-                goal_row, goal_column = divmod(i, 3)
-                
-                curr_row, curr_col = divmod(self.board[i], 3)                
-                                          
-                horiz_dist = abs(curr_col - goal_column)  # abs( column diff )
-                vert_dist = abs(curr_row - goal_row)      # abs( row diff )
-                
-                # Sum over all numeric tiles
-                # manhattan_distance = manhattan_distance + dM(current tile)
-                manhattan_distance +=  horiz_dist + vert_dist
-                
-        return manhattan_distance
+        if path is None:
+            path = os.path.join(tempfile.gettempdir(), "oracle_puzzle_" + 
+                                "_".join(map(str, goal_board)) + ".bin")
+        
+        try:
+            distance_oracles[goal_board] = load_distance_oracle(path, 
+                                                                goal_board)
+        except (FileNotFoundError, ValueError):     # missing, or not usable
+            distance_oracles[goal_board] = build_distance_oracle(goal_board)
+            save_distance_oracle(distance_oracles[goal_board], path)
+    
+    return distance_oracles[goal_board]
 
-    def get_blank_space_position(self):        
-        return self.board.index(0)                     # Index of blank space
+def solve_by_distance_oracle(initial_board, goal_board, quiet=False):
     
-    def slide_numeric_tile_into_blank_space(self, board, index1, index2):
-        """
-        Swap values in list at specified indices
-        Slide/Swap neighbor numeric tile with blank blank space in board 
+    distance_oracle = get_distance_oracle(goal_board)
+    
+    start_time = time.perf_counter()
+    solution = distance_oracle.solution(initial_board)
+    
+    if solution is None:
+        if not quiet:
+            print("\n Solution could not be found, goal board not reachable")
+        return SolverResult(None, 0, 0, time.perf_counter() - start_time)
+    
+    # (board, move, g_cost, h_cost) , h_cost is exact distance
+    path = [(board, move, g_cost, len(solution) - 1 - g_cost) 
+            for g_cost, (board, move) in enumerate(solution)]
+    
+    result = SolverResult(path, 0, 0, time.perf_counter() - start_time)
+    
+    if not quiet:
+        sys.stdout.write(result.render())            # no state explored
+    
+    return result
 
-            board passed here is a list, and not a tuple
-            
-                        (position of the: )
-            index1, first element to be swapped
-            index2, second element to be swapped
-            
-            a, b = b, a
-        """
-        board[index1], board[index2] = board[index2], board[index1]
+"""
+    Anytime Repairing A*, ARA*
+
+Likhachev Maxim, Geoffrey Gordon, and Sebastian Thrun, ARA*: Anytime A* with 
+Provable Bounds on Sub-Optimality, NIPS 2003
+    
+    Weighted A*, f = g + w × h , w > 1 , h made w times more important, 
+        search goes deeper faster, fewer states explored, 
+        solution cost at most w × optimal (h admissible)
+    
+    ARA* runs weighted A* again and again with smaller w, each run reuses 
+        g costs of previous run, only states whose g cost went down are 
+        expanded again
+    
+        g_cost[board], best g cost found so far, parent[board], its parent
+        open , boards to expand, priority g + w × h
+        closed , boards expanded in this run, not expanded again in it
+        incons , closed boards whose g cost went down, they wait for next run
+        
+        improve_path, expand lowest priority board of open, 
+            till goal g cost <= lowest priority in open
+        after each run
+            bound , min(w, g_cost[goal] / min (g + h) of open and incons)
+                solution cost <= bound × optimal cost
+            w lowered, open = open + incons, priorities with new w, 
+                closed and incons emptied
+    
+    w = 1 run gives optimal solution (bound 1), deadline may stop earlier, 
+        last solution found is kept
+"""
+def ara_star_search(initial_board, goal, weights=(3, 2, 1.5, 1.2, 1), 
+                    deadline=None, heuristic=None, width=None):
+    """
+    Yield (solution boards, weight, bound, number expanded) after every run
+        that finds a solution
+    deadline, seconds from start, None for no deadline, checked every 
+        1024 expanded boards
+    heuristic, plug-in as for solve_8_puzzle, None for Manhattan distance
+    width, number of columns, None for n of n x n goal board
+    """
+    start_time = time.perf_counter()
+    
+    _, moves_table = build_puzzle_tables(goal, width)
+    heuristic_of = (getattr(heuristic, "heuristic", heuristic) or 
+                    partial(manhattan_distance, goal=goal, width=width))
+    
+    h_cost = {}                                  # h of board, computed once
+    def cached_h(board):
+        if board not in h_cost:
+            h_cost[board] = heuristic_of(board)
+        return h_cost[board]
+    
+    g_cost = {initial_board: 0}
+    parent = {initial_board: None}
+    open_boards = {initial_board}
+    incons = set()
+    tie_breaker = count(0, -1)
+    number_expanded = 0
+    
+    for weight in weights:
         
+        # open_list entry (priority, tie_breaker, board, g_cost at push)
+        open_list = [(g_cost[board] + weight * cached_h(board), 
+                      next(tie_breaker), board, g_cost[board]) 
+                     for board in open_boards]
+        heapq.heapify(open_list)
+        closed = set()
         
-    def get_possible_moves_into_blank_space(self):
-        """
-        Finds neighbors of blank space (at most four neighbors)
-        Return list of new states (new PuzzleState objects) where 
-            new state is numeric tile moving from neighbor into blank space loc
-        """    
-        new_states = []
-        blank_space_idx = self.get_blank_space_position()  # blank space index
-        blank_space_row, blank_space_column = divmod(blank_space_idx, 3) 
-                  # row and column of blank space
-        """
-        Neighbors of, with respect to blank space location could be:
-            up: row -1 , down: row +1 , no change in (same) column: 0
-            no change in (same) row: 0, left: column -1 , right: column +1
-        """
-        #                  r, c              r, c
-        moves = {  "up": (-1, 0),  "down": (+1, 0), 
-                 "left": (0, -1), "right": (0, +1)}
-
-        for move_name, (dr, dc) in moves.items(): 
-                                                # for all neighbors (or moves)
-            new_row = blank_space_row + dr      # add dr, change in row
-            new_col = blank_space_column + dc   # add dc, change in column
-            
-            """
-            if both new row and column index are in 3×3 board, 
-                then
-                    create a copy of board, new board, so that
-                    neighbor and blank space can be swapped in new board, and
-                    a new PuzzleState object with new board can be created 
-                    append new PuzzleState to list of possible new_states
-            """
-            if 0 <= new_row < 3 and 0 <= new_col < 3:      
-                
-                new_board = list(self.board)   # new_board, a list not a tuple
-                
-                # Numeric tile index, and after slide where blank space appears
-                numeric_tile_idx = new_row * 3 + new_col                             
-                
-                self.slide_numeric_tile_into_blank_space(new_board, 
-                                                         blank_space_idx, 
-                                                         numeric_tile_idx)
+        while open_list:                                      # improve_path
+            
+            priority, _, board, board_g_cost = open_list[0]
+            
+            if board not in open_boards or board_g_cost != g_cost[board]:
+                heapq.heappop(open_list)                      # stale entry
+                continue
+            
+            if g_cost.get(goal, math.inf) <= priority:
+                break                          # no better solution in open
+            
+            heapq.heappop(open_list)
+            open_boards.discard(board)
+            closed.add(board)
+            number_expanded += 1
+            
+            if (deadline is not None and number_expanded % 1024 == 0 and 
+                    time.perf_counter() - start_time > deadline):
+                return                                    # deadline passed
+            
+            blank_space_idx = board.index(0)
+            
+            for _, numeric_tile_idx in moves_table[blank_space_idx]:
                 
-                """    Create new PuzzleState
-                                  PuzzleState(tuple(new_board), 
-                                              self, 
-                                              move_name,
-                                              self.g_cost + 1)
-                       and append to list"""
-                new_states.append(PuzzleState(board=tuple(new_board), 
-                                              parent=self, 
-                                              move=move_name, 
-                                              g_cost=self.g_cost + 1))
+                new_board = list(board)
+                new_board[blank_space_idx] = new_board[numeric_tile_idx]
+                new_board[numeric_tile_idx] = 0
+                new_board = tuple(new_board)
                 
-        return new_states    
+                if board_g_cost + 1 < g_cost.get(new_board, math.inf):
+                    
+                    g_cost[new_board] = board_g_cost + 1
+                    parent[new_board] = board
+                    
+                    if new_board in closed:
+                        incons.add(new_board)      # expanded again next run
+                    else:
+                        open_boards.add(new_board)
+                        heapq.heappush(open_list, (
+                            board_g_cost + 1 + weight * cached_h(new_board), 
+                            next(tie_breaker), new_board, board_g_cost + 1))
+        
+        if goal in g_cost:
+            
+            lowest_f_cost = min((g_cost[board] + cached_h(board) 
+                                 for board in open_boards | incons), 
+                                default=g_cost[goal])
+            bound = max(1, min(weight, g_cost[goal] / max(lowest_f_cost, 1)))
+            
+            solution = [goal]
+            while parent[solution[-1]] is not None:
+                solution.append(parent[solution[-1]])
+            
+            yield solution[::-1], weight, bound, number_expanded
+        
+        if deadline is not None and time.perf_counter() - start_time > deadline:
+            return                                        # deadline passed
+        
+        open_boards |= incons
+        incons = set()
+
+def board_path(solution, heuristic=None, width=None):
+    """
+    Return list of (board, move, g_cost, h_cost) of solution (list of board 
+        tuples, last is goal board), moves found from blank space indices, 
+        h_cost of heuristic plug-in, or Manhattan distance
+    """
+    goal = solution[-1]
+    _, moves_table = build_puzzle_tables(goal, width)
+    heuristic_of = (getattr(heuristic, "heuristic", heuristic) or 
+                    partial(manhattan_distance, goal=goal, width=width))
+    path = []
+    for g_cost, board in enumerate(solution):
+        move = None
+        if path:
+            move = [move_name for move_name, numeric_tile_idx 
+                    in moves_table[path[-1][0].index(0)] 
+                    if numeric_tile_idx == board.index(0)][0]
+        path.append((board, move, g_cost, heuristic_of(board)))
+    return path
+
+def solve_by_ara_star(initial_board, goal, weight, deadline, quiet=False, 
+                      heuristic=None, width=None):
+    """
+    ARA* from weight down to 1, print every solution found, and print path 
+        of the last (best) solution
+    """
+    weights = [weight]         # weight, then halfway to 1 each run, then 1
+    while weights[-1] > 1.2:
+        weights.append(round(1 + (weights[-1] - 1) / 2, 3))
+    if weights[-1] != 1:
+        weights.append(1)
+    
+    start_time = time.perf_counter()
+    best = None
     
-def print_solution(current_state, explored_set):
+    for solution, weight, bound, number_expanded in ara_star_search(
+            initial_board, goal, weights, deadline, heuristic, width):
+        
+        best = solution, number_expanded
+        
+        if not quiet:
+            print(f"\n w = {weight:g} , moves = {len(solution) - 1} ,", 
+                  f"suboptimality bound = {bound:.3f} ,", 
+                  f"expanded = {number_expanded} ,", 
+                  f"time = {time.perf_counter() - start_time:.3f} s")
+    
+    if best is None:
+        if not quiet:
+            print("\n Solution could not be found, before deadline")
+        return SolverResult(None, 0, None, time.perf_counter() - start_time, 
+                            width)
+    
+    solution, number_expanded = best
+    
+    result = SolverResult(board_path(solution, heuristic, width), 
+                          number_expanded, None, 
+                          time.perf_counter() - start_time, width)
+    
+    if not quiet:
+        sys.stdout.write(result.render_path())
+    
+    return result
+
+
+"""
+    Batch solve, many boards, all CPU cores
+    
+    ProcessPoolExecutor, one Python process per core (by default), each 
+        worker process has its own tables and globals, so A* runs in 
+        parallel, not limited by GIL (global interpreter lock)
+    
+    batch_worker_initializer, runs once in every worker, saves goal board 
+        of the batch and builds its tables, and heuristic plug-in from 
+        heuristic_factory, reused by all boards that worker solves
+        heuristic_factory, picklable, sent to workers, a class (or module 
+            level function) called with goal board, LinearConflictHeuristic , 
+            WalkingDistanceHeuristic , None for Manhattan distance
+        a plug-in is built in each worker, its caches (line conflicts, 
+            walking distance table) are of that worker only
     
-    print("\n Solution found")    
+    Boards are sent in chunks of chunk_size boards, one task per chunk, 
+        fewer tasks, less pickling and inter-process overhead per board
+    Bounded window, at most 2 × workers chunks submitted and not yet done, 
+        a new chunk is read and submitted when one finishes, boards read 
+        lazily from a file of any size, memory bounded by the window, and 
+        every worker has a next chunk queued when it finishes one
+    wait(FIRST_COMPLETED), chunks are yielded back as soon as they finish, 
+        in any order, not in the order of boards
+    
+    Result of every board, (board, moves, number explored)
+        moves, list of moves of blank space, None if board not solvable
+    
+    Worker processes import this file, run it under 
+        if __name__ == "__main__":
+    on platforms that spawn (not fork) processes, Windows and macOS
+"""
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+batch_goal = goal_board                    # goal board of a worker process
+batch_heuristic = None                # heuristic plug-in of a worker process
+
+def batch_worker_initializer(goal, heuristic_factory=None):
     
-    print("\n Number of states explored by A* =", len(explored_set))
+    global batch_goal, batch_heuristic
+    batch_goal = goal
+    build_puzzle_tables(goal)            # tables, built once in each worker
     
-    solution = []
+    batch_heuristic = (None if heuristic_factory is None 
+                       else heuristic_factory(goal))  # once in each worker
+
+def solve_board(board):
     """
-    Empty list to save (state, move, cost, and heuristic) for all 
-    moves(states) in the sequence they are encountered            
-    from goal state back to start state, bottom up traversal
+    Return (board, moves, number explored), no print, tables already set
+        A* of search_core, board rejected by inversion parity, moves None
+    """
+    search_result = search_core.astar_search(
+        search_core.NPuzzleProblem(board, batch_goal, 
+                                   heuristic=batch_heuristic))
+    
+    return board, search_result.solution, search_result.nodes_expanded
+
+def solve_board_chunk(boards):
     
-    while current_state is not None, 
-        that is traversal from child to root nood is not complete
-        till initial_board parent = None is not reached
+    return [solve_board(board) for board in boards]
+
+def read_boards(path):
     """
-    while current_state: 
-        solution.append((current_state.board, 
-                         current_state.move, 
-                         current_state.g_cost, 
-                         current_state.manhattan_distance()))
-        current_state = current_state.parent 
-        """
-        reassign current_state to parent of current state
-            from state(or move) at t + 1 to state(or move) at t
-        moving back/up the solution tree one step
-        """
+    Yield board tuples from text file at path, one board per line, 
+        tiles separated by spaces or commas, blank lines and # lines skipped
     """
-    solution (result) of traversal saved as list from goal to initial            
-    list[::-1] , ::-1 , gives list in reverse order
-    """ 
-    solution = solution[::-1]    # reverse list , now from start to goal state
+    with open(path) as file:
+        for line in file:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield tuple(int(tile) 
+                            for tile in line.replace(",", " ").split())
+
+def board_chunks(boards, chunk_size):
+    """ Yield lists of chunk_size board tuples, last list may be shorter """
+    boards = iter(boards)
+    while True:
+        chunk = [tuple(board) for board in islice(boards, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+def solve_boards(boards, goal=goal_board, max_workers=None, chunk_size=64, 
+                 heuristic_factory=None):
+    """
+    boards, iterable of board tuples, or path of file read by read_boards
+    max_workers, number of worker processes, None for number of CPU cores
+    heuristic_factory, heuristic_factory(goal) builds heuristic plug-in, 
+        once in each worker, None for Manhattan distance
+    Yield (board, moves, number explored) as each chunk of boards finishes
+    """
+    if isinstance(boards, str):
+        boards = read_boards(boards)
     
-    print("\n Number of steps in solution:", len(solution))
-    print("\n Moves with respect to blank space, 0 ")
-    print("\n Start state, move = None ")
+    window = 2 * (max_workers or os.cpu_count() or 1)   # chunks in flight
+    chunks = board_chunks(boards, chunk_size)
     
-    for step_number, (board, move, cost, heuristic) in enumerate(solution):
-                        
-        print("-"*42, f"\n Step: {step_number} , Move: {move} , ", end="")
-        print(f"g_cost: {cost} + h: {heuristic}\n", "-"*13)
+    with ProcessPoolExecutor(max_workers=max_workers, 
+                             initializer=batch_worker_initializer, 
+                             initargs=(goal, heuristic_factory)) as executor:
         
-        for i in range(0, 9, 3):
-            print(" |", board[i], "|", board[i+1], "|", board[i+2], 
-                  "|\n", "-"*13)
+        pending = {executor.submit(solve_board_chunk, chunk) 
+                   for chunk in islice(chunks, window)}
         
-from math import factorial
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                for chunk in islice(chunks, 1):       # refill, one for one
+                    pending.add(executor.submit(solve_board_chunk, chunk))
+                
+                yield from future.result()
+
+def batch_solve_8_puzzle(boards, goal=goal_board, max_workers=None, 
+                         chunk_size=64, heuristic_factory=None):
+    """
+    Solve all boards with solve_boards, print one line per board and 
+        throughput , boards solved per second
+    """
+    start_time = time.perf_counter()
+    number_boards = number_solved = 0
+    
+    for board, moves, number_explored in solve_boards(
+            boards, goal, max_workers, chunk_size, heuristic_factory):
+        number_boards += 1
+        
+        if moves is None:
+            print(f" {board} , not solvable")
+        else:
+            number_solved += 1
+            print(f" {board} , moves = {len(moves)} ,", 
+                  f"explored = {number_explored}")
+    
+    elapsed_time = time.perf_counter() - start_time
+    
+    print(f"\n Boards = {number_boards} , solved = {number_solved} ,", 
+          f"time = {elapsed_time:.2f} s ,", 
+          f"throughput = {number_solved / elapsed_time:.1f} boards/s")
+
+
+
+"""
+    HDA* , Hash Distributed A* , A* on all CPU cores
+Kishimoto Akihiro, Alex Fukunaga, and Adi Botea, Scalable, parallel 
+best-first search for optimal sequential planning, ICAPS 2009
+Burns Ethan, et al., Best-first heuristic search for multicore machines, 
+Journal of Artificial Intelligence Research 2010
     
-def solve_8_puzzle(initial_board):
+    Every board is owned by one worker process, owner = hash(board) % workers
+        owner keeps open list and best g_cost of its boards, no locks, 
+        each board is expanded only by its owner
+    Neighbors owned by another worker are sent to it, in batches of 
+        batch_size, over the owner's multiprocessing Queue (its inbox)
+        a batch amortizes pickling and queue overhead over many boards
+    Hash, packed board multiplied by a 64 bit odd constant (Fibonacci 
+        hashing), high bits spread boards evenly over workers
     
-    print("\n Number of states in 8-Puzzle problem = 9! =", factorial(9))
+    Termination
+        goal popped by a worker, cost C, is sent to main process, main 
+            sends incumbent C to all workers, nodes with f >= C are pruned
+        a worker is idle when its open list has no node with f < C
+        search is done when all workers are idle and no batch is in flight
+            main sends probe to all workers, each replies 
+                (idle, batches sent, batches received)
+            two probes in a row with all idle, same counts, and 
+                sent == received , no worker did anything between them, 
+                and nothing is in flight (four counter method)
+Mattern Friedemann, Algorithms for distributed termination detection, 
+Distributed Computing 1987
+        C is optimal, every node with f < C has been expanded by its owner
     
-    initial_state = PuzzleState(initial_board)     # Create PuzzleState object
+    Solution path, each owner saves parent board of its boards, main asks 
+        owner of goal for its parent, then owner of parent, ... to start
+    
+    Speedup grows with number of cores on hard 15-Puzzle boards, workers 
+        are processes, no shared GIL, for easy boards process start, queue 
+        overhead, and nodes expanded before incumbent is known, are more 
+        than the search itself
+"""
+import multiprocessing
+import queue
+
+def hda_owner(board, workers):
+    """ Owner worker of packed board, Fibonacci hashing """
+    return (((board * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32) % workers
+
+class HDAStarWorker:
     
-    open_list = []                                        # for priority queue
-    heapq.heappush(open_list, initial_state)
+    def __init__(self, worker_id, workers, goal, heuristic, inboxes, results, 
+                 batch_size, width=None):
+        self.worker_id = worker_id
+        self.workers = workers
+        self.goal = pack_board(goal)                      # packed goal board
+        self.inboxes = inboxes              # inbox Queue of every worker
+        self.results = results              # Queue to main process
+        self.batch_size = batch_size
+        
+        # h of packed boards, plug-in in full, or Manhattan from table
+        self.heuristic = getattr(heuristic, "heuristic", heuristic)
+        self.board_size = len(goal)
+        self.distance_table, self.moves_table = build_puzzle_tables(goal, 
+                                                                    width)
+        
+        self.open_list = []                   # (f_cost, -g_cost, board, idx)
+        self.reached = {}                # board : (g_cost, parent, move_name)
+        self.outboxes = [[] for _ in range(workers)]   # batch for each owner
+        self.incumbent = math.inf              # cost of best goal found
+        self.sent = self.received = self.expanded = 0
     """
-        add initial_state to queue, heapq maintains open_list as priority queue
-        heapq.heappush implements a min-heap data structure,
-        Smallest element remains at the root, root is at open_list[0]
-        Priority is f_cost, __lt__ overload is used to compare
+        Inbox messages, from main process or other workers
+            ("states", [(board, blank_space_idx, g_cost, h_cost, 
+                         parent, move_name), ...])
+            ("incumbent", cost) , ("probe", wave) , ("trace", board) , 
+            ("stop",)
+        Results messages, to main process
+            ("goal", cost) , ("counts", wave, worker_id, idle, sent, 
+            received, expanded) , ("parent", board, parent, move_name)
     """
     
-    explored_set = set() #Empty set, to save explored board states, visited set
-
-    while open_list:                       # while priority queue is not empty
+    def add(self, board, blank_space_idx, g_cost, h_cost, parent, move_name):
+        """ Push board into open list, if not reached with lower g_cost """
+        if g_cost < self.reached.get(board, (math.inf,))[0]:
+            self.reached[board] = (g_cost, parent, move_name)
+            heapq.heappush(self.open_list, (g_cost + h_cost, -g_cost, 
+                                            board, blank_space_idx))
+    
+    def flush(self, minimum=1):
+        """ Send every batch with at least minimum boards to its owner """
+        for owner, batch in enumerate(self.outboxes):
+            if len(batch) >= minimum:
+                self.inboxes[owner].put(("states", batch))
+                self.outboxes[owner] = []
+                self.sent += 1
+    
+    def is_idle(self):
+        return (not (self.open_list and 
+                     self.open_list[0][0] < self.incumbent) and 
+                not any(self.outboxes))
+    
+    def handle(self, message):
+        """ Return False on stop, else True """
+        kind = message[0]
+        
+        if kind == "states":
+            self.received += 1
+            for entry in message[1]:
+                self.add(*entry)
+        elif kind == "incumbent":
+            self.incumbent = min(self.incumbent, message[1])
+        elif kind == "probe":
+            self.results.put(("counts", message[1], self.worker_id, 
+                              self.is_idle(), self.sent, self.received, 
+                              self.expanded))
+        elif kind == "trace":
+            _, parent, move_name = self.reached[message[1]]
+            self.results.put(("parent", message[1], parent, move_name))
+        elif kind == "stop":
+            return False
+        return True
+    
+    def expand(self):
+        """ Pop best node, expand it, neighbors to own open list or batch """
+        f_cost, g_cost, board, blank_space_idx = heapq.heappop(self.open_list)
+        g_cost = -g_cost
+        
+        if g_cost > self.reached[board][0]:
+            return                             # stale, lower g_cost pushed
+        
+        if board == self.goal:
+            if g_cost < self.incumbent:
+                self.incumbent = g_cost
+                self.results.put(("goal", g_cost))
+            return
+        
+        self.expanded += 1
+        h_cost = f_cost - g_cost
+        distance_table = self.distance_table
+        
+        for move_name, numeric_tile_idx in self.moves_table[blank_space_idx]:
+            
+            tile = (board >> (4 * numeric_tile_idx)) & 0xF
+            new_board = (board ^ (tile << (4 * numeric_tile_idx)) 
+                               ^ (tile << (4 * blank_space_idx)))
+            
+            if self.heuristic is None:
+                new_h_cost = (h_cost - distance_table[tile][numeric_tile_idx] 
+                                     + distance_table[tile][blank_space_idx])
+            else:
+                new_h_cost = self.heuristic(unpack_board(new_board, 
+                                                         self.board_size))
+            
+            if g_cost + 1 + new_h_cost >= self.incumbent:
+                continue                    # pruned, not better than goal
+            
+            entry = (new_board, numeric_tile_idx, g_cost + 1, new_h_cost, 
+                     board, move_name)
+            owner = hda_owner(new_board, self.workers)
+            if owner == self.worker_id:
+                self.add(*entry)
+            else:
+                self.outboxes[owner].append(entry)
+    
+    def run(self, expansions_per_poll=64):
         
-        current_state = heapq.heappop(open_list) 
-        """ heapq.heappop, pop and return the smallest item from the heap
-            samllest, best of f_cost, f_cost = g_cost + h_cost
-            hence Best First , A*             
-        """        
+        inbox = self.inboxes[self.worker_id]
         
-        # If goal state reached, print solution, and return
-        if current_state.board == goal_board: 
+        while True:
+            
+            # all messages waiting in inbox, no wait
+            while True:
+                try:
+                    message = inbox.get_nowait()
+                except queue.Empty:
+                    break
+                if not self.handle(message):
+                    return
             
-            print_solution(current_state, explored_set)  # call print solution
-            return                                       # break out from loop
+            if self.open_list and self.open_list[0][0] < self.incumbent:
+                for _ in range(expansions_per_poll):
+                    if not (self.open_list and 
+                            self.open_list[0][0] < self.incumbent):
+                        break
+                    self.expand()
+                self.flush(self.batch_size)           # full batches only
+            else:
+                self.flush()              # idle, send partial batches too
+                if not self.handle(inbox.get()):      # wait for a message
+                    return
 
-        """
-            If control comes here, then Goal state has not been reached
-            add current_state.board to explored_set , visited node
-            indicating this board state(setting) has been explored(visited)
-        """
-        explored_set.add(current_state.board)  
+def hda_star_worker(worker_id, workers, goal, heuristic, inboxes, results, 
+                    batch_size, width=None):
+    """ Target of each worker process """
+    HDAStarWorker(worker_id, workers, goal, heuristic, inboxes, results, 
+                  batch_size, width).run()
 
-        """
-        for all possible numeric neighbor tile slide into blank space
-        that is
-        for all possible new PuzzleState with respect to blank space
-        """
-        for neighbor in current_state.get_possible_moves_into_blank_space():
-            """
-            Only if new neighbor board(state) is not in explored_set (visited)
-                Add new neighbor to priority queue open_list
-            """
-            if neighbor.board not in explored_set:
-
-                heapq.heappush(open_list, neighbor)
-                
-    """ solve_8_puzzle def ends """
+def hda_receive(results, processes, poll_time=1.0):
+    """
+    Next message from results Queue of workers, waits poll_time seconds at 
+        a time, between waits checks workers, a worker that died (killed, 
+        out of memory, error) never replies, RuntimeError instead of 
+        waiting forever
+    """
+    while True:
+        try:
+            return results.get(timeout=poll_time)
+        except queue.Empty:
+            for worker_id, process in enumerate(processes):
+                if process.exitcode is not None:      # exited before stop
+                    raise RuntimeError(f"HDA* worker {worker_id} exited, " 
+                                       f"exit code {process.exitcode}")
+
+def hda_star_search(initial_board, goal, workers=None, heuristic=None, 
+                    batch_size=256, width=None):
+    """
+    HDA* , workers processes, None for number of CPU cores
+    heuristic, plug-in as for solve_8_puzzle, must be picklable
+    width, number of columns, None for n of n x n goal board
+    Return (solution, number_expanded) , solution, list of board tuples 
+        from initial_board to goal, None if not reachable
+    RuntimeError if a worker process dies during search
+    """
+    workers = workers or os.cpu_count() or 1
+    
+    inboxes = [multiprocessing.Queue() for _ in range(workers)]
+    results = multiprocessing.Queue()
+    
+    processes = [multiprocessing.Process(
+                    target=hda_star_worker, 
+                    args=(worker_id, workers, goal, heuristic, inboxes, 
+                          results, batch_size, width), 
+                    daemon=True) 
+                 for worker_id in range(workers)]
+    for process in processes:
+        process.start()
+    
+    try:
+        heuristic_of = (getattr(heuristic, "heuristic", heuristic) or 
+                        partial(manhattan_distance, goal=goal, width=width))
+        h_cost = heuristic_of(initial_board)
         
+        start = pack_board(initial_board)
+        inboxes[hda_owner(start, workers)].put(
+            ("states", [(start, initial_board.index(0), 0, h_cost, None, 
+                         None)]))
+        
+        incumbent = math.inf
+        previous_counts = None
+        wave = 0
+        
+        while True:                                  # termination detection
+            wave += 1
+            for inbox in inboxes:
+                inbox.put(("probe", wave))
+            
+            counts = [None] * workers
+            while None in counts:
+                message = hda_receive(results, processes)
+                if message[0] == "goal" and message[1] < incumbent:
+                    incumbent = message[1]
+                    for inbox in inboxes:
+                        inbox.put(("incumbent", incumbent))
+                elif message[0] == "counts" and message[1] == wave:
+                    counts[message[2]] = message[3:]
+            
+            sent = 1 + sum(count[1] for count in counts)   # 1, start batch
+            received = sum(count[2] for count in counts)
+            
+            if (all(count[0] for count in counts) and sent == received and 
+                    counts == previous_counts):
+                break
+            previous_counts = counts
+            time.sleep(0.001)
+        
+        number_expanded = sum(count[3] for count in counts)
+        
+        if incumbent == math.inf:
+            return None, number_expanded
+        
+        solution = []                      # goal to start, parent by parent
+        board = pack_board(goal)
+        while board is not None:
+            solution.append(unpack_board(board, len(goal)))
+            inboxes[hda_owner(board, workers)].put(("trace", board))
+            message = hda_receive(results, processes)
+            while message[0] != "parent":            # late probe replies
+                message = hda_receive(results, processes)
+            board = message[2]
+        
+        return solution[::-1], number_expanded
+    
+    finally:
+        for inbox in inboxes:
+            inbox.put(("stop",))
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():           # stuck worker, not left behind
+                process.terminate()
+        for channel in inboxes + [results]:   # workers done, data left for a 
+            channel.cancel_join_thread()     # dead worker is not waited on
+
+def solve_by_hda_star(initial_board, goal, workers, heuristic, quiet=False, 
+                      width=None):
+    """
+    HDA* with workers processes, print path if not quiet
+    """
+    start_time = time.perf_counter()
+    
+    solution, number_expanded = hda_star_search(initial_board, goal, workers, 
+                                                heuristic, width=width)
+    if solution is None:
+        if not quiet:
+            print("\n Solution could not be found")
+        return SolverResult(None, number_expanded, None, 
+                            time.perf_counter() - start_time, width)
+    
+    result = SolverResult(board_path(solution, heuristic, width), 
+                          number_expanded, 
+                          None, time.perf_counter() - start_time, width)
+    
+    if not quiet:
+        sys.stdout.write(result.render_path())
+    
+    return result
+
+
+if __name__ == "__main__":
+    solve_8_puzzle(initial_board)
+
+    """
+        Packed board, same search with board states saved as packed int
+    solve_8_puzzle(initial_board, packed=True)
+    """
+
+    """
+        Search statistics, heap pushes and pops, duplicates, branching factor, 
+            time and peak memory, as JSON (search_stats.py)
+    stats = SearchStats("A*")
+    solve_8_puzzle(initial_board, quiet=True, stats=stats)
+    print(stats.to_json())
+    """
+
+    """
+        15-Puzzle, 4 x 4 board, solved by IDA*, memory linear in solution depth
+    """
+    initial_board_15 = (8, 2, 7, 10, 5, 1, 6, 0, 9, 11, 14, 3, 12, 4, 13, 15)
+    goal_board_15 = tuple(range(16))
+
+    print("\n", "="*42, "\n IDA* , 15-Puzzle")
+    solve_puzzle_ida_star(initial_board_15, goal_board_15)
+
+    """
+        A* , 15-Puzzle, same NPuzzleProblem with 4×4 tables
+    solve_8_puzzle(initial_board_15, goal=goal_board_15)
+    """
+
+    """
+        A* , 8-Puzzle, additive pattern databases (1, 2, 3, 4) + (5, 6, 7, 8)
+            built once, saved, memory-mapped for every later run
+    """
+    pattern_databases_8 = AdditivePatternDatabases([
+        load_or_build_pattern_database(pattern, goal_board)
+        for pattern in [(1, 2, 3, 4), (5, 6, 7, 8)]])
+
+    print("\n", "="*42, "\n A* , additive pattern databases")
+    solve_8_puzzle(initial_board, heuristic=pattern_databases_8.heuristic)
+
+    """
+        Distance oracle, 8-Puzzle, every board answered without search,
+            first call builds table (a few seconds), or loads it from disk
+    solve_8_puzzle(initial_board, oracle=True)
+    """
+
+    """
+        Shared search core (search_core.py, in this folder), NPuzzleProblem, 
+            A* , UCS and IDA* for graphs, puzzles, wumpus world
+    import search_core
+    problem = search_core.NPuzzleProblem(initial_board_15, goal_board_15, 
+                                         packed=True)
+    print(search_core.astar_search(problem))
+    print(search_core.ida_star_search(problem))
+    """
+
+    """
+        Weighted A* , f = g + 2 × h , 15-Puzzle, solution at most 2 × optimal
+    solve_8_puzzle(initial_board_15, goal=goal_board_15, weight=2)
+
+        ARA* , w = 3, 2, 1.5, 1.25, 1.125, 1 , improved solutions till deadline
+    solve_8_puzzle(initial_board_15, goal=goal_board_15, weight=3, 
+                   anytime=True, deadline=10)
+    """
+
+    """
+        Heuristics compared, 20 boards (200 random slides, seed 8), 
+            linear conflict, walking distance, and max of both, 
+            same optimal moves, fewer states expanded
+    benchmark_heuristics(benchmark_boards(), {
+        "Manhattan": None, 
+        "linear conflict": LinearConflictHeuristic(), 
+        "walking distance": WalkingDistanceHeuristic(), 
+        "max(LC, WD)": MaxHeuristic([LinearConflictHeuristic(), 
+                                     WalkingDistanceHeuristic()])})
 
-solve_8_puzzle(initial_board)
+     heuristic              expanded   time (s)   moves
+     Manhattan                 23524      0.137     452
+     linear conflict           12383      0.151     452
+     walking distance          10884      0.114     452
+     max(LC, WD)                8375      0.238     452
+    """
+
+    """
+        HDA* , 15-Puzzle, parallel A* on all CPU cores, same optimal solution
+    solve_8_puzzle(initial_board_15, goal=goal_board_15, workers=None)
+    """
+
+    """
+        Batch solve, boards from a list (or a file path), all CPU cores
+    batch_solve_8_puzzle([initial_board, 
+                          (1, 2, 5, 3, 4, 0, 6, 7, 8), 
+                          (8, 6, 7, 2, 5, 4, 3, 0, 1), 
+                          (2, 1, 0, 3, 4, 5, 6, 7, 8)])
+    
+        same, linear conflict heuristic, built once in each worker
+    batch_solve_8_puzzle([initial_board, (8, 6, 7, 2, 5, 4, 3, 0, 1)], 
+                         heuristic_factory=LinearConflictHeuristic)
+    """
 
 
 """
@@ -427,7 +2090,7 @@ Output:
 
  Solution found
 
- Number of states explored by A* = 2419
+ Number of states explored by A* = 3067
 
  Number of steps in solution: 27
 
@@ -480,196 +2143,196 @@ Output:
  | 8 | 3 | 1 |
  -------------
 ------------------------------------------ 
- Step: 5 , Move: down , g_cost: 5 + h: 17
+ Step: 5 , Move: right , g_cost: 5 + h: 17
  -------------
  | 2 | 5 | 4 |
  -------------
- | 7 | 3 | 6 |
+ | 7 | 6 | 0 |
  -------------
- | 8 | 0 | 1 |
+ | 8 | 3 | 1 |
  -------------
 ------------------------------------------ 
- Step: 6 , Move: left , g_cost: 6 + h: 16
+ Step: 6 , Move: down , g_cost: 6 + h: 16
  -------------
  | 2 | 5 | 4 |
  -------------
- | 7 | 3 | 6 |
+ | 7 | 6 | 1 |
  -------------
- | 0 | 8 | 1 |
+ | 8 | 3 | 0 |
  -------------
 ------------------------------------------ 
- Step: 7 , Move: up , g_cost: 7 + h: 15
+ Step: 7 , Move: left , g_cost: 7 + h: 17
  -------------
  | 2 | 5 | 4 |
  -------------
- | 0 | 3 | 6 |
+ | 7 | 6 | 1 |
  -------------
- | 7 | 8 | 1 |
+ | 8 | 0 | 3 |
  -------------
 ------------------------------------------ 
- Step: 8 , Move: right , g_cost: 8 + h: 14
+ Step: 8 , Move: left , g_cost: 8 + h: 16
  -------------
  | 2 | 5 | 4 |
  -------------
- | 3 | 0 | 6 |
+ | 7 | 6 | 1 |
  -------------
- | 7 | 8 | 1 |
+ | 0 | 8 | 3 |
  -------------
 ------------------------------------------ 
- Step: 9 , Move: right , g_cost: 9 + h: 13
+ Step: 9 , Move: up , g_cost: 9 + h: 15
  -------------
  | 2 | 5 | 4 |
  -------------
- | 3 | 6 | 0 |
+ | 0 | 6 | 1 |
  -------------
- | 7 | 8 | 1 |
+ | 7 | 8 | 3 |
  -------------
 ------------------------------------------ 
- Step: 10 , Move: up , g_cost: 10 + h: 12
+ Step: 10 , Move: right , g_cost: 10 + h: 14
  -------------
- | 2 | 5 | 0 |
+ | 2 | 5 | 4 |
  -------------
- | 3 | 6 | 4 |
+ | 6 | 0 | 1 |
  -------------
- | 7 | 8 | 1 |
+ | 7 | 8 | 3 |
  -------------
 ------------------------------------------ 
- Step: 11 , Move: left , g_cost: 11 + h: 11
+ Step: 11 , Move: right , g_cost: 11 + h: 13
  -------------
- | 2 | 0 | 5 |
+ | 2 | 5 | 4 |
  -------------
- | 3 | 6 | 4 |
+ | 6 | 1 | 0 |
  -------------
- | 7 | 8 | 1 |
+ | 7 | 8 | 3 |
  -------------
 ------------------------------------------ 
- Step: 12 , Move: left , g_cost: 12 + h: 10
+ Step: 12 , Move: down , g_cost: 12 + h: 12
  -------------
- | 0 | 2 | 5 |
+ | 2 | 5 | 4 |
  -------------
- | 3 | 6 | 4 |
+ | 6 | 1 | 3 |
  -------------
- | 7 | 8 | 1 |
+ | 7 | 8 | 0 |
  -------------
 ------------------------------------------ 
- Step: 13 , Move: down , g_cost: 13 + h: 11
+ Step: 13 , Move: left , g_cost: 13 + h: 11
  -------------
- | 3 | 2 | 5 |
+ | 2 | 5 | 4 |
  -------------
- | 0 | 6 | 4 |
+ | 6 | 1 | 3 |
  -------------
- | 7 | 8 | 1 |
+ | 7 | 0 | 8 |
  -------------
 ------------------------------------------ 
- Step: 14 , Move: right , g_cost: 14 + h: 10
+ Step: 14 , Move: left , g_cost: 14 + h: 10
  -------------
- | 3 | 2 | 5 |
+ | 2 | 5 | 4 |
  -------------
- | 6 | 0 | 4 |
+ | 6 | 1 | 3 |
  -------------
- | 7 | 8 | 1 |
+ | 0 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 15 , Move: right , g_cost: 15 + h: 9
+ Step: 15 , Move: up , g_cost: 15 + h: 9
  -------------
- | 3 | 2 | 5 |
+ | 2 | 5 | 4 |
  -------------
- | 6 | 4 | 0 |
+ | 0 | 1 | 3 |
  -------------
- | 7 | 8 | 1 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 16 , Move: down , g_cost: 16 + h: 8
+ Step: 16 , Move: right , g_cost: 16 + h: 10
  -------------
- | 3 | 2 | 5 |
+ | 2 | 5 | 4 |
  -------------
- | 6 | 4 | 1 |
+ | 1 | 0 | 3 |
  -------------
- | 7 | 8 | 0 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 17 , Move: left , g_cost: 17 + h: 7
+ Step: 17 , Move: right , g_cost: 17 + h: 9
  -------------
- | 3 | 2 | 5 |
+ | 2 | 5 | 4 |
  -------------
- | 6 | 4 | 1 |
+ | 1 | 3 | 0 |
  -------------
- | 7 | 0 | 8 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
  Step: 18 , Move: up , g_cost: 18 + h: 8
  -------------
- | 3 | 2 | 5 |
+ | 2 | 5 | 0 |
  -------------
- | 6 | 0 | 1 |
+ | 1 | 3 | 4 |
  -------------
- | 7 | 4 | 8 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 19 , Move: right , g_cost: 19 + h: 7
+ Step: 19 , Move: left , g_cost: 19 + h: 7
  -------------
- | 3 | 2 | 5 |
+ | 2 | 0 | 5 |
  -------------
- | 6 | 1 | 0 |
+ | 1 | 3 | 4 |
  -------------
- | 7 | 4 | 8 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 20 , Move: up , g_cost: 20 + h: 6
+ Step: 20 , Move: left , g_cost: 20 + h: 6
  -------------
- | 3 | 2 | 0 |
+ | 0 | 2 | 5 |
  -------------
- | 6 | 1 | 5 |
+ | 1 | 3 | 4 |
  -------------
- | 7 | 4 | 8 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 21 , Move: left , g_cost: 21 + h: 5
+ Step: 21 , Move: down , g_cost: 21 + h: 5
  -------------
- | 3 | 0 | 2 |
+ | 1 | 2 | 5 |
  -------------
- | 6 | 1 | 5 |
+ | 0 | 3 | 4 |
  -------------
- | 7 | 4 | 8 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 22 , Move: down , g_cost: 22 + h: 4
+ Step: 22 , Move: right , g_cost: 22 + h: 4
  -------------
- | 3 | 1 | 2 |
+ | 1 | 2 | 5 |
  -------------
- | 6 | 0 | 5 |
+ | 3 | 0 | 4 |
  -------------
- | 7 | 4 | 8 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 23 , Move: down , g_cost: 23 + h: 3
+ Step: 23 , Move: right , g_cost: 23 + h: 3
  -------------
- | 3 | 1 | 2 |
+ | 1 | 2 | 5 |
  -------------
- | 6 | 4 | 5 |
+ | 3 | 4 | 0 |
  -------------
- | 7 | 0 | 8 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 24 , Move: left , g_cost: 24 + h: 2
+ Step: 24 , Move: up , g_cost: 24 + h: 2
  -------------
- | 3 | 1 | 2 |
+ | 1 | 2 | 0 |
  -------------
- | 6 | 4 | 5 |
+ | 3 | 4 | 5 |
  -------------
- | 0 | 7 | 8 |
+ | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 25 , Move: up , g_cost: 25 + h: 1
+ Step: 25 , Move: left , g_cost: 25 + h: 1
  -------------
- | 3 | 1 | 2 |
+ | 1 | 0 | 2 |
  -------------
- | 0 | 4 | 5 |
+ | 3 | 4 | 5 |
  -------------
  | 6 | 7 | 8 |
  -------------
 ------------------------------------------ 
- Step: 26 , Move: up , g_cost: 26 + h: 0
+ Step: 26 , Move: left , g_cost: 26 + h: 0
  -------------
  | 0 | 1 | 2 |
  -------------
@@ -677,6 +2340,35 @@ Output:
  -------------
  | 6 | 7 | 8 |
  -------------
+
+ Heap pushes = 4775 , pops = 3089 , stale pops = 21
+"""
+
+
+
+"""
+Output: IDA* , 15-Puzzle
+
+ Solution found
+
+ Number of states expanded by IDA* = 130150
+
+ Number of moves in solution: 34
+
+ Moves with respect to blank space, 0 
+
+ up, left, left, down, down, down, right, up, up, left
+ left, up, right, down, down, right, right, up, left, down
+ left, left, up, right, up, right, down, down, right, up
+ up, left, left, left
+"""
+
 """
+Output: A* , additive pattern databases (steps, same as above, not repeated)
+
+ Number of states explored by A* = 208
 
+ Number of steps in solution: 27
 
+ Heap pushes = 351 , pops = 209 , stale pops = 0
+"""
@@ -94,20 +94,27 @@ class KnowledgeBaseAgent:   # class encapsulates the functionality of the agent
             return "Behavior not found" #else return message behavior not found
 
 
-agent = KnowledgeBaseAgent(knowledge_base) # Create KnowledgeBaseAgent instance
-
-behavior = input(" Enter behavior/results of compilation/program run: ")
-
-info = agent.ask(behavior)     # retrieve error information from Knowledge Base 
-
-if info == "Behavior not found":
-    print(f"\n {behavior}: {info} in Knowledge Base")
-else:    
-    print(f"\n Behavior: {info['behavior']}")    
-    print(f"\n Error Type: {info['error_type']}")    
-    print(f"\n Likely causes: \n\t {',\n\t '.join(info['causes'])}")
-    print(f"\n Possible fixes / solutions: \n\t {',\n\t '.join(info['solutions'])}")
-
+def print_info(behavior, info):         # print kb entry returned by ask
+    
+    if info == "Behavior not found":
+        print(f"\n {behavior}: {info} in Knowledge Base")
+    else:    
+        separator = ",\n\t "     # backslash not allowed in f-string {} part
+        print(f"\n Behavior: {info['behavior']}")    
+        print(f"\n Error Type: {info['error_type']}")    
+        print(f"\n Likely causes: \n\t {separator.join(info['causes'])}")
+        print(f"\n Possible fixes / solutions: \n\t", 
+              f"{separator.join(info['solutions'])}")
+
+
+if __name__ == "__main__":
+    agent = KnowledgeBaseAgent(knowledge_base) # Create KnowledgeBaseAgent
+    
+    behavior = input(" Enter behavior/results of compilation/program run: ")
+    
+    info = agent.ask(behavior)   # retrieve error information from kb
+    
+    print_info(behavior, info)
     
 """
 Output:
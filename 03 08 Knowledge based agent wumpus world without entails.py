@@ -343,7 +343,7 @@ class WumpusAgent:                                                     # Agent
                     
                 No safe path if queue empty
         """    
-        print(f"\n\n Initial kb: {agent.kb}")
+        print(f"\n\n Initial kb: {self.kb}")
         print("\n Agent can move and perceive stench, breeze, glitter")
         print("\n Agent does(can) not:\n\t shoot wumpus, rotate, face direction,", 
               "\n\t bump into wall, grab gold , trace back to climb out,", 
@@ -351,8 +351,8 @@ class WumpusAgent:                                                     # Agent
         print("\n Agent starts")
         while queue:
             row, col = queue.pop()          # Ask, next room to visit, dequeue            
-            agent.current_pos = (row, col)# Update agent position in agent and 
-            move_into_ok_square = world.move_agent(agent.current_pos)#in world        
+            self.current_pos = (row, col)# Update agent position in agent and 
+            move_into_ok_square = world.move_agent(self.current_pos)#in world        
             if not move_into_ok_square: 
                 break      # break, because moved into room with wumpus or pit                        
             print("", "-"*30, f"\n Agent moves to ({row}, {col}) ,", end="")            
@@ -360,23 +360,23 @@ class WumpusAgent:                                                     # Agent
             print(f" and percieves: {percepts}")            
             #if control comes here, then move_into_ok_square is True/successful
             # Tell, update knowledge base, with percepts at current (row, col) 
-            agent.update_knowledge_base(row, col, percepts)   # with no w or p
+            self.update_knowledge_base(row, col, percepts)   # with no w or p
             if 'glitter' in percepts:                       # gold found, exit
                 print("\n Agent found gold. Climbing out.") 
                 break                                        
             # Safe search, explore next (add to queue) safe unvisited adj sqrs
-            for adj_row, adj_col in in_range_adj_idx(agent.world_size, row, 
+            for adj_row, adj_col in in_range_adj_idx(self.world_size, row, 
                                                      col):                
                 # get kb entry of (adj_row, adj_col) if exists, else empty set
-                kb_entry = agent.kb.get((adj_row, adj_col), set())                
+                kb_entry = self.kb.get((adj_row, adj_col), set())                
                 if ('safe' in  kb_entry and 'visited' not in kb_entry):                    
                     queue.append((adj_row, adj_col))      # Tell, add to queue            
             # safe search exhausted(explored) all safe squares, queue is empty
             # unsafe search, take risk, explore unvisited whether safe or not
             if not queue and not safe_search:                
-                for adj_row, adj_col in in_range_adj_idx(agent.world_size, row, 
+                for adj_row, adj_col in in_range_adj_idx(self.world_size, row, 
                                                          col):                    
-                    kb_entry = agent.kb.get((adj_row, adj_col), set())                    
+                    kb_entry = self.kb.get((adj_row, adj_col), set())                    
                     if ('visited' not in kb_entry):                        
                         queue.append((adj_row, adj_col))                # Tell                        
         if len(queue) == 0:
@@ -384,23 +384,36 @@ class WumpusAgent:                                                     # Agent
         """ def find_gold ends """        
     """ class WumpusAgent ends"""
 
-print("", "-"*60, "\n Run of Agent that takes no risk")
-world = WumpusWorld(size, agent_start_position, wumpus_position, 
-                    pits_position, gold_position)
-agent = WumpusAgent(world.size, world.agent_pos)
-queue = list([agent.current_pos])
+if __name__ == "__main__":
+    print("", "-"*60, "\n Run of Agent that takes no risk")
+    world = WumpusWorld(size, agent_start_position, wumpus_position, 
+                        pits_position, gold_position)
+    agent = WumpusAgent(world.size, world.agent_pos)
+    queue = list([agent.current_pos])
 
-safe_search = True
-agent.find_gold(world, queue, safe_search)
+    safe_search = True
+    agent.find_gold(world, queue, safe_search)
 
-print("", "-"*60, "\n Run of Agent that takes risk")
-world = WumpusWorld(size, agent_start_position, wumpus_position, 
-                    pits_position, gold_position)
-agent = WumpusAgent(world.size, world.agent_pos)
-queue = list([agent.current_pos])
+    print("", "-"*60, "\n Run of Agent that takes risk")
+    world = WumpusWorld(size, agent_start_position, wumpus_position, 
+                        pits_position, gold_position)
+    agent = WumpusAgent(world.size, world.agent_pos)
+    queue = list([agent.current_pos])
 
-safe_search = False
-agent.find_gold(world, queue, safe_search)
+    safe_search = False
+    agent.find_gold(world, queue, safe_search)
+
+    """
+        Route back to start, to climb out, only through squares known (kb) to be 
+            safe, A* of search_core (search_core.py, in this folder), 
+            PLAN-ROUTE of hybrid wumpus agent, Figure 7.20
+    import search_core
+    safe_squares = [square for square, facts in agent.kb.items() 
+                    if 'safe' in facts]
+    route = search_core.astar_search(search_core.GridRouteProblem(
+        size, safe_squares, agent.current_pos, agent_start_position))
+    print("\n Route to climb out:", route.states)
+    """
 
 """
 Output:
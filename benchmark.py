@@ -0,0 +1,512 @@
+"""
+Benchmark suite for the n-Puzzle solvers, fixed seeded instance corpus
+"""
+"""
+    Corpus, seeded random solvable boards, bucketed by optimal depth
+        boards made by random walks from goal board (every board reached
+            so is solvable), walk never undoes its last slide
+        optimal depth of each board, by A* with max(linear conflict,
+            walking distance), admissible, so A* depth is optimal
+            A* runs in a forked process, a board whose depth is not proven
+            within depth_time_limit seconds (and memory_limit MB) is
+            skipped and another board is drawn, boards with h above the
+            bucket are skipped without search
+        per_bucket boards for each depth bucket of 8-Puzzle and 15-Puzzle
+            buckets start at depth 1, goal board itself is not a test case
+            15-Puzzle 35-55, deep boards, where A* with Manhattan distance
+            runs out of time or memory and IDA* and better heuristics pay
+        same seed, same corpus, corpus saved as JSON and read back, so
+            every run and every release solves the same boards
+
+    Solvers, SOLVERS, name : (puzzles it can solve, solve function)
+        BFS, ranked, bidirectional, layered, disk and NumPy BFS, and DFS
+            (iterative), 8-Puzzle only, uninformed search of 16!/2 boards
+            of 15-Puzzle ends in timeout or memory for all but shallow
+            boards, ranked BFS bitmap (16! bits) can not even be made
+        Oracle, 8-Puzzle only, table of every 8-Puzzle board
+        A* (Manhattan distance, linear conflict, walking distance), ARA*
+            (from weight 3 down to 1), HDA* (all CPU cores) and IDA* ,
+            8-Puzzle and 15-Puzzle
+            HDA* peak MB is of main process only, not its workers
+        every solver but DFS is optimal, moves not equal to depth of the
+            board is status "wrong"
+        Not in SOLVERS, batch mode (solve_boards, batch_solve_8_puzzle),
+            throughput of a process pool over many boards, not one solve,
+            each board is solved by the same A* as row "A*"
+
+    Run, every solver on every board of its puzzles, each solve in its own
+        forked process (modules, tables and caches shared, warm)
+        time_limit, seconds, process stopped after it, status "timeout"
+        memory_limit, MB above memory at start, address space limit
+            (resource.RLIMIT_AS), MemoryError, status "memory"
+        peak MB, peak resident memory of solve (VmHWM of process, reset at
+            start through /proc/self/clear_refs, Linux), less memory at start
+
+    Report, one line per solver, puzzle and depth bucket
+        solved / attempted, ms/solve (median of solved), nodes/sec (nodes
+        expanded / seconds, all solved), peak MB (largest)
+    Baseline, JSON file of report and every run, --compare old baseline
+        prints ratio new / old of ms/solve and nodes/sec
+
+    Examples (from this folder)
+        python benchmark.py
+        python benchmark.py --per-bucket 5 --time-limit 30 --baseline new.json
+        python benchmark.py --solvers A* "A* walking distance" --puzzles 15
+        python benchmark.py --baseline new.json --compare old.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import signal
+import statistics
+import sys
+import time
+
+try:
+    import resource                               # Unix only, memory limit
+except ImportError:
+    resource = None
+
+from principles_of_ai import n_puzzle_a_star, n_puzzle_bfs, n_puzzle_dfs
+from search_stats import SearchStats              # search_stats.py, same folder
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+goal_boards = {8: tuple(range(9)), 15: tuple(range(16))}
+
+depth_buckets = {8: [(1, 9), (10, 17), (18, 24), (25, 31)],
+                 15: [(1, 14), (15, 24), (25, 34),
+                      (35, 55)]}
+
+
+heuristics = {}                          # (name, goal) : heuristic, built once
+
+def heuristic(name, goal):
+    if (name, goal) not in heuristics:
+        a_star = n_puzzle_a_star
+        heuristics[name, goal] = {
+            "linear conflict": a_star.LinearConflictHeuristic,
+            "walking distance": a_star.WalkingDistanceHeuristic,
+            "max": lambda goal: a_star.MaxHeuristic([
+                a_star.LinearConflictHeuristic(goal),
+                a_star.WalkingDistanceHeuristic(goal)])}[name](goal)
+    return heuristics[name, goal]
+
+
+"""
+    Solve functions, solve(board, goal, stats) returns SolverResult
+"""
+def solve_bfs(board, goal, stats):
+    return n_puzzle_bfs.bfs_solve_n_puzzle(board, packed=True, quiet=True,
+                                           stats=stats, goal=goal)
+
+def solve_ranked_bfs(board, goal, stats):
+    return n_puzzle_bfs.bfs_ranked_solve_n_puzzle(board, quiet=True,
+                                                  goal=goal, stats=stats)
+
+def solve_bidirectional_bfs(board, goal, stats):
+    return n_puzzle_bfs.bidirectional_bfs_solve_n_puzzle(
+        board, quiet=True, goal=goal, stats=stats)
+
+def solve_layered_bfs(board, goal, stats):
+    return n_puzzle_bfs.layered_bfs_solve_n_puzzle(board, quiet=True,
+                                                   goal=goal, stats=stats)
+
+def solve_disk_bfs(board, goal, stats):
+    return n_puzzle_bfs.disk_bfs_solve_n_puzzle(board, quiet=True,
+                                                goal=goal, stats=stats)
+
+def solve_numpy_bfs(board, goal, stats):
+    return n_puzzle_bfs.numpy_bfs_solve_n_puzzle(board, quiet=True,
+                                                 goal=goal, stats=stats)
+
+def solve_dfs(board, goal, stats):
+    return n_puzzle_dfs.solve_n_puzzle(board, iterative=True, quiet=True,
+                                       stats=stats, goal=goal)
+
+def solve_oracle(board, goal, stats):
+    return n_puzzle_a_star.solve_8_puzzle(board, goal=goal, oracle=True,
+                                          quiet=True, stats=stats)
+
+def solve_a_star(board, goal, stats):
+    return n_puzzle_a_star.solve_8_puzzle(board, goal=goal, quiet=True,
+                                          stats=stats)
+
+def solve_a_star_linear_conflict(board, goal, stats):
+    return n_puzzle_a_star.solve_8_puzzle(
+        board, goal=goal, quiet=True, stats=stats,
+        heuristic=heuristic("linear conflict", goal))
+
+def solve_a_star_walking_distance(board, goal, stats):
+    return n_puzzle_a_star.solve_8_puzzle(
+        board, goal=goal, quiet=True, stats=stats,
+        heuristic=heuristic("walking distance", goal))
+
+def solve_ara_star(board, goal, stats):
+    return n_puzzle_a_star.solve_8_puzzle(board, goal=goal, anytime=True,
+                                          weight=3, quiet=True, stats=stats)
+
+def solve_hda_star(board, goal, stats):
+    return n_puzzle_a_star.solve_8_puzzle(board, goal=goal, workers=None,
+                                          quiet=True, stats=stats)
+
+def solve_ida_star(board, goal, stats):
+    return n_puzzle_a_star.solve_puzzle_ida_star(board, goal, quiet=True,
+                                                 stats=stats)
+
+SOLVERS = {"BFS": ((8,), solve_bfs),
+           "Ranked BFS": ((8,), solve_ranked_bfs),
+           "Bidirectional BFS": ((8,), solve_bidirectional_bfs),
+           "Layered BFS": ((8,), solve_layered_bfs),
+           "Disk BFS": ((8,), solve_disk_bfs),
+           "NumPy BFS": ((8,), solve_numpy_bfs),
+           "DFS": ((8,), solve_dfs),
+           "Oracle": ((8,), solve_oracle),
+           "A*": ((8, 15), solve_a_star),
+           "A* linear conflict": ((8, 15), solve_a_star_linear_conflict),
+           "A* walking distance": ((8, 15), solve_a_star_walking_distance),
+           "ARA*": ((8, 15), solve_ara_star),
+           "HDA*": ((8, 15), solve_hda_star),
+           "IDA*": ((8, 15), solve_ida_star)}
+
+
+"""
+    Corpus
+"""
+def random_walk_board(goal, slides, generator):
+    """ Board after slides random slides from goal, no slide undone """
+    width = int(len(goal) ** 0.5)
+    board = list(goal)
+    blank_space_idx = board.index(0)
+    previous_idx = None
+    for _ in range(slides):
+        row, column = divmod(blank_space_idx, width)
+        neighbors = [idx for idx, ok in
+                     ((blank_space_idx - width, row > 0),
+                      (blank_space_idx + width, row < width - 1),
+                      (blank_space_idx - 1, column > 0),
+                      (blank_space_idx + 1, column < width - 1))
+                     if ok and idx != previous_idx]
+        numeric_tile_idx = generator.choice(neighbors)
+        board[blank_space_idx] = board[numeric_tile_idx]
+        board[numeric_tile_idx] = 0
+        previous_idx, blank_space_idx = blank_space_idx, numeric_tile_idx
+    return tuple(board)
+
+def optimal_depth(board, goal):
+    return n_puzzle_a_star.solve_8_puzzle(
+        board, goal=goal, quiet=True, heuristic=heuristic("max", goal)).length
+
+def depth_case(connection, board, goal, memory_limit):
+    """ Target of depth process, optimal depth sent, None if out of memory """
+    limit_memory(memory_limit)
+    try:
+        connection.send(optimal_depth(board, goal))
+    except MemoryError:
+        connection.send(None)
+
+def proven_depth(board, goal, time_limit, memory_limit):
+    """ optimal_depth in a forked process, None if not found within limits """
+    depth = run_forked(depth_case, (board, goal, memory_limit), time_limit)
+    return depth if isinstance(depth, int) else None
+
+def generate_corpus(seed=2024, per_bucket=3, puzzles=(8, 15),
+                    depth_time_limit=60.0, memory_limit=2048):
+    """
+    Return list of {"puzzle", "board", "depth", "bucket"} , per_bucket
+        boards in every depth bucket, same seed, same list (on a machine
+        fast enough to prove the same depths within depth_time_limit)
+    """
+    generator = random.Random(seed)
+    corpus = []
+
+    for puzzle in puzzles:
+        goal = goal_boards[puzzle]
+        lower_bound = heuristic("max", goal).heuristic  # built before forks
+        for low, high in depth_buckets[puzzle]:
+            seen = set()
+            while len(seen) < per_bucket:
+                board = random_walk_board(
+                    goal, generator.randint(low, 2 * high + 2), generator)
+                if board in seen or lower_bound(board) > high:
+                    continue
+                depth = proven_depth(board, goal, depth_time_limit,
+                                     memory_limit)
+                if depth is not None and low <= depth <= high:
+                    seen.add(board)
+                    corpus.append({"puzzle": puzzle, "board": list(board),
+                                   "depth": depth, "bucket": f"{low}-{high}"})
+    return corpus
+
+def load_or_generate_corpus(path, seed, per_bucket):
+    """ Corpus read from path, if it has same seed, else made and saved """
+    if path and os.path.exists(path):
+        with open(path) as file:
+            saved = json.load(file)
+        buckets = {f"{low}-{high}" for puzzle in depth_buckets
+                   for low, high in depth_buckets[puzzle]}
+        if (saved["seed"] == seed and saved["per_bucket"] == per_bucket and
+                {case["bucket"] for case in saved["boards"]} == buckets):
+            return saved["boards"]
+
+    corpus = generate_corpus(seed, per_bucket)
+    if path:
+        with open(path, "w") as file:              # one board in each line
+            file.write(f'{{"seed": {seed}, "per_bucket": {per_bucket},' +
+                       ' "boards": [\n' +
+                       ",\n".join(json.dumps(case) for case in corpus) +
+                       "\n]}\n")
+    return corpus
+
+
+"""
+    Run, each solve in a forked process, time and memory limits
+"""
+def memory_kb(key):
+    """ VmRSS , VmHWM , ... of this process from /proc, KB, None if none """
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith(key + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+def limit_memory(memory_limit):
+    """ Address space of this process limited to memory_limit MB more """
+    if memory_limit and resource is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        limit = (memory_kb("VmSize") or 0) * 1024 + memory_limit * 2**20
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+def solve_case(connection, solver, board, goal, memory_limit):
+    """ Target of solve process, record sent back through connection """
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")                        # VmHWM reset to VmRSS
+    except OSError:
+        pass
+    memory_at_start = memory_kb("VmRSS")
+
+    limit_memory(memory_limit)
+
+    stats = SearchStats(solver, trace_memory=False)
+    try:
+        start_time = time.perf_counter()
+        result = SOLVERS[solver][1](board, goal, stats)
+        seconds = time.perf_counter() - start_time
+    except MemoryError:
+        connection.send({"status": "memory"})
+        return
+
+    peak = memory_kb("VmHWM")
+    connection.send({
+        "status": "solved" if result.path is not None else "failed",
+        "moves": result.length,
+        "seconds": seconds,
+        "nodes_expanded": stats.nodes_expanded or result.nodes_expanded,
+        "peak_mb": None if peak is None or memory_at_start is None
+                   else (peak - memory_at_start) / 1024})
+
+def run_in_group(target, connection, *args):
+    """ target in a process group of its own, killed with its children """
+    os.setpgrp()
+    target(connection, *args)
+
+def run_forked(target, args, time_limit):
+    """
+    target(connection, *args) in a forked process, Return what it sends,
+        "timeout" if nothing within time_limit seconds, "memory" if process
+        was killed (out of memory) before it sent
+    Process and every process it started (HDA* workers) killed at end
+    """
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=run_in_group,
+                              args=(target, sender, *args))
+    process.start()
+    sender.close()
+
+    try:
+        if receiver.poll(time_limit):
+            try:
+                message = receiver.recv()
+            except EOFError:                # process killed, out of memory
+                message = "memory"
+        else:
+            message = "timeout"
+    finally:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:                         # group not made yet, or gone
+            process.kill()
+        process.join()
+    return message
+
+def run_case(solver, board, goal, time_limit, memory_limit):
+    record = run_forked(solve_case, (solver, board, goal, memory_limit),
+                        time_limit)
+    if isinstance(record, str):
+        record = {"status": record}             # "timeout" or "memory"
+    return record
+
+def run_benchmark(corpus, solvers, time_limit, memory_limit, quiet=False):
+    """
+    Return list of run records, one per solver and board
+    """
+    for solver in solvers:                # first solves, before any fork
+        SOLVERS[solver][1](tuple(goal_boards[8]), goal_boards[8],
+                           SearchStats(solver, trace_memory=False))
+    for puzzle in {case["puzzle"] for case in corpus}:
+        heuristic("linear conflict", goal_boards[puzzle])
+        heuristic("walking distance", goal_boards[puzzle])
+
+    runs = []
+    for solver in solvers:
+        puzzles, _ = SOLVERS[solver]
+        for case in corpus:
+            if case["puzzle"] not in puzzles:
+                continue
+            record = run_case(solver, tuple(case["board"]),
+                              goal_boards[case["puzzle"]], time_limit,
+                              memory_limit)
+            record.update(solver=solver, puzzle=case["puzzle"],
+                          bucket=case["bucket"], depth=case["depth"])
+            if (record["status"] == "solved" and solver != "DFS" and
+                    record["moves"] != case["depth"]):
+                record["status"] = "wrong"             # optimal solver, not
+            runs.append(record)
+            if not quiet:
+                print(f" {solver:<20} {case['puzzle']:>2}-Puzzle",
+                      f"depth {case['depth']:>2} , {record['status']}",
+                      file=sys.stderr)
+    return runs
+
+def summarize(runs):
+    """
+    Return list of report rows, one per solver, puzzle and depth bucket
+    """
+    groups = {}
+    for run in runs:
+        groups.setdefault((run["solver"], run["puzzle"], run["bucket"]),
+                          []).append(run)
+
+    report = []
+    for (solver, puzzle, bucket), group in groups.items():
+        solved = [run for run in group if run["status"] == "solved"]
+        seconds = sum(run["seconds"] for run in solved)
+        peaks = [run["peak_mb"] for run in solved
+                 if run["peak_mb"] is not None]
+        report.append({
+            "solver": solver, "puzzle": puzzle, "bucket": bucket,
+            "attempted": len(group), "solved": len(solved),
+            "statuses": {status: sum(run["status"] == status
+                                     for run in group)
+                         for status in sorted({run["status"]
+                                               for run in group})},
+            "ms_per_solve": (1000 * statistics.median(
+                run["seconds"] for run in solved) if solved else None),
+            "nodes_per_second": (sum(run["nodes_expanded"] for run in solved)
+                                 / seconds if seconds else None),
+            "peak_mb": max(peaks) if peaks else None})
+    return report
+
+def format_number(value, digits=1):
+    return "-" if value is None else f"{value:,.{digits}f}"
+
+def print_report(report, baseline=None):
+    """
+    Print table of report, and ratio to baseline report if given
+    """
+    old = {(row["solver"], row["puzzle"], row["bucket"]): row
+           for row in (baseline or [])}
+
+    header = (f" {'solver':<20} {'puzzle':>6} {'depth':>6} {'solved':>7}" +
+              f" {'ms/solve':>10} {'nodes/sec':>11} {'peak MB':>8}" +
+              f" {'not solved':<12}")
+    if baseline is not None:
+        header += f" {'ms ratio':>9} {'nodes ratio':>12}"
+    print(header)
+
+    for row in report:
+        failures = ", ".join(f"{status} {count}" for status, count
+                             in row["statuses"].items() if status != "solved")
+        line = (f" {row['solver']:<20} {row['puzzle']:>6}" +
+                f" {row['bucket']:>6}" +
+                f" {row['solved']:>3}/{row['attempted']:<3}" +
+                f" {format_number(row['ms_per_solve']):>10}" +
+                f" {format_number(row['nodes_per_second'], 0):>11}" +
+                f" {format_number(row['peak_mb']):>8}" +
+                f" {failures:<12}")
+        if baseline is not None:
+            before = old.get((row["solver"], row["puzzle"], row["bucket"]))
+            ratios = []
+            for key in ("ms_per_solve", "nodes_per_second"):
+                ratios.append(None if before is None or not before[key] or
+                              row[key] is None else row[key] / before[key])
+            line += (f" {format_number(ratios[0], 2):>9}" +
+                     f" {format_number(ratios[1], 2):>12}")
+        print(line)
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark n-Puzzle solvers on a seeded corpus")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--per-bucket", type=int, default=3,
+                        help="boards in each depth bucket")
+    parser.add_argument("--corpus", default=os.path.join(
+                            here, "benchmark_corpus.json"),
+                        help="corpus file, made if missing")
+    parser.add_argument("--solvers", nargs="+", default=list(SOLVERS),
+                        choices=list(SOLVERS))
+    parser.add_argument("--puzzles", nargs="+", type=int, default=[8, 15],
+                        choices=[8, 15])
+    parser.add_argument("--time-limit", type=float, default=10.0,
+                        help="seconds for each solve")
+    parser.add_argument("--memory-limit", type=int, default=2048,
+                        help="MB for each solve")
+    parser.add_argument("--baseline", help="write report and runs as JSON")
+    parser.add_argument("--compare", help="baseline JSON to compare with")
+    options = parser.parse_args(arguments)
+
+    if "NumPy BFS" in options.solvers:
+        try:
+            import numpy                                        # noqa: F401
+        except ImportError:
+            options.solvers.remove("NumPy BFS")          # NumPy not installed
+
+    corpus = [case for case in load_or_generate_corpus(
+                  options.corpus, options.seed, options.per_bucket)
+              if case["puzzle"] in options.puzzles]
+
+    runs = run_benchmark(corpus, options.solvers, options.time_limit,
+                         options.memory_limit)
+    report = summarize(runs)
+
+    baseline = None
+    if options.compare:
+        with open(options.compare) as file:
+            baseline = json.load(file)["report"]
+
+    print_report(report, baseline)
+
+    if options.baseline:
+        with open(options.baseline, "w") as file:
+            json.dump({"seed": options.seed,
+                       "per_bucket": options.per_bucket,
+                       "time_limit": options.time_limit,
+                       "memory_limit": options.memory_limit,
+                       "python": platform.python_version(),
+                       "machine": platform.machine(),
+                       "processor_count": os.cpu_count(),
+                       "report": report, "runs": runs}, file, indent=1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
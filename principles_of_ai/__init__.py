@@ -0,0 +1,91 @@
+"""
+Principles of Artificial Intelligence, programs of this folder as modules
+"""
+"""
+    Each program is a script, file name has spaces, "01 03 02 Demonstrate
+        the working of BFS Solve the n-Puzzle problem.py" , not importable
+        by import statement, and demo of each runs only when run as script,
+        if __name__ == "__main__":
+
+    Each module of this package loads one script by its file path, module
+        is the script itself (same functions, classes and globals), loaded
+        once, tables and caches built by first use are reused by later calls
+
+        import principles_of_ai.n_puzzle_a_star as a_star
+        result = a_star.solve_8_puzzle((7, 2, 4, 5, 0, 6, 8, 3, 1), quiet=True)
+
+    Demo of a script, run the module (from this folder)
+        python -m principles_of_ai.n_puzzle_a_star
+
+    Module                  Script
+        vacuum_world        01 01 Implement Agents and Environments, ...
+        tic_tac_toe         01 02 Solve the Tic Tac Toe problem
+        graph_bfs           01 03 01 Demonstrate the working of BFS
+        n_puzzle_bfs        01 03 02 ... BFS Solve the n-Puzzle problem
+        graph_dfs           01 04 01 Demonstrate the working of DFS
+        n_puzzle_dfs        01 04 02 ... DFS Solve the n-Puzzle problem
+        alpha_beta          02 05 Demonstrate the working of Alpha Beta Pruning
+        hill_climbing       02 06 Implement a Hill-climbing search algorithm
+        n_puzzle_a_star     02 07 Solve the 8-Puzzle problem using A star ...
+        c_program_agent     03 08 Knowledge based agent Map few C program ...
+        wumpus_agent        03 08 Knowledge based agent wumpus world ...
+
+    search_core and search_stats, shared by scripts, are modules already,
+        import search_core , import search_stats
+"""
+
+import importlib.util
+import os
+import runpy
+import sys
+
+folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+scripts = {
+    "vacuum_world": "01 01 Implement Agents and Environments, "
+                    "vacuum-cleaner world with just two locations.py",
+    "tic_tac_toe": "01 02 Solve the Tic Tac Toe problem.py",
+    "graph_bfs": "01 03 01 Demonstrate the working of BFS.py",
+    "n_puzzle_bfs": "01 03 02 Demonstrate the working of BFS Solve the "
+                    "n-Puzzle problem.py",
+    "graph_dfs": "01 04 01 Demonstrate the working of DFS.py",
+    "n_puzzle_dfs": "01 04 02 Demonstrate the working of DFS Solve the "
+                    "n-Puzzle problem.py",
+    "alpha_beta": "02 05 Demonstrate the working of Alpha Beta Pruning.py",
+    "hill_climbing": "02 06 Implement a Hill-climbing search algorithm.py",
+    "n_puzzle_a_star": "02 07 Solve the 8-Puzzle problem using A star "
+                       "Algorithm.py",
+    "c_program_agent": "03 08 Knowledge based agent Map few C program "
+                       "compile run behavior to known causes and "
+                       "solutions.py",
+    "wumpus_agent": "03 08 Knowledge based agent wumpus world without "
+                    "entails.py"}
+
+__all__ = list(scripts)
+
+if folder not in sys.path:         # scripts import search_core, search_stats
+    sys.path.append(folder)
+
+def load_script(name):
+    """
+    Load script of module name (principles_of_ai.n_puzzle_a_star , ...) as
+        that module, sys.modules[name] , import statement returns it
+    name "__main__" (python -m principles_of_ai.<module>) , script run as
+        program instead, its demo runs
+    """
+    if name == "__main__":
+        module_name = sys.modules["__main__"].__spec__.name
+        runpy.run_path(os.path.join(folder, scripts[
+            module_name.rpartition(".")[2]]), run_name="__main__")
+        return None
+
+    path = os.path.join(folder, scripts[name.rpartition(".")[2]])
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module         # replaces module that called loader
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
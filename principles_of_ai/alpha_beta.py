@@ -0,0 +1,7 @@
+"""
+Alpha-beta pruning of a game tree
+    module of script, principles_of_ai.scripts["alpha_beta"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
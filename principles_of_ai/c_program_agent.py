@@ -0,0 +1,7 @@
+"""
+Knowledge based agent, C program behavior to causes
+    module of script, principles_of_ai.scripts["c_program_agent"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
@@ -0,0 +1,7 @@
+"""
+Breadth-first search (BFS) of a graph
+    module of script, principles_of_ai.scripts["graph_bfs"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
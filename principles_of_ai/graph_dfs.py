@@ -0,0 +1,7 @@
+"""
+Depth-first search (DFS) of a graph
+    module of script, principles_of_ai.scripts["graph_dfs"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
@@ -0,0 +1,7 @@
+"""
+Hill-climbing search of an objective function
+    module of script, principles_of_ai.scripts["hill_climbing"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
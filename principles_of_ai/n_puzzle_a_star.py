@@ -0,0 +1,7 @@
+"""
+8-Puzzle (any n x n) solved by A*, IDA*, ARA*, HDA*
+    module of script, principles_of_ai.scripts["n_puzzle_a_star"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
@@ -0,0 +1,7 @@
+"""
+n-Puzzle solved by BFS, and by layered, ranked, NumPy BFS
+    module of script, principles_of_ai.scripts["n_puzzle_bfs"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
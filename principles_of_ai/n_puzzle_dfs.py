@@ -0,0 +1,7 @@
+"""
+n-Puzzle solved by DFS, recursive and iterative
+    module of script, principles_of_ai.scripts["n_puzzle_dfs"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
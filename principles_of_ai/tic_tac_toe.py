@@ -0,0 +1,7 @@
+"""
+Tic-Tac-Toe, two players, board and game loop
+    module of script, principles_of_ai.scripts["tic_tac_toe"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
@@ -0,0 +1,7 @@
+"""
+Agents and Environments, vacuum-cleaner world, two locations
+    module of script, principles_of_ai.scripts["vacuum_world"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
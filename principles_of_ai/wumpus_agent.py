@@ -0,0 +1,7 @@
+"""
+Knowledge based agent, wumpus world
+    module of script, principles_of_ai.scripts["wumpus_agent"]
+"""
+from principles_of_ai import load_script
+
+load_script(__name__)
@@ -0,0 +1,860 @@
+"""
+Search core, one set of search algorithms for every problem
+"""
+"""
+Russell Stuart J, and Peter Norvig, Artificial Intelligence: A Modern Approach,
+Pearson Education
+
+    3.1.1 Well-defined problems and solutions
+        A problem can be defined formally by five components
+            initial state, that the agent starts in
+            ACTIONS(s), set of actions that can be executed in state s
+            RESULT(s, a), state that results from doing action a in state s
+            GOAL-TEST(s), determines whether a given state is a goal state
+            path cost, sum of step costs, c(s, a, s') , step cost of taking
+                action a in state s to reach state s'
+
+    3.3.1 Infrastructure for search algorithms
+        node.STATE, the state in the state space to which the node corresponds
+        node.PARENT, the node in the search tree that generated this node
+        node.ACTION, the action that was applied to the parent to generate
+            the node
+        node.PATH-COST, the cost, traditionally denoted by g(n), of the path
+            from the initial state to the node
+
+        function CHILD-NODE(problem, parent, action) returns a node
+            return a node with
+                STATE = problem.RESULT(parent.STATE, action),
+                PARENT = parent, ACTION = action,
+                PATH-COST = parent.PATH-COST +
+                            problem.STEP-COST(parent.STATE, action)
+"""
+"""
+    Problem, base class, a problem overrides
+        actions(state), result(state, action), goal_test(state)
+        step_cost(state, action, next_state) , 1 by default
+        heuristic(state) , 0 by default, h(n) for A* and IDA*
+        successors(state) , yields (action, next_state) , by default from
+            actions and result, a problem can override it to generate
+            children directly, the one hot loop of every search
+        expand(state) , yields (action, next_state, change) , change, what
+            the action changed, None by default
+        child_heuristic(state, h_cost, next_state, change) , h of child,
+            by default heuristic(next_state) , a problem can override it
+            to update h of state for the one change an action makes,
+            called only for a child that is kept, A* , UCS and IDA*
+        solvable() , False if goal can be shown unreachable without search,
+            every search returns at once, True by default
+
+    States must be hashable (tuple, int, str), used as keys of dict and set
+
+    Search functions, all return SearchResult
+        breadth_first_search(problem)       Figure 3.11
+        depth_first_search(problem)         3.4.3 , explicit stack
+        uniform_cost_search(problem)        Figure 3.14
+        astar_search(problem)               3.5.2 , weighted A* too
+        ida_star_search(problem)            3.5.3
+    stats, SearchStats (search_stats.py), if given, every search adds its
+        nodes generated, expanded, duplicates pruned and largest frontier
+
+    Problems
+        GraphProblem, graph as dictionary of adjacency lists, as in
+            "Demonstrate the working of BFS.py" and "... DFS.py"
+        NPuzzleProblem, n-Puzzle, any n x n (or rows x width) board,
+            board tuples or packed int states, Manhattan distance heuristic
+            or heuristic plug-in, inversion parity checked before search
+        GridRouteProblem, route through allowed squares of a grid,
+            as wumpus world agent, through squares known to be safe
+
+    Used by
+        "Demonstrate the working of BFS.py" and "... DFS.py", traversals
+        "... BFS Solve the n-Puzzle problem.py", bfs_solve_n_puzzle
+        "... DFS Solve the n-Puzzle problem.py", solve_n_puzzle
+        "Solve the 8-Puzzle problem using A star Algorithm.py",
+            solve_8_puzzle , solve_puzzle_ida_star , batch solve
+        "Knowledge based agent wumpus world without entails.py", route out,
+            in its demo (quoted)
+"""
+
+import heapq
+import math
+import time
+from collections import deque
+from itertools import count
+
+
+class Problem:
+
+    def __init__(self, initial_state, goal_state=None):
+        self.initial_state = initial_state
+        self.goal_state = goal_state
+
+    def actions(self, state):
+        raise NotImplementedError
+
+    def result(self, state, action):
+        raise NotImplementedError
+
+    def goal_test(self, state):
+        return state == self.goal_state
+
+    def step_cost(self, state, action, next_state):
+        return 1
+
+    def heuristic(self, state):
+        return 0
+
+    def successors(self, state):
+        for action in self.actions(state):
+            yield action, self.result(state, action)
+
+    def expand(self, state):
+        for action, next_state in self.successors(state):
+            yield action, next_state, None
+
+    def child_heuristic(self, state, h_cost, next_state, change):
+        return self.heuristic(next_state)
+
+    def solvable(self):
+        return True
+
+
+class Node:
+
+    __slots__ = ("state", "parent", "action", "path_cost", "h_cost")
+
+    def __init__(self, state, parent=None, action=None, path_cost=0,
+                 h_cost=0):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.path_cost = path_cost
+        self.h_cost = h_cost                   # h of state, A* and IDA*
+
+    def path(self):
+        """ Return list of nodes from root (initial state) to this node """
+        node, nodes = self, []
+        while node is not None:
+            nodes.append(node)
+            node = node.parent
+        return nodes[::-1]
+
+
+class SearchResult:
+    """
+    Result of a search
+        node, goal Node, None if goal not reached
+        nodes_expanded, number of nodes expanded
+        peak_frontier, largest size of frontier during search
+        elapsed_time, seconds taken by search
+    """
+    def __init__(self, node, nodes_expanded, peak_frontier, elapsed_time):
+        self.node = node
+        self.nodes_expanded = nodes_expanded
+        self.peak_frontier = peak_frontier
+        self.elapsed_time = elapsed_time
+
+    @property
+    def solution(self):
+        """ List of actions from initial state to goal, None if no goal """
+        if self.node is None:
+            return None
+        return [node.action for node in self.node.path()[1:]]
+
+    @property
+    def states(self):
+        """ List of states from initial state to goal, None if no goal """
+        if self.node is None:
+            return None
+        return [node.state for node in self.node.path()]
+
+    @property
+    def path_cost(self):
+        return None if self.node is None else self.node.path_cost
+
+    def __repr__(self):
+        return (f"SearchResult(path_cost={self.path_cost}, " +
+                f"nodes_expanded={self.nodes_expanded}, " +
+                f"peak_frontier={self.peak_frontier}, " +
+                f"elapsed_time={self.elapsed_time:.3f})")
+
+
+class SolverResult:
+    """
+    Result of a solve, returned by solvers of the n-Puzzle scripts, printed
+        only if asked for
+        path, list of steps from start state to goal state, a step is
+            (board, move) , or (board, move, g_cost, h_cost) for A* ,
+            None if no solution
+        nodes_expanded, number of board states explored
+        peak_frontier, largest size of frontier during search, None if
+            not tracked
+        elapsed_time, seconds taken by search
+    render() , text of solution, a script subclass renders path as its
+        print of solution does, render_path()
+    """
+    def __init__(self, path, nodes_expanded, peak_frontier, elapsed_time):
+        self.path = path
+        self.nodes_expanded = nodes_expanded
+        self.peak_frontier = peak_frontier
+        self.elapsed_time = elapsed_time
+
+    @property
+    def moves(self):
+        """ Moves of blank space, start state to goal state """
+        if self.path is None:
+            return None
+        return [step[1] for step in self.path[1:]]
+
+    @property
+    def length(self):
+        """ Number of moves in solution, None if no solution """
+        return None if self.path is None else len(self.path) - 1
+
+    def render(self):
+        if self.path is None:
+            return "\n Solution could not be found\n"
+        return self.render_path()
+
+    def render_path(self):
+        return (f"\n Solution found\n\n Number of moves: {self.length}\n\n " +
+                ", ".join(self.moves) + "\n")
+
+    def __repr__(self):
+        return (f"SolverResult(length={self.length}, " +
+                f"nodes_expanded={self.nodes_expanded}, " +
+                f"peak_frontier={self.peak_frontier}, " +
+                f"elapsed_time={self.elapsed_time:.3f})")
+
+
+def add_stats(stats, generated, expanded, pruned, peak_frontier):
+    """ Add counts of a search to SearchStats stats, if given """
+    if stats is not None:
+        stats.nodes_generated += generated
+        stats.nodes_expanded += expanded
+        stats.duplicates_pruned += pruned
+        stats.frontier(peak_frontier)
+
+
+"""
+    Breadth-first search, Figure 3.11
+        frontier, FIFO queue, deque
+        reached, one dict, state: node , frontier + explored, no state is
+            added to the frontier twice
+        goal test when child is generated
+    trace, if a list is given, every expanded state is appended, in order,
+        BFS traversal of a graph
+"""
+def breadth_first_search(problem, trace=None, stats=None):
+
+    start_time = time.perf_counter()
+
+    if not problem.solvable():
+        return SearchResult(None, 0, 0, time.perf_counter() - start_time)
+
+    node = Node(problem.initial_state)
+    if problem.goal_test(node.state):
+        return SearchResult(node, 0, 1, time.perf_counter() - start_time)
+
+    frontier = deque([node])
+    reached = {node.state: node}
+    nodes_expanded, peak_frontier = 0, 1
+    nodes_generated = duplicates_pruned = 0
+    goal_node = None
+
+    while frontier and goal_node is None:
+
+        if len(frontier) > peak_frontier:
+            peak_frontier = len(frontier)
+
+        node = frontier.popleft()
+        nodes_expanded += 1
+        if trace is not None:
+            trace.append(node.state)
+
+        for action, next_state in problem.successors(node.state):
+
+            nodes_generated += 1
+
+            if next_state not in reached:
+
+                child = Node(next_state, node, action, node.path_cost +
+                             problem.step_cost(node.state, action, next_state))
+
+                if problem.goal_test(next_state):
+                    goal_node = child
+                    break
+
+                reached[next_state] = child
+                frontier.append(child)
+            else:
+                duplicates_pruned += 1
+
+    add_stats(stats, nodes_generated, nodes_expanded, duplicates_pruned,
+              peak_frontier)
+    return SearchResult(goal_node, nodes_expanded, peak_frontier,
+                        time.perf_counter() - start_time)
+
+
+"""
+    Depth-first search, graph search, explicit stack, no recursion limit
+        stack frame, (node, iterator over its successors), same order of
+            expansion as recursive DFS
+        depth_limit, if given, children deeper than depth_limit are not
+            expanded, depth-limited search, 3.4.4
+        explored, dict state: depth, a state reached again on a shorter path
+            is expanded again, only when depth_limit is given
+    trace, if a list is given, every expanded state is appended, in order,
+        DFS traversal of a graph
+"""
+def depth_first_search(problem, depth_limit=None, trace=None, stats=None):
+
+    start_time = time.perf_counter()
+
+    if not problem.solvable():
+        return SearchResult(None, 0, 0, time.perf_counter() - start_time)
+
+    node = Node(problem.initial_state)
+    nodes_expanded = 1
+    if trace is not None:
+        trace.append(node.state)
+
+    if problem.goal_test(node.state):
+        return SearchResult(node, nodes_expanded, 1,
+                            time.perf_counter() - start_time)
+
+    explored = {node.state: 0}
+    stack = [(node, iter(problem.successors(node.state)))]
+    peak_frontier = 1
+    nodes_generated = duplicates_pruned = 0
+    goal_node = None
+
+    while stack:
+
+        node, successors = stack[-1]
+        depth = len(stack)                    # depth of children of node
+
+        for action, next_state in successors:
+            nodes_generated += 1
+            if next_state not in explored:
+                break
+            if depth_limit is not None and depth < explored[next_state]:
+                break                               # reached on shorter path
+            duplicates_pruned += 1
+        else:
+            stack.pop()                                # all children done
+            continue
+
+        child = Node(next_state, node, action, node.path_cost +
+                     problem.step_cost(node.state, action, next_state))
+        nodes_expanded += 1
+        if trace is not None:
+            trace.append(next_state)
+
+        if problem.goal_test(next_state):
+            goal_node = child
+            break
+
+        explored[next_state] = depth
+
+        if depth_limit is None or depth < depth_limit:
+            stack.append((child, iter(problem.successors(next_state))))
+            if len(stack) > peak_frontier:
+                peak_frontier = len(stack)
+
+    add_stats(stats, nodes_generated, nodes_expanded, duplicates_pruned,
+              peak_frontier)
+    return SearchResult(goal_node, nodes_expanded, peak_frontier,
+                        time.perf_counter() - start_time)
+
+
+"""
+    Best-first search, priority queue on f(node), lowest f popped first
+        heap entry (f, tie_breaker, node), tie_breaker = 0, -1, -2, ...
+            equal f, most recently pushed (deeper) node first, and Node
+            objects are never compared
+        best_cost[state] , lowest path cost with which state was pushed,
+            a child with same or higher path cost is not pushed, a child with
+            lower path cost is pushed, earlier entry becomes stale
+            (lazy deletion, skipped when popped)
+        goal test when node is popped, needed for optimal path cost
+        children from problem.expand , h of a child is computed only if
+            child is pushed, problem.child_heuristic , updated from h of its
+            parent, not computed again for the whole state
+
+    f(node), evaluated once per pushed node
+        uniform_cost_search , f = g
+        astar_search , f = g + h , weighted A* , f = g + weight × h
+    stats counters, heap_pushes , heap_pops , stale_pops
+"""
+def best_first_search(problem, f, stats=None):
+
+    start_time = time.perf_counter()
+
+    if not problem.solvable():
+        return SearchResult(None, 0, 0, time.perf_counter() - start_time)
+
+    node = Node(problem.initial_state,
+                h_cost=problem.heuristic(problem.initial_state))
+    tie_breaker = count(0, -1)
+    frontier = [(f(node), next(tie_breaker), node)]
+    best_cost = {node.state: 0}
+    explored = set()
+    pushes, pops, stale_pops = 1, 0, 0
+    nodes_generated, peak_frontier = 0, 1
+    goal_node = None
+
+    while frontier:
+
+        if len(frontier) > peak_frontier:
+            peak_frontier = len(frontier)
+
+        _, _, node = heapq.heappop(frontier)
+        pops += 1
+
+        if node.state in explored or node.path_cost > best_cost[node.state]:
+            stale_pops += 1
+            continue                                 # stale entry, skipped
+
+        if problem.goal_test(node.state):
+            goal_node = node
+            break
+
+        explored.add(node.state)
+
+        for action, next_state, change in problem.expand(node.state):
+
+            nodes_generated += 1
+            path_cost = node.path_cost + problem.step_cost(node.state, action,
+                                                           next_state)
+
+            if (next_state not in explored and
+                    path_cost < best_cost.get(next_state, math.inf)):
+
+                best_cost[next_state] = path_cost
+                child = Node(next_state, node, action, path_cost,
+                             problem.child_heuristic(node.state, node.h_cost,
+                                                     next_state, change))
+                heapq.heappush(frontier, (f(child), next(tie_breaker), child))
+                pushes += 1
+
+    add_stats(stats, nodes_generated, len(explored),
+              nodes_generated - (pushes - 1) + stale_pops, peak_frontier)
+    if stats is not None:
+        stats.count("heap_pushes", pushes)
+        stats.count("heap_pops", pops)
+        stats.count("stale_pops", stale_pops)
+
+    return SearchResult(goal_node, len(explored), peak_frontier,
+                        time.perf_counter() - start_time)
+
+def uniform_cost_search(problem, stats=None):
+
+    return best_first_search(problem, lambda node: node.path_cost, stats)
+
+def astar_search(problem, weight=1, stats=None):
+
+    if weight == 1:
+        return best_first_search(
+            problem, lambda node: node.path_cost + node.h_cost, stats)
+    return best_first_search(
+        problem, lambda node: node.path_cost + weight * node.h_cost, stats)
+
+
+"""
+    IDA*, iterative deepening A*, 3.5.3
+        depth-first search, cut off when f = g + h is more than bound,
+        next bound is smallest f that was cut off
+        memory, only the current path, states on path are not repeated
+        (a move back into previous state, undo of last action, is one)
+        h of child from problem.child_heuristic , updated from h of parent
+"""
+def ida_star_search(problem, stats=None):
+
+    start_time = time.perf_counter()
+
+    if not problem.solvable():
+        return SearchResult(None, 0, 0, time.perf_counter() - start_time)
+
+    root = Node(problem.initial_state,
+                h_cost=problem.heuristic(problem.initial_state))
+    bound = root.h_cost
+    on_path = {root.state}
+    nodes_expanded = nodes_generated = duplicates_pruned = 0
+    peak_frontier = 1
+
+    def search(node, bound):
+        """ Return (goal node or None, smallest f above bound) """
+        nonlocal nodes_expanded, nodes_generated, duplicates_pruned
+        nonlocal peak_frontier
+
+        f = node.path_cost + node.h_cost
+        if f > bound:
+            return None, f
+        if problem.goal_test(node.state):
+            return node, f
+
+        nodes_expanded += 1
+        if len(on_path) > peak_frontier:
+            peak_frontier = len(on_path)
+        minimum = math.inf
+
+        for action, next_state, change in problem.expand(node.state):
+            nodes_generated += 1
+            if next_state in on_path:
+                duplicates_pruned += 1
+                continue
+
+            child = Node(next_state, node, action, node.path_cost +
+                         problem.step_cost(node.state, action, next_state),
+                         problem.child_heuristic(node.state, node.h_cost,
+                                                 next_state, change))
+
+            on_path.add(next_state)
+            found, t = search(child, bound)
+            on_path.discard(next_state)
+
+            if found is not None:
+                return found, t
+            if t < minimum:
+                minimum = t
+
+        return None, minimum
+
+    while True:
+        found, t = search(root, bound)
+        if found is not None or t == math.inf:
+            add_stats(stats, nodes_generated, nodes_expanded,
+                      duplicates_pruned, peak_frontier)
+            return SearchResult(found, nodes_expanded, peak_frontier,
+                                time.perf_counter() - start_time)
+        bound = t
+
+
+"""
+    Problems
+"""
+class GraphProblem(Problem):
+    """
+    graph, dictionary of adjacency lists, {vertex: [adjacent vertices]}
+    goal_state, None for traversal, every reachable vertex is expanded
+    """
+    def __init__(self, graph, initial_state, goal_state=None):
+        super().__init__(initial_state, goal_state)
+        self.graph = graph
+
+    def actions(self, state):
+        return self.graph[state]                  # action, go to vertex
+
+    def result(self, state, action):
+        return action
+
+    def successors(self, state):
+        for vertex in self.graph[state]:
+            yield vertex, vertex
+
+
+"""
+    n-Puzzle tables, computed once for a goal board, used by every state
+
+    distance_table[tile][idx] , Manhattan distance of tile placed at idx
+        from position of tile in goal board, 0 for blank space
+        h = sum of distance_table[board[idx]][idx] , for all idx in board
+    moves_table[blank_space_idx] , list of (move_name, numeric_tile_idx),
+        numeric tiles that can slide into blank space at blank_space_idx,
+        in the order up, down, left, right
+        divmod and 0 <= row, column checks are done once per index,
+            and not once per state
+"""
+def build_distance_table(goal_board, width=None):
+
+    size = len(goal_board)
+    width = width or math.isqrt(size)
+    goal_row_col = {tile: divmod(idx, width)
+                    for idx, tile in enumerate(goal_board)}
+
+    distance_table = [[0] * size for _ in range(size)]
+    for tile in range(1, size):
+        goal_row, goal_col = goal_row_col[tile]
+        for idx in range(size):
+            row, col = divmod(idx, width)
+            distance_table[tile][idx] = (abs(row - goal_row) +
+                                         abs(col - goal_col))
+    return distance_table
+
+def build_moves_table(width, rows=None):
+
+    rows = rows or width
+    moves_table = []
+    for idx in range(rows * width):
+        row, col = divmod(idx, width)
+        moves_table.append([
+            (move, (row + dr) * width + col + dc)
+            for move, dr, dc in (("up", -1, 0), ("down", +1, 0),
+                                 ("left", 0, -1), ("right", 0, +1))
+            if 0 <= row + dr < rows and 0 <= col + dc < width])
+    return moves_table
+
+puzzle_tables_cache = {}          # (goal board, width) : tables, built once
+
+def puzzle_tables(goal_board, width=None):
+    """
+    Return (distance_table, moves_table) of goal_board, built on first use,
+        every NPuzzleProblem of the same goal board shares them
+    """
+    key = (tuple(goal_board), width or math.isqrt(len(goal_board)))
+    if key not in puzzle_tables_cache:
+        goal_board, width = key
+        puzzle_tables_cache[key] = (
+            build_distance_table(goal_board, width),
+            build_moves_table(width, len(goal_board) // width))
+    return puzzle_tables_cache[key]
+
+
+"""
+    Solvability, inversion parity, checked before any search
+
+    Only half of the N! boards can reach a given goal board, search from
+        a board in the other half explores every reachable board
+        (181440 for 8-Puzzle) and finds nothing, IDA* never stops
+
+    Slide of a numeric tile into blank space swaps blank space and tile,
+        every move is one transposition, flips parity of the permutation
+    Every move also moves blank space by one row or column, flips parity of
+        Manhattan distance of blank space from its goal position
+    So (permutation parity + blank space distance parity) never changes,
+        board can reach goal board only if both are even or both are odd
+
+    permutation parity, from inversions, with tiles renamed by their goal
+        index, pairs i < j where goal index of tile at i > that of tile at j
+        O(N^2) for N = n × n , 120 pairs for 15-Puzzle
+
+        Same rule as, for odd n, inversions (blank space ignored) even, and
+            for even n, inversions + row of blank space counted from bottom
+"""
+def count_inversions(board, goal):
+
+    goal_index = {tile: idx for idx, tile in enumerate(goal)}
+    positions = [goal_index[tile] for tile in board]
+
+    inversions = 0
+    for i in range(len(positions) - 1):
+        for j in range(i + 1, len(positions)):
+            if positions[i] > positions[j]:
+                inversions += 1
+
+    return inversions
+
+def is_solvable(board, goal, width):
+    """
+    Return (solvable, reason), reason is a line saying why for print
+    """
+    if sorted(board) != sorted(goal):
+        return False, "board and goal board do not have the same tiles"
+
+    inversions = count_inversions(board, goal)
+
+    blank_space_row, blank_space_column = divmod(board.index(0), width)
+    goal_blank_row, goal_blank_column = divmod(goal.index(0), width)
+    blank_distance = (abs(blank_space_row - goal_blank_row) +
+                      abs(blank_space_column - goal_blank_column))
+
+    if (inversions + blank_distance) % 2 == 0:
+        return True, "inversions + blank space distance is even"
+
+    return False, (f"inversions ({inversions}) + blank space distance " +
+                   f"({blank_distance}) is odd, goal board not reachable")
+
+
+class NPuzzleProblem(Problem):
+    """
+    n-Puzzle, boards as tuples, 0 for blank space, width columns
+        action, move of blank space, "up", "down", "left", "right"
+        heuristic, Manhattan distance, from precomputed table, h of child
+            updated for the one tile that slides (expand)
+        solvable, inversion parity of initial and goal board
+
+    packed, if True states are int, 4 bits per tile (tile at index i in bits
+        4i to 4i+3) and blank space index in bits above the tiles,
+        smaller than tuples and faster to hash
+        encode(board) and decode(state) convert between board and state
+
+    heuristic, plug-in instead of Manhattan distance, function(board tuple)
+        returning h, or object with heuristic(board) and
+        update(board, h_cost, new_board, tile, from_idx, to_idx) , h of
+        new_board after tile slides from from_idx into blank space at to_idx
+        (update is used for board tuples, packed boards are decoded and
+        heuristic(board) computed in full)
+    """
+    def __init__(self, initial_board, goal_board, width=None, packed=False,
+                 heuristic=None):
+
+        size = len(goal_board)
+        self.size = size
+        self.width = width or math.isqrt(size)
+        self.packed = packed
+        self.initial_board = tuple(initial_board)
+        self.goal_board = tuple(goal_board)
+
+        self.heuristic_function = getattr(heuristic, "heuristic", heuristic)
+        self.heuristic_update = getattr(heuristic, "update", None)
+
+        self.distance_table, self.moves_table = puzzle_tables(goal_board,
+                                                              self.width)
+        # slides_table[blank_space_idx] , moves_table entries with change
+        self.slides_table = [[(move, numeric_tile_idx,
+                               (numeric_tile_idx, blank_space_idx))
+                              for move, numeric_tile_idx in moves]
+                             for blank_space_idx, moves
+                             in enumerate(self.moves_table)]
+
+        super().__init__(self.encode(initial_board), self.encode(goal_board))
+
+    def encode(self, board):
+        if not self.packed:
+            return tuple(board)
+        packed = 0
+        for idx, tile in enumerate(board):
+            packed |= tile << (4 * idx)
+        return packed | (board.index(0) << (4 * self.size))
+
+    def decode(self, state):
+        if not self.packed:
+            return state
+        return tuple((state >> (4 * idx)) & 0xF for idx in range(self.size))
+
+    def solvable(self):
+        return is_solvable(self.initial_board, self.goal_board,
+                           self.width)[0]
+
+    def actions(self, state):
+        return [move for move, _ in self.moves_table[self.blank_index(state)]]
+
+    def result(self, state, action):
+        for move, next_state in self.successors(state):
+            if move == action:
+                return next_state
+
+    def blank_index(self, state):
+        if self.packed:
+            return state >> (4 * self.size)
+        return state.index(0)
+
+    def successors(self, state):
+
+        if not self.packed:
+            blank_space_idx = state.index(0)
+            for move, numeric_tile_idx in self.moves_table[blank_space_idx]:
+                board = list(state)
+                board[blank_space_idx] = board[numeric_tile_idx]
+                board[numeric_tile_idx] = 0
+                yield move, tuple(board)
+            return
+
+        blank_shift = 4 * self.size
+        blank_space_idx = state >> blank_shift
+        board = state & ((1 << blank_shift) - 1)
+
+        for move, numeric_tile_idx in self.moves_table[blank_space_idx]:
+            tile = (board >> (4 * numeric_tile_idx)) & 0xF
+            yield move, ((board ^ (tile << (4 * numeric_tile_idx))
+                                ^ (tile << (4 * blank_space_idx)))
+                         | (numeric_tile_idx << blank_shift))
+
+    def expand(self, state):
+        """
+        Same children as successors, change of each child is
+            (numeric_tile_idx, blank_space_idx) , tile slid from
+            numeric_tile_idx into blank space at blank_space_idx
+        """
+        if not self.packed:
+            blank_space_idx = state.index(0)
+            for move, numeric_tile_idx, change in self.slides_table[
+                    blank_space_idx]:
+                board = list(state)
+                board[blank_space_idx] = board[numeric_tile_idx]
+                board[numeric_tile_idx] = 0
+                yield move, tuple(board), change
+            return
+
+        blank_shift = 4 * self.size
+        blank_space_idx = state >> blank_shift
+        board = state & ((1 << blank_shift) - 1)
+
+        for move, numeric_tile_idx, change in self.slides_table[
+                blank_space_idx]:
+            tile = (board >> (4 * numeric_tile_idx)) & 0xF
+            yield move, ((board ^ (tile << (4 * numeric_tile_idx))
+                                ^ (tile << (4 * blank_space_idx)))
+                         | (numeric_tile_idx << blank_shift)), change
+
+    def child_heuristic(self, state, h_cost, next_state, change):
+        """
+        h of child, Manhattan distance of only the moved tile changes,
+            h - distance of tile at its index + distance at blank space index
+        """
+        from_idx, to_idx = change
+        if self.packed:
+            tile = (next_state >> (4 * to_idx)) & 0xF
+        else:
+            tile = next_state[to_idx]
+
+        if self.heuristic_function is None:
+            return (h_cost - self.distance_table[tile][from_idx]
+                           + self.distance_table[tile][to_idx])
+        if self.heuristic_update is not None and not self.packed:
+            return self.heuristic_update(state, h_cost, next_state, tile,
+                                         from_idx, to_idx)
+        return self.heuristic_function(self.decode(next_state))
+
+    def heuristic(self, state):
+
+        if self.heuristic_function is not None:
+            return self.heuristic_function(self.decode(state))
+
+        distance_table = self.distance_table
+        if not self.packed:
+            return sum(distance_table[tile][idx]
+                       for idx, tile in enumerate(state))
+        return sum(distance_table[(state >> (4 * idx)) & 0xF][idx]
+                   for idx in range(self.size))
+
+    def path(self, node):
+        """
+        Return list of (board, move, g_cost, h_cost) from initial board to
+            board of node, boards decoded
+        """
+        return [(self.decode(step.state), step.action, step.path_cost,
+                 step.h_cost) for step in node.path()]
+
+
+class GridRouteProblem(Problem):
+    """
+    Route on a size x size grid, squares (row, col), one step up, down,
+        left or right, only into allowed squares
+        allowed, set of squares the route may use, as wumpus world squares
+            known to be safe, PLAN-ROUTE of Figure 7.20 (hybrid agent)
+        heuristic, Manhattan distance to goal square
+    """
+    def __init__(self, size, allowed, initial_state, goal_state):
+        super().__init__(initial_state, goal_state)
+        self.size = size
+        self.allowed = set(allowed) | {initial_state, goal_state}
+
+    def actions(self, state):
+        return [action for action, _ in self.successors(state)]
+
+    def result(self, state, action):
+        return (state[0] + action[0], state[1] + action[1])
+
+    def successors(self, state):
+        row, col = state
+        for dr, dc in ((0, -1), (0, +1), (+1, 0), (-1, 0)):
+            square = (row + dr, col + dc)
+            if (0 <= square[0] < self.size and 0 <= square[1] < self.size and
+                    square in self.allowed):
+                yield (dr, dc), square
+
+    def heuristic(self, state):
+        return (abs(state[0] - self.goal_state[0]) +
+                abs(state[1] - self.goal_state[1]))
@@ -0,0 +1,133 @@
+"""
+Search statistics, one instrumentation object for every solver
+"""
+"""
+    SearchStats, filled in by a solver when passed as stats=
+        bfs_solve_n_puzzle , BFS n-Puzzle
+        solve_with_search , other BFS n-Puzzle engines, layered BFS sets
+            counter widest_layer, disk BFS layers, largest_layer and 
+            disk_bytes, NumPy BFS layers and largest_layer
+        solve_n_puzzle , DFS n-Puzzle
+        solve_8_puzzle , A* , oracle, ARA* and HDA* modes fill fewer fields
+        alpha_beta_search , Alpha-beta pruning
+        hill_climbing , Hill-climbing
+
+    Counters
+        nodes_generated, children (neighbors) made from expanded nodes
+        nodes_expanded, nodes whose children were generated
+        duplicates_pruned, children dropped, already explored, or reached
+            with lower (or same) cost, or stale heap entries
+        max_frontier, largest size of frontier (queue, heap, stack)
+        counters, dict of solver specific counters, name : count
+            (for example alpha-beta cutoffs and pruned_children, 
+            hill-climbing moves and rejected_neighbors)
+        branching_factor, nodes_generated / nodes_expanded
+
+    Timers, phase(name), with statement, time of phase added to
+        phase_times[name] , seconds, a phase can run many times
+            with stats.phase("search"):
+                ...
+
+    Memory, peak_memory_bytes, largest memory traced by tracemalloc during
+        any phase, Python allocations, not all of process RSS
+        tracemalloc slows allocation heavy code, two to four times,
+        SearchStats(trace_memory=False) for timing runs
+
+    Export, to_dict() , to_json() , JSON text, or written to a file,
+        one record per solve, compare records between runs
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class SearchStats:
+
+    def __init__(self, solver=None, trace_memory=True):
+        self.solver = solver                    # name, for example "A*"
+        self.trace_memory = trace_memory
+        self.nodes_generated = 0
+        self.nodes_expanded = 0
+        self.duplicates_pruned = 0
+        self.max_frontier = 0
+        self.counters = {}
+        self.phase_times = {}                   # phase name : seconds
+        self.peak_memory_bytes = 0
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def frontier(self, size):
+        if size > self.max_frontier:
+            self.max_frontier = size
+
+    @property
+    def branching_factor(self):
+        if not self.nodes_expanded:
+            return 0.0
+        return self.nodes_generated / self.nodes_expanded
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time (and trace memory of) the statements in the with block
+            tracemalloc is started here if no one else started it, and
+            stopped at end
+            if tracing already runs (outer phase, or caller), its peak is
+            never reset, peak at start is kept, a peak above it was made
+            in this phase, else memory traced at end is used
+        """
+        started = False
+        peak_before = None
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                peak_before = tracemalloc.get_traced_memory()[1]
+            else:
+                tracemalloc.start()
+                started = True
+
+        start_time = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.phase_times[name] = (self.phase_times.get(name, 0.0) +
+                                      time.perf_counter() - start_time)
+            if self.trace_memory and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                if peak_before is not None and peak <= peak_before:
+                    peak = current          # peak is not of this phase
+                self.peak_memory_bytes = max(self.peak_memory_bytes, peak)
+                if started:
+                    tracemalloc.stop()
+
+    def to_dict(self):
+        return {"solver": self.solver,
+                "nodes_generated": self.nodes_generated,
+                "nodes_expanded": self.nodes_expanded,
+                "duplicates_pruned": self.duplicates_pruned,
+                "max_frontier": self.max_frontier,
+                "branching_factor": round(self.branching_factor, 4),
+                "counters": dict(self.counters),
+                "phase_times": {name: round(seconds, 6)
+                                for name, seconds in self.phase_times.items()},
+                "peak_memory_bytes": self.peak_memory_bytes}
+
+    def to_json(self, path=None, indent=2):
+        """
+        Return JSON text of to_dict() , also written to path if given
+        """
+        text = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(text + "\n")
+        return text
+
+    def __repr__(self):
+        return (f"SearchStats(solver={self.solver!r}, " +
+                f"nodes_generated={self.nodes_generated}, " +
+                f"nodes_expanded={self.nodes_expanded}, " +
+                f"duplicates_pruned={self.duplicates_pruned}, " +
+                f"max_frontier={self.max_frontier}, " +
+                f"peak_memory_bytes={self.peak_memory_bytes})")